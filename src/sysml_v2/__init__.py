@@ -2,7 +2,10 @@
 
 __version__ = "0.1.0"
 
+# Imported first so SYSML_TRACE spans can include the remaining imports.
+from sysml_v2 import tracing  # noqa: E402,F401
 from sysml_v2.api.client import SysMLClient
+from sysml_v2.api.query import Query
 from sysml_v2.parsing.loader import load, loads, find_models
 
-__all__ = ["SysMLClient", "load", "loads", "find_models", "__version__"]
+__all__ = ["SysMLClient", "Query", "load", "loads", "find_models", "__version__"]
@@ -0,0 +1,20 @@
+"""Model analysis utilities (require the ``analysis`` extra)."""
+
+from sysml_v2.analysis.rollup import PartTree, RollUp, rollup
+from sysml_v2.analysis.snapshot import export_snapshot, load_snapshot, write_snapshot
+from sysml_v2.analysis.sweep import Sweep, SweepResult, grid
+from sysml_v2.analysis.traceability import Coverage, Traceability
+
+__all__ = [
+    "Coverage",
+    "PartTree",
+    "RollUp",
+    "Sweep",
+    "SweepResult",
+    "Traceability",
+    "export_snapshot",
+    "grid",
+    "load_snapshot",
+    "rollup",
+    "write_snapshot",
+]
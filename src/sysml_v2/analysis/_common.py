@@ -0,0 +1,122 @@
+"""Helpers shared by the analysis modules: the optional NumPy import and
+lookups over flat lists of API elements.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the extra
+    np = None  # type: ignore[assignment]
+
+Element = dict[str, Any]
+
+
+def require_numpy(feature: str = "Model analysis") -> Any:
+    """Return the ``numpy`` module, or raise ``ImportError`` naming *feature*."""
+    if np is None:
+        raise ImportError(
+            f"{feature} needs NumPy. Install with: pip install sysml-v2[analysis]"
+        )
+    return np
+
+
+def ref_id(value: Any) -> str | None:
+    """Return the ``@id`` of an identity reference (or the first of a list)."""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        return value.get("@id")
+    return None
+
+
+def ref_ids(value: Any) -> list[str]:
+    """``@id``s of an identity reference or a list of them."""
+    values = value if isinstance(value, list) else [value]
+    return [v["@id"] for v in values if isinstance(v, dict) and "@id" in v]
+
+
+def element_name(element: Element) -> str | None:
+    """Declared name of *element*."""
+    return element.get("declaredName") or element.get("name")
+
+
+class ElementIndex:
+    """Lookups over a flat list of API elements."""
+
+    def __init__(self, elements: Iterable[Element]) -> None:
+        self.by_id: dict[str, Element] = {}
+        self.owned: dict[str, list[Element]] = defaultdict(list)
+        for element in elements:
+            self.by_id[element["@id"]] = element
+            owner = ref_id(element.get("owner"))
+            if owner is not None:
+                self.owned[owner].append(element)
+
+    def definition(self, element: Element) -> Element | None:
+        for key in ("partDefinition", "definition", "type"):
+            ref = ref_id(element.get(key))
+            if ref in self.by_id:
+                return self.by_id[ref]
+        return None
+
+    def parts(self, element: Element) -> list[Element]:
+        """Owned part usages of *element*, or else those of its definition."""
+        parts = [e for e in self.owned[element["@id"]] if e.get("@type") == "PartUsage"]
+        if not parts:
+            definition = self.definition(element)
+            if definition is not None and definition is not element:
+                parts = [
+                    e for e in self.owned[definition["@id"]] if e.get("@type") == "PartUsage"
+                ]
+        return parts
+
+    def literal(self, element: Element | None) -> float | None:
+        """Numeric value of a literal, or of ``value [unit]`` expressions."""
+        if element is None:
+            return None
+        value = element.get("value")
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        # ``1500 [SI::kg]`` is an operator expression whose first argument
+        # is the numeric literal.
+        for key in ("argument", "operand", "ownedFeature"):
+            ref = ref_id(element.get(key))
+            if ref is not None:
+                return self.literal(self.by_id.get(ref))
+        ref = ref_id(value)
+        return self.literal(self.by_id.get(ref)) if ref else None
+
+    def multiplicity(self, element: Element) -> float:
+        """Upper bound of the element's multiplicity, or 1 if unknown."""
+        mult = self.by_id.get(ref_id(element.get("multiplicity")) or "")
+        if mult is None:
+            return 1.0
+        bounds = mult.get("upperBound") or mult.get("bound")
+        bounds = bounds if isinstance(bounds, list) else [bounds]
+        refs = [b for b in bounds if isinstance(b, dict)]
+        value = self.literal(self.by_id.get(refs[-1]["@id"])) if refs else None
+        return value if value is not None else 1.0
+
+    def attribute(self, element: Element, name: str) -> float | None:
+        """Value of attribute *name* on *element*, falling back to its definition."""
+        for owner in (element, self.definition(element)):
+            if owner is None:
+                continue
+            for attr in self.owned[owner["@id"]]:
+                if attr.get("@type") != "AttributeUsage" or element_name(attr) != name:
+                    continue
+                for member in self.owned[attr["@id"]]:
+                    if member.get("@type") == "FeatureValue":
+                        ref = ref_id(member.get("value")) or ref_id(member.get("featureWithValue"))
+                        value = self.literal(self.by_id.get(ref or ""))
+                        if value is not None:
+                            return value
+                value = self.literal(attr)
+                if value is not None:
+                    return value
+        return None
@@ -0,0 +1,318 @@
+"""Vectorized attribute roll-ups over part decomposition trees.
+
+The part tree is flattened into index arrays (parents, multiplicities and
+CSR-style child lists) in breadth-first order, so a roll-up is one
+vectorized pass per tree level instead of a recursive walk per node.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from sysml_v2.analysis._common import Element, ElementIndex, element_name, np, require_numpy
+
+
+class PartTree:
+    """Part decomposition tree flattened into breadth-first index arrays.
+
+    Nodes are addressed by dotted path (``"vehicle.engine"``) or by index.
+    ``parent[i]`` is the parent index (-1 for roots) and ``count[i]`` the
+    node's multiplicity, e.g. 4 for ``part wheels : Wheel[4]``.  The
+    children of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``.
+
+    Usage::
+
+        tree = PartTree.from_elements(elements, root_id)
+        mass = tree.attribute_values("mass")
+        total = RollUp(tree, mass, "sum").total("testVehicle")
+    """
+
+    def __init__(
+        self,
+        paths: list[str],
+        parent: Iterable[int],
+        count: Iterable[float],
+        element_ids: list[str | None] | None = None,
+        index: ElementIndex | None = None,
+    ) -> None:
+        require_numpy("Roll-ups")
+        self.paths = paths
+        self.element_ids = element_ids or [None] * len(paths)
+        self.parent = np.asarray(list(parent), dtype=np.int64)
+        self.count = np.asarray(list(count), dtype=np.float64)
+        self._positions = {path: i for i, path in enumerate(paths)}
+        self._index = index
+        self._attributes: list[dict[str, float]] | None = None
+
+        n = len(paths)
+        has_parent = self.parent >= 0
+        if np.any(self.parent[has_parent] >= np.flatnonzero(has_parent)):
+            raise ValueError("Parents must come before their children")
+
+        # CSR child lists
+        order = np.argsort(np.where(has_parent, self.parent, n), kind="stable")
+        counts = np.bincount(self.parent[has_parent], minlength=n)
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.indptr[1:])
+        self.indices = order[: int(has_parent.sum())]
+
+        # Depth of each node, and nodes grouped by depth
+        self.depth = np.zeros(n, dtype=np.int64)
+        for _ in range(n):
+            depth = np.where(has_parent, self.depth[self.parent] + 1, 0)
+            if np.array_equal(depth, self.depth):
+                break
+            self.depth = depth
+        self.levels = [
+            np.flatnonzero(self.depth == d) for d in range(int(self.depth.max(initial=-1)) + 1)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def index(self, node: str | int) -> int:
+        """Return the index of a node given by path or index."""
+        return node if isinstance(node, (int, np.integer)) else self._positions[node]
+
+    def children(self, node: str | int) -> np.ndarray:
+        i = self.index(node)
+        return self.indices[self.indptr[i] : self.indptr[i + 1]]
+
+    def ancestors(self, node: str | int) -> list[int]:
+        """Indices of the node's ancestors, nearest first."""
+        result = []
+        i = int(self.parent[self.index(node)])
+        while i >= 0:
+            result.append(i)
+            i = int(self.parent[i])
+        return result
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[str, str | None, float]]) -> PartTree:
+        """Build a tree from ``(path, parent_path, multiplicity)`` triples.
+
+        Edges may come in any order; they are re-ordered breadth-first.
+        """
+        edges = list(edges)
+        kids: dict[str | None, list[tuple[str, float]]] = defaultdict(list)
+        for path, parent, count in edges:
+            kids[parent].append((path, count))
+        paths: list[str] = []
+        parent_idx: list[int] = []
+        counts: list[float] = []
+        queue = [(path, count, -1) for path, count in kids[None]]
+        for path, count, parent in queue:
+            position = len(paths)
+            paths.append(path)
+            parent_idx.append(parent)
+            counts.append(count)
+            queue.extend((child, c, position) for child, c in kids.get(path, []))
+        if len(paths) != len(edges):
+            raise ValueError("Edges contain nodes unreachable from a root")
+        return cls(paths, parent_idx, counts)
+
+    @classmethod
+    def from_elements(
+        cls, elements: Iterable[Element], root: str | Iterable[str]
+    ) -> PartTree:
+        """Build the tree under *root* part(s) from SysML v2 API elements.
+
+        A part's children are its owned part usages or, if it has none,
+        those of its part definition.  Multiplicities come from the upper
+        bound of each usage's multiplicity range.
+        """
+        index = ElementIndex(elements)
+        roots = [root] if isinstance(root, str) else list(root)
+        paths: list[str] = []
+        element_ids: list[str | None] = []
+        parent_idx: list[int] = []
+        counts: list[float] = []
+        queue: list[tuple[Element, str, int, float, frozenset[str]]] = []
+        for root_id in roots:
+            element = index.by_id[root_id]
+            queue.append((element, element_name(element) or root_id, -1, 1.0, frozenset()))
+        for element, path, parent, count, seen in queue:
+            position = len(paths)
+            paths.append(path)
+            element_ids.append(element["@id"])
+            parent_idx.append(parent)
+            counts.append(count)
+            # *seen* guards against definitions that (indirectly) contain themselves
+            seen = seen | {element["@id"]}
+            for child in index.parts(element):
+                if child["@id"] in seen:
+                    continue
+                queue.append(
+                    (
+                        child,
+                        f"{path}.{element_name(child) or child['@id']}",
+                        position,
+                        index.multiplicity(child),
+                        seen,
+                    )
+                )
+        return cls(paths, parent_idx, counts, element_ids, index)
+
+    @classmethod
+    def from_model(cls, model: Any) -> PartTree:
+        """Build the tree of part usages in a model parsed by ``sysml2py``.
+
+        Parts outside any other part become roots.  Attribute values with
+        units (``attribute mass = 20 [kg]``) are read as plain magnitudes;
+        multiplicities are not exposed by ``sysml2py`` and count as 1.
+        """
+        from sysml2py.usage import Attribute, Part
+
+        paths: list[str] = []
+        parent_idx: list[int] = []
+        attributes: list[dict[str, float]] = []
+
+        def visit(obj: Any, path: str | None, parent: int) -> None:
+            for child in getattr(obj, "children", None) or []:
+                if isinstance(child, Part):
+                    child_path = f"{path}.{child.name}" if path else child.name
+                    position = len(paths)
+                    paths.append(child_path)
+                    parent_idx.append(parent)
+                    attributes.append({})
+                    visit(child, child_path, position)
+                elif isinstance(child, Attribute):
+                    if parent >= 0:
+                        try:
+                            value = child.get_value()
+                        except (AttributeError, IndexError, TypeError, ValueError):
+                            continue  # no literal value
+                        attributes[parent][child.name] = float(getattr(value, "value", value))
+                else:
+                    visit(child, path, parent)
+
+        visit(model, None, -1)
+        # Depth-first order keeps parents before children; re-order breadth-first.
+        tree = cls.from_edges(
+            (path, paths[p] if p >= 0 else None, 1.0) for path, p in zip(paths, parent_idx)
+        )
+        by_path = dict(zip(paths, attributes))
+        tree._attributes = [by_path[path] for path in tree.paths]
+        return tree
+
+    def attribute_values(self, name: str) -> np.ndarray:
+        """Values of attribute *name* per node (NaN where absent).
+
+        Only available for trees built with :meth:`from_elements` or
+        :meth:`from_model`.
+        """
+        if self._attributes is not None:
+            return np.array([attrs.get(name, np.nan) for attrs in self._attributes])
+        if self._index is None:
+            raise ValueError("Tree was not built from elements or a model")
+        values = np.full(len(self), np.nan)
+        for i, element_id in enumerate(self.element_ids):
+            value = self._index.attribute(self._index.by_id[element_id], name)
+            if value is not None:
+                values[i] = value
+        return values
+
+
+# Named reductions -> NumPy ufunc names
+_REDUCTIONS = {"sum": "add", "prod": "multiply", "max": "maximum", "min": "minimum"}
+
+_IDENTITIES = {"add": 0.0, "multiply": 1.0, "maximum": -math.inf, "minimum": math.inf}
+
+
+class RollUp:
+    """Roll an attribute up a :class:`PartTree` with a binary NumPy ufunc.
+
+    Each node's total combines its own value with its children's totals.
+    For ``"sum"`` a child's total is multiplied by its multiplicity (and
+    for ``"prod"`` raised to it); ``"max"``/``"min"`` ignore multiplicity.
+    Any binary ufunc can be passed as a user-defined reduction, with an
+    explicit *identity* if it has none.  Missing (NaN) values count as the
+    identity.
+
+    *values* may also be 2-D with shape ``(nodes, variants)`` to roll up
+    many variants at once.
+    """
+
+    def __init__(
+        self,
+        tree: PartTree,
+        values: Any,
+        reduction: str | Any = "sum",
+        *,
+        identity: float | None = None,
+    ) -> None:
+        require_numpy("Roll-ups")
+        self.tree = tree
+        if isinstance(reduction, str):
+            if reduction not in _REDUCTIONS:
+                raise ValueError(f"Unknown reduction {reduction!r}")
+            reduction = getattr(np, _REDUCTIONS[reduction])
+        self.ufunc = reduction
+        if identity is None:
+            identity = _IDENTITIES.get(self.ufunc.__name__, self.ufunc.identity)
+        if identity is None:
+            raise ValueError(f"Reduction {self.ufunc.__name__} needs an explicit identity")
+        self.identity = float(identity)
+
+        own = np.array(values, dtype=np.float64)
+        if own.shape[0] != len(tree):
+            raise ValueError("Values must have one row per tree node")
+        self.own = np.where(np.isnan(own), self.identity, own)
+        self.totals = self._compute()
+
+    def _weights(self, nodes: np.ndarray) -> np.ndarray:
+        count = self.tree.count[nodes]
+        return count[:, None] if self.own.ndim == 2 else count
+
+    def _contribution(self, nodes: np.ndarray, totals: np.ndarray) -> np.ndarray:
+        if self.ufunc is np.add:
+            return totals * self._weights(nodes)
+        if self.ufunc is np.multiply:
+            return totals ** self._weights(nodes)
+        return totals
+
+    def _compute(self) -> np.ndarray:
+        totals = self.own.copy()
+        # Deepest level first; each level is folded into its parents at once.
+        for level in reversed(self.tree.levels[1:]):
+            contrib = self._contribution(level, totals[level])
+            self.ufunc.at(totals, self.tree.parent[level], contrib)
+        return totals
+
+    def total(self, node: str | int) -> Any:
+        """Rolled-up value at *node*."""
+        return self.totals[self.tree.index(node)]
+
+    def _recompute(self, i: int) -> Any:
+        kids = self.tree.children(i)
+        value = self.own[i]
+        if len(kids):
+            contrib = self._contribution(kids, self.totals[kids])
+            value = self.ufunc(value, self.ufunc.reduce(contrib, axis=0))
+        return value
+
+    def update(self, node: str | int, value: Any) -> list[int]:
+        """Set a node's own value and refresh only the affected ancestors.
+
+        Returns the indices whose totals changed, nearest first.  Propagation
+        stops early at the first ancestor whose total is unchanged.
+        """
+        i = self.tree.index(node)
+        new = np.asarray(value, dtype=np.float64)
+        self.own[i] = np.where(np.isnan(new), self.identity, new)
+        changed = []
+        for j in [i, *self.tree.ancestors(i)]:
+            total = self._recompute(j)
+            if np.array_equal(total, self.totals[j]):
+                break
+            self.totals[j] = total
+            changed.append(j)
+        return changed
+
+
+def rollup(tree: PartTree, values: Any, reduction: str | Any = "sum") -> np.ndarray:
+    """Return rolled-up totals for every node of *tree*."""
+    return RollUp(tree, values, reduction).totals
@@ -0,0 +1,314 @@
+"""Columnar, memory-mapped snapshots of commit elements.
+
+A snapshot is a directory holding ``manifest.json`` plus the element
+columns, either as an Arrow IPC file (when ``pyarrow`` is installed) or as
+a set of NumPy ``.npy`` files with string tables.  Both are opened with
+memory maps, so loading is near-instant and only the columns a query
+actually reads are paged in from disk.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import uuid
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from sysml_v2.analysis._common import require_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from sysml_v2.api.client import SysMLClient
+
+MANIFEST = "manifest.json"
+_VERSION = 1
+
+# Columns extracted from each element; "json" holds the full element.
+COLUMNS = ("@id", "@type", "name", "qualifiedName", "owner", "json")
+
+
+def _have_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _file_stem(column: str) -> str:
+    return column.lstrip("@")
+
+
+def _cell(element: dict[str, Any], column: str) -> str | None:
+    if column == "json":
+        return json.dumps(element, separators=(",", ":"))
+    value = element.get(column)
+    if isinstance(value, dict):
+        value = value.get("@id")
+    return None if value is None else str(value)
+
+
+class StringColumn:
+    """Dictionary-encoded string column over memory-mapped NumPy arrays.
+
+    ``codes[i]`` indexes the string table (``-1`` for missing values); the
+    table is a UTF-8 blob sliced by ``offsets``.
+    """
+
+    def __init__(self, codes: np.ndarray, offsets: np.ndarray, data: mmap.mmap | bytes) -> None:
+        self.codes = codes
+        self.offsets = offsets
+        self._data = data
+        self._lookup: dict[str, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def string(self, code: int) -> str:
+        """Decode entry *code* of the string table."""
+        start, end = int(self.offsets[code]), int(self.offsets[code + 1])
+        return self._data[start:end].decode("utf-8")
+
+    def __getitem__(self, row: int) -> str | None:
+        code = int(self.codes[row])
+        return None if code < 0 else self.string(code)
+
+    def code(self, value: str) -> int:
+        """Return the table code for *value*, or -1 if it never occurs."""
+        if self._lookup is None:
+            self._lookup = {self.string(i): i for i in range(len(self.offsets) - 1)}
+        return self._lookup.get(value, -1)
+
+    def to_list(self) -> list[str | None]:
+        table = [self.string(i) for i in range(len(self.offsets) - 1)]
+        return [None if c < 0 else table[c] for c in self.codes.tolist()]
+
+
+class Snapshot:
+    """A loaded snapshot; columns are opened lazily on first access.
+
+    Usage::
+
+        snap = load_snapshot("snapshots/c1")
+        rows = snap.rows_where("@type", "PartUsage")
+        names = [snap.value("name", r) for r in rows]
+    """
+
+    def __init__(self, path: Path, manifest: dict[str, Any]) -> None:
+        self.path = path
+        self.manifest = manifest
+        self.format: str = manifest["format"]
+        self.columns: list[str] = manifest["columns"]
+        self.project_id: str | None = manifest.get("project_id")
+        self.commit_id: str | None = manifest.get("commit_id")
+        self._columns: dict[str, Any] = {}
+        self._table = None
+        self._maps: list[mmap.mmap] = []
+
+    def __len__(self) -> int:
+        return self.manifest["rows"]
+
+    def column(self, name: str) -> Any:
+        """Return a column: a ``pyarrow.ChunkedArray`` or a :class:`StringColumn`."""
+        if name not in self.columns:
+            raise KeyError(name)
+        if name not in self._columns:
+            self._columns[name] = self._open_column(name)
+        return self._columns[name]
+
+    def _open_column(self, name: str) -> Any:
+        if self.format == "arrow":
+            if self._table is None:
+                import pyarrow as pa
+
+                source = pa.memory_map(str(self.path / "elements.arrow"), "r")
+                self._table = pa.ipc.open_file(source).read_all()
+            return self._table.column(name)
+
+        np = require_numpy("Snapshots")
+        stem = self.path / _file_stem(name)
+        codes = np.load(f"{stem}.codes.npy", mmap_mode="r")
+        offsets = np.load(f"{stem}.offsets.npy", mmap_mode="r")
+        with open(f"{stem}.strings.bin", "rb") as f:
+            try:
+                data: mmap.mmap | bytes = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps.append(data)
+            except ValueError:
+                data = b""  # empty string table
+        return StringColumn(codes, offsets, data)
+
+    def value(self, column: str, row: int) -> str | None:
+        """Return the value of *column* at *row*."""
+        col = self.column(column)
+        if self.format == "arrow":
+            return col[row].as_py()
+        return col[row]
+
+    def element(self, row: int) -> dict[str, Any]:
+        """Decode the full element JSON at *row*."""
+        return json.loads(self.value("json", row))
+
+    def rows_where(self, column: str, value: str) -> np.ndarray:
+        """Return the row indices where *column* equals *value*."""
+        np = require_numpy("Snapshots")
+        col = self.column(column)
+        if self.format == "arrow":
+            import pyarrow.compute as pc
+
+            mask = pc.fill_null(pc.equal(col, value), False)
+            return np.flatnonzero(mask.to_numpy(zero_copy_only=False))
+        code = col.code(value)
+        if code < 0:
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero(col.codes == code)
+
+    def close(self) -> None:
+        """Release memory maps held by opened columns."""
+        self._columns.clear()
+        self._table = None
+        for m in self._maps:
+            m.close()
+        self._maps.clear()
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _write_arrow(path: Path, elements: list[dict[str, Any]]) -> None:
+    import pyarrow as pa
+
+    arrays = {}
+    for column in COLUMNS:
+        values = pa.array([_cell(el, column) for el in elements], type=pa.string())
+        # Dictionary-encode repetitive columns; ids and JSON are unique.
+        arrays[column] = values if column in ("@id", "json") else values.dictionary_encode()
+    table = pa.table(arrays)
+    with pa.OSFile(str(path / "elements.arrow"), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _write_numpy(path: Path, elements: list[dict[str, Any]]) -> None:
+    np = require_numpy("Snapshots")
+    for column in COLUMNS:
+        table: dict[str, int] = {}
+        codes = np.empty(len(elements), dtype=np.int32)
+        for row, element in enumerate(elements):
+            value = _cell(element, column)
+            codes[row] = -1 if value is None else table.setdefault(value, len(table))
+        encoded = [s.encode("utf-8") for s in table]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        stem = path / _file_stem(column)
+        np.save(f"{stem}.codes.npy", codes)
+        np.save(f"{stem}.offsets.npy", offsets)
+        with open(f"{stem}.strings.bin", "wb") as f:
+            for b in encoded:
+                f.write(b)
+
+
+def write_snapshot(
+    elements: Iterable[dict[str, Any]],
+    path: str | Path,
+    *,
+    project_id: str | None = None,
+    commit_id: str | None = None,
+    format: str = "auto",
+) -> Path:
+    """Write *elements* as a snapshot directory at *path*.
+
+    *format* is ``"arrow"``, ``"numpy"`` or ``"auto"`` (Arrow when pyarrow
+    is installed, NumPy otherwise).  The snapshot is written to a temporary
+    sibling directory and renamed into place, replacing any snapshot already
+    at *path*.  Raises ``FileExistsError`` if *path* is a file or a
+    non-empty directory that is not a snapshot.
+    """
+    if format == "auto":
+        format = "arrow" if _have_pyarrow() else "numpy"
+    if format not in ("arrow", "numpy"):
+        raise ValueError(f"Unknown snapshot format {format!r}")
+
+    elements = list(elements)
+    path = Path(path)
+    if path.exists() and not path.is_dir():
+        raise FileExistsError(f"{path} exists and is not a directory")
+    if path.is_dir() and any(path.iterdir()) and not (path / MANIFEST).is_file():
+        raise FileExistsError(f"{path} exists and is not a snapshot directory")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+    tmp.mkdir()
+    trash = None
+    try:
+        if format == "arrow":
+            _write_arrow(tmp, elements)
+        else:
+            _write_numpy(tmp, elements)
+        manifest = {
+            "version": _VERSION,
+            "format": format,
+            "rows": len(elements),
+            "columns": list(COLUMNS),
+            "project_id": project_id,
+            "commit_id": commit_id,
+        }
+        (tmp / MANIFEST).write_text(json.dumps(manifest, indent=2) + "\n")
+
+        # A directory cannot be replaced in one rename, so the old snapshot
+        # is moved aside first; readers never see a mix of old and new files.
+        if path.exists():
+            trash = Path(tempfile.mkdtemp(prefix=f".{path.name}.old.", dir=path.parent))
+            os.replace(path, trash / path.name)
+        os.replace(tmp, path)
+    except BaseException:
+        if trash is not None and not path.exists():
+            os.replace(trash / path.name, path)
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    finally:
+        if trash is not None:
+            shutil.rmtree(trash, ignore_errors=True)
+    return path
+
+
+def export_snapshot(
+    project_id: str,
+    commit_id: str,
+    path: str | Path,
+    *,
+    client: SysMLClient | None = None,
+    format: str = "auto",
+) -> Path:
+    """Fetch a commit's elements and write them as a snapshot at *path*.
+
+    *client* may be any object with ``get_elements`` (e.g. a
+    ``MirrorClient``); by default a :class:`SysMLClient` is created from
+    ``sysml.toml``.
+    """
+    if client is None:
+        from sysml_v2.api.client import SysMLClient
+
+        with SysMLClient() as own_client:
+            elements = own_client.get_elements(project_id, commit_id)
+    else:
+        elements = client.get_elements(project_id, commit_id)
+    return write_snapshot(
+        elements, path, project_id=project_id, commit_id=commit_id, format=format
+    )
+
+
+def load_snapshot(path: str | Path) -> Snapshot:
+    """Open a snapshot directory without reading any column data yet."""
+    path = Path(path)
+    manifest = json.loads((path / MANIFEST).read_text())
+    if manifest.get("version") != _VERSION:
+        raise ValueError(f"Unsupported snapshot version in {path}")
+    return Snapshot(path, manifest)
@@ -0,0 +1,460 @@
+"""Batched design-space sweeps over attribute variants.
+
+A sweep varies attribute values of parts (and free parameters) across
+many variants of the same :class:`PartTree`, rolls the attributes up and
+evaluates derived values and constraints as NumPy arrays over all
+variants at once.  Only the nodes whose totals can change (the varied
+parts and their ancestors) are recomputed per variant; every other total
+is computed once.
+"""
+
+from __future__ import annotations
+
+import ast
+import math
+import os
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from sysml_v2.analysis._common import np, require_numpy
+from sysml_v2.analysis.rollup import PartTree, RollUp
+
+# Upper bound on variant-matrix cells (nodes x variants) evaluated at once.
+_CELL_BUDGET = 1 << 22
+
+_FUNCTIONS: dict[str, Callable[..., Any]] = {}
+_CONSTANTS = {"pi": math.pi}
+
+if np is not None:
+    _FUNCTIONS = {
+        "abs": np.abs,
+        "sqrt": np.sqrt,
+        "exp": np.exp,
+        "log": np.log,
+        "log10": np.log10,
+        "sin": np.sin,
+        "cos": np.cos,
+        "tan": np.tan,
+        "floor": np.floor,
+        "ceil": np.ceil,
+        "min": lambda *args: np.minimum.reduce(np.broadcast_arrays(*args)),
+        "max": lambda *args: np.maximum.reduce(np.broadcast_arrays(*args)),
+        "where": np.where,
+    }
+
+    _BINARY = {
+        ast.Add: np.add,
+        ast.Sub: np.subtract,
+        ast.Mult: np.multiply,
+        ast.Div: np.true_divide,
+        ast.FloorDiv: np.floor_divide,
+        ast.Mod: np.mod,
+        ast.Pow: np.power,
+    }
+    _COMPARE = {
+        ast.Eq: np.equal,
+        ast.NotEq: np.not_equal,
+        ast.Lt: np.less,
+        ast.LtE: np.less_equal,
+        ast.Gt: np.greater,
+        ast.GtE: np.greater_equal,
+    }
+
+Resolver = Callable[[str], Any]
+Compiled = Callable[[Resolver], Any]
+
+
+def _dotted(node: ast.expr) -> str | None:
+    """Return ``a.b.c`` for a chain of attribute accesses on a name."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted(node.value)
+        return f"{base}.{node.attr}" if base else None
+    return None
+
+
+def _compile_node(node: ast.expr, expr: str) -> Compiled:
+    name = _dotted(node)
+    if name is not None:
+        if name in _CONSTANTS:
+            value = _CONSTANTS[name]
+            return lambda resolve: value
+        return lambda resolve: resolve(name)
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        value = node.value
+        return lambda resolve: value
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY:
+        op = _BINARY[type(node.op)]
+        left, right = _compile_node(node.left, expr), _compile_node(node.right, expr)
+        return lambda resolve: op(left(resolve), right(resolve))
+
+    if isinstance(node, ast.UnaryOp):
+        operand = _compile_node(node.operand, expr)
+        if isinstance(node.op, ast.USub):
+            return lambda resolve: np.negative(operand(resolve))
+        if isinstance(node.op, ast.UAdd):
+            return operand
+        if isinstance(node.op, ast.Not):
+            return lambda resolve: np.logical_not(operand(resolve))
+
+    if isinstance(node, ast.BoolOp):
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        values = [_compile_node(v, expr) for v in node.values]
+        return lambda resolve: combine.reduce(
+            np.broadcast_arrays(*(v(resolve) for v in values))
+        )
+
+    if isinstance(node, ast.Compare) and all(type(op) in _COMPARE for op in node.ops):
+        # ``a < b <= c`` means ``a < b and b <= c``
+        operands = [_compile_node(n, expr) for n in (node.left, *node.comparators)]
+        ops = [_COMPARE[type(op)] for op in node.ops]
+
+        def compare(resolve: Resolver) -> Any:
+            values = [operand(resolve) for operand in operands]
+            result = ops[0](values[0], values[1])
+            for i, op in enumerate(ops[1:], start=1):
+                result = np.logical_and(result, op(values[i], values[i + 1]))
+            return result
+
+        return compare
+
+    if isinstance(node, ast.IfExp):
+        test = _compile_node(node.test, expr)
+        body, orelse = _compile_node(node.body, expr), _compile_node(node.orelse, expr)
+        return lambda resolve: np.where(test(resolve), body(resolve), orelse(resolve))
+
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _FUNCTIONS
+        and not node.keywords
+    ):
+        func = _FUNCTIONS[node.func.id]
+        args = [_compile_node(a, expr) for a in node.args]
+        return lambda resolve: func(*(a(resolve) for a in args))
+
+    raise ValueError(f"Unsupported syntax in expression {expr!r}: {ast.dump(node)}")
+
+
+def compile_expression(expr: str) -> Compiled:
+    """Compile an arithmetic/boolean expression into a vectorized function.
+
+    Names (including dotted part paths such as ``vehicle.engine.mass``) are
+    looked up through the resolver passed to the compiled function.  Only
+    arithmetic, comparisons, ``and``/``or``/``not``, conditional
+    expressions and a fixed set of math functions are allowed.
+    """
+    require_numpy("Sweeps")
+    try:
+        tree = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError as exc:
+        raise ValueError(f"Invalid expression {expr!r}: {exc.msg}") from None
+    return _compile_node(tree.body, expr)
+
+
+def grid(axes: Mapping[str, Any]) -> dict[str, np.ndarray]:
+    """Cartesian product of parameter *axes* as flat, equal-length columns.
+
+    Usage::
+
+        grid({"vehicle.engine.mass": [150, 200, 250], "gears": range(4, 9)})
+    """
+    require_numpy("Sweeps")
+    names = list(axes)
+    values = [np.asarray(list(axes[name]), dtype=np.float64) for name in names]
+    mesh = np.meshgrid(*values, indexing="ij")
+    return {name: m.ravel() for name, m in zip(names, mesh)}
+
+
+@dataclass
+class _Plan:
+    """Recomputation plan for one attribute: the varied nodes plus ancestors."""
+
+    tree: PartTree  # sub-tree over the affected nodes
+    own: np.ndarray  # base own values of affected nodes
+    rest: np.ndarray  # reduced contributions of unaffected children
+    reduction: Any
+    identity: float
+    targets: dict[str, int]  # parameter -> affected-node position
+
+
+@dataclass
+class _Program:
+    """Everything a worker needs to evaluate a chunk of variants."""
+
+    plans: dict[str, _Plan]
+    names: dict[str, tuple]  # name -> ("param", key) | ("total", attr, pos) | ("const", value)
+    derived: list[tuple[str, str]]
+    constraints: list[tuple[str, str]]
+    outputs: list[str]
+
+
+_compiled: dict[str, Compiled] = {}
+
+
+def _compiled_expression(expr: str) -> Compiled:
+    if expr not in _compiled:
+        _compiled[expr] = compile_expression(expr)
+    return _compiled[expr]
+
+
+def _evaluate(program: _Program, params: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    k = len(next(iter(params.values())))
+
+    totals: dict[str, np.ndarray] = {}
+    for attr, plan in program.plans.items():
+        own = np.repeat(plan.own[:, None], k, axis=1)
+        for key, pos in plan.targets.items():
+            own[pos] = np.where(np.isnan(params[key]), plan.identity, params[key])
+        own = plan.reduction(own, plan.rest[:, None])
+        totals[attr] = RollUp(plan.tree, own, plan.reduction, identity=plan.identity).totals
+
+    values: dict[str, Any] = {}
+
+    def resolve(name: str) -> Any:
+        if name in values:
+            return values[name]
+        try:
+            source = program.names[name]
+        except KeyError:
+            raise ValueError(f"Unknown name {name!r} in sweep expression") from None
+        if source[0] == "param":
+            return params[source[1]]
+        if source[0] == "total":
+            return totals[source[1]][source[2]]
+        return source[1]
+
+    columns: dict[str, np.ndarray] = dict(params)
+    for name in program.outputs:
+        columns[name] = np.broadcast_to(resolve(name), (k,)).copy()
+    for name, expr in program.derived:
+        values[name] = _compiled_expression(expr)(resolve)
+        columns[name] = np.broadcast_to(values[name], (k,)).astype(np.float64)
+    for name, expr in program.constraints:
+        columns[name] = np.broadcast_to(_compiled_expression(expr)(resolve), (k,)).astype(bool)
+    return columns
+
+
+_worker_program: _Program | None = None
+
+
+def _init_worker(program: _Program) -> None:
+    global _worker_program
+    _worker_program = program
+
+
+def _evaluate_chunk(params: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    assert _worker_program is not None
+    return _evaluate(_worker_program, params)
+
+
+class SweepResult:
+    """Columns of a sweep, one row per variant, with a feasibility mask.
+
+    ``columns`` holds the parameters, rolled-up root totals, derived values
+    and one boolean column per constraint; ``feasible`` is True for the
+    variants that satisfy every constraint.
+    """
+
+    def __init__(
+        self, columns: dict[str, np.ndarray], constraints: list[str]
+    ) -> None:
+        self.columns = columns
+        self.constraints = constraints
+        n = len(next(iter(columns.values()))) if columns else 0
+        self.feasible = np.ones(n, dtype=bool)
+        for name in constraints:
+            self.feasible &= columns[name]
+
+    def __len__(self) -> int:
+        return len(self.feasible)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+
+    def rows(self, *, feasible_only: bool = False) -> Iterator[dict[str, Any]]:
+        """Yield variants as dicts of plain Python values."""
+        indices = np.flatnonzero(self.feasible) if feasible_only else range(len(self))
+        for i in indices:
+            row = {name: column[i].item() for name, column in self.columns.items()}
+            row["feasible"] = bool(self.feasible[i])
+            yield row
+
+    def best(self, column: str, *, maximize: bool = False) -> int | None:
+        """Index of the feasible variant minimizing (or maximizing) *column*."""
+        candidates = np.flatnonzero(self.feasible)
+        if not len(candidates):
+            return None
+        values = self.columns[column][candidates]
+        return int(candidates[np.argmax(values) if maximize else np.argmin(values)])
+
+
+class Sweep:
+    """Evaluate derived attributes and constraints over many variants.
+
+    *rollups* maps attribute names to reductions (see :class:`RollUp`);
+    base values come from *values* or else from the tree's attributes.
+    A parameter named ``<part path>.<attribute>`` replaces that part's own
+    value of a rolled-up attribute; other parameters are free variables.
+    Expressions refer to rolled-up totals as ``<part path>.<attribute>``,
+    to free parameters by name and to earlier derived values.
+
+    Usage::
+
+        tree = PartTree.from_elements(elements, vehicle_id)
+        sweep = Sweep(tree, {"mass": "sum"})
+        sweep.derive("accel", "thrust / testVehicle.mass")
+        sweep.constrain("testVehicle.mass <= 1400", name="mass_limit")
+        result = sweep.run(grid({"testVehicle.engine.mass": [150, 200, 250],
+                                 "thrust": [4000, 5000]}))
+        result.rows(feasible_only=True)
+    """
+
+    def __init__(
+        self,
+        tree: PartTree,
+        rollups: Mapping[str, str | Any],
+        *,
+        values: Mapping[str, Any] | None = None,
+    ) -> None:
+        require_numpy("Sweeps")
+        self.tree = tree
+        values = values or {}
+        self._base = {
+            attr: RollUp(
+                tree,
+                values[attr] if attr in values else tree.attribute_values(attr),
+                reduction,
+            )
+            for attr, reduction in rollups.items()
+        }
+        self._derived: list[tuple[str, str]] = []
+        self._constraints: list[tuple[str, str]] = []
+
+    def derive(self, name: str, expr: str) -> Sweep:
+        """Add a derived value column computed from *expr*."""
+        compile_expression(expr)  # reject bad syntax early
+        self._derived.append((name, expr))
+        return self
+
+    def constrain(self, expr: str, *, name: str | None = None) -> Sweep:
+        """Add a boolean constraint; infeasible variants are masked out."""
+        compile_expression(expr)
+        self._constraints.append((name or expr, expr))
+        return self
+
+    def _target(self, key: str) -> tuple[str, int] | None:
+        """Map a parameter ``<part path>.<attribute>`` to a tree node."""
+        path, _, attr = key.rpartition(".")
+        if attr not in self._base or not path:
+            return None
+        try:
+            return attr, self.tree.index(path)
+        except KeyError:
+            raise ValueError(f"Parameter {key!r} names no part in the tree") from None
+
+    def _plan(self, attr: str, targets: dict[str, int]) -> _Plan:
+        base = self._base[attr]
+        affected: set[int] = set()
+        for node in targets.values():
+            affected.add(node)
+            affected.update(self.tree.ancestors(node))
+        order = np.array(sorted(affected), dtype=np.int64)
+        position = {int(node): i for i, node in enumerate(order)}
+
+        rest = np.full(len(order), base.identity)
+        for i, node in enumerate(order):
+            kids = [k for k in self.tree.children(node).tolist() if k not in affected]
+            if kids:
+                kids_arr = np.array(kids, dtype=np.int64)
+                contrib = base._contribution(kids_arr, base.totals[kids_arr])
+                rest[i] = base.ufunc.reduce(contrib)
+
+        parent = [position[int(p)] if p >= 0 else -1 for p in self.tree.parent[order]]
+        sub = PartTree([self.tree.paths[n] for n in order], parent, self.tree.count[order])
+        return _Plan(
+            tree=sub,
+            own=base.own[order],
+            rest=rest,
+            reduction=base.ufunc,
+            identity=base.identity,
+            targets={key: position[node] for key, node in targets.items()},
+        )
+
+    def _program(self, keys: list[str]) -> _Program:
+        targets: dict[str, dict[str, int]] = {attr: {} for attr in self._base}
+        names: dict[str, tuple] = {}
+        for key in keys:
+            target = self._target(key)
+            if target is not None:
+                targets[target[0]][key] = target[1]
+            names[key] = ("param", key)
+        plans = {attr: self._plan(attr, t) for attr, t in targets.items() if t}
+
+        # Totals of every node: varied ones from the plan, the rest constant.
+        for attr, base in self._base.items():
+            plan = plans.get(attr)
+            varied = {path: i for i, path in enumerate(plan.tree.paths)} if plan else {}
+            for i, path in enumerate(self.tree.paths):
+                name = f"{path}.{attr}"
+                if path in varied:
+                    names[name] = ("total", attr, varied[path])
+                elif name not in names:
+                    names[name] = ("const", float(base.totals[i]))
+
+        roots = [self.tree.paths[int(i)] for i in self.tree.levels[0]] if len(self.tree) else []
+        outputs = [
+            name
+            for name in (f"{root}.{attr}" for attr in self._base for root in roots)
+            if name not in keys
+        ]
+        return _Program(plans, names, self._derived, self._constraints, outputs)
+
+    def run(
+        self,
+        samples: Mapping[str, Any],
+        *,
+        workers: int = 1,
+        chunk_size: int | None = None,
+    ) -> SweepResult:
+        """Evaluate every variant in *samples* (equal-length parameter columns).
+
+        *samples* is typically :func:`grid` output or a sample set such as a
+        Latin hypercube.  Variants are evaluated in chunks of *chunk_size*;
+        with ``workers > 1`` the chunks are spread over a process pool.
+        """
+        params = {key: np.asarray(column, dtype=np.float64) for key, column in samples.items()}
+        lengths = {len(column) for column in params.values()}
+        if not lengths:
+            raise ValueError("A sweep needs at least one parameter")
+        if len(lengths) > 1:
+            raise ValueError("Sample columns must all have the same length")
+        n = lengths.pop()
+        program = self._program(list(params))
+
+        if chunk_size is None:
+            width = max((len(p.tree) for p in program.plans.values()), default=1)
+            chunk_size = max(1, _CELL_BUDGET // width)
+        # An empty sample set still gets one (empty) chunk, and empty columns.
+        chunks = [
+            {key: column[start : start + chunk_size] for key, column in params.items()}
+            for start in range(0, max(n, 1), chunk_size)
+        ]
+
+        if workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(chunks), os.cpu_count() or 1),
+                initializer=_init_worker,
+                initargs=(program,),
+            ) as pool:
+                parts = list(pool.map(_evaluate_chunk, chunks))
+        else:
+            parts = [_evaluate(program, chunk) for chunk in chunks]
+
+        columns = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+        return SweepResult(columns, [name for name, _ in self._constraints])
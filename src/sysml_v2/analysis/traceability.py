@@ -0,0 +1,374 @@
+"""Sparse traceability matrices over satisfy, verify, derive and refine links.
+
+Each relationship kind is a boolean adjacency matrix over all traced
+elements (rows are link sources, columns targets) in CSR form: a SciPy
+``csr_matrix`` when SciPy is installed, otherwise a :class:`CSRMatrix` of
+plain NumPy arrays.  Coverage is computed from row/column counts and
+sparse matrix-vector products, and transitive closure by repeated boolean
+squaring, so reports scale with the number of links rather than with
+nested loops over requirements.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+from sysml_v2.analysis._common import ElementIndex, element_name, np, ref_ids, require_numpy
+
+try:
+    import scipy.sparse as sparse
+except ImportError:
+    sparse = None
+
+KINDS = ("satisfy", "verify", "derive", "refine")
+
+REQUIREMENT_TYPES = frozenset(
+    {"RequirementUsage", "RequirementDefinition", "ConcernUsage", "ConcernDefinition"}
+)
+PART_TYPES = frozenset({"PartUsage"})
+
+# Rows per block when exporting, to bound memory
+_EXPORT_ROWS = 65536
+
+
+@dataclass(frozen=True)
+class CSRMatrix:
+    """Boolean CSR matrix used when SciPy is not installed.
+
+    Has the ``indptr``/``indices``/``shape``/``nnz`` attributes of
+    ``scipy.sparse.csr_matrix``.
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    shape: tuple[int, int]
+
+    @property
+    def nnz(self) -> int:
+        return len(self.indices)
+
+    def toarray(self) -> np.ndarray:
+        dense = np.zeros(self.shape, dtype=bool)
+        dense[_rows(self), self.indices] = True
+        return dense
+
+
+@dataclass(frozen=True)
+class Coverage:
+    requirements: int
+    satisfied: int
+    verified: int
+    unsatisfied: list[str]
+    unverified: list[str]
+    orphan_parts: list[str]
+
+    @property
+    def satisfied_ratio(self) -> float:
+        return self.satisfied / self.requirements if self.requirements else 1.0
+
+    @property
+    def verified_ratio(self) -> float:
+        return self.verified / self.requirements if self.requirements else 1.0
+
+
+def _rows(m: Any) -> np.ndarray:
+    """Row index of each stored entry of a CSR matrix."""
+    return np.repeat(np.arange(m.shape[0], dtype=np.int64), np.diff(m.indptr))
+
+
+def _keys(m: Any) -> np.ndarray:
+    """Sorted ``row * ncols + col`` keys of a CSR matrix's entries."""
+    keys = _rows(m) * m.shape[1] + np.asarray(m.indices, dtype=np.int64)
+    return np.unique(keys)
+
+
+def _from_keys(keys: np.ndarray, shape: tuple[int, int]) -> Any:
+    """Boolean CSR matrix with entries at sorted, unique *keys*."""
+    rows, cols = np.divmod(keys, shape[1])
+    indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+    if sparse is not None:
+        data = np.ones(len(keys), dtype=np.int32)
+        return sparse.csr_matrix((data, cols, indptr), shape=shape)
+    return CSRMatrix(indptr, cols, shape)
+
+
+def _union(a: Any, b: Any) -> Any:
+    return _from_keys(np.union1d(_keys(a), _keys(b)), a.shape)
+
+
+def _matmul(a: Any, b: Any) -> Any:
+    """Boolean product of two CSR matrices."""
+    if sparse is not None:
+        return _from_keys(_keys((a @ b).tocsr()), (a.shape[0], b.shape[1]))
+    # Join each entry (i, k) of a with row k of b.
+    a_rows = _rows(a)
+    starts = b.indptr[a.indices]
+    lengths = b.indptr[a.indices + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return _from_keys(np.empty(0, dtype=np.int64), (a.shape[0], b.shape[1]))
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    cols = b.indices[offsets + np.arange(total)]
+    keys = np.repeat(a_rows, lengths) * b.shape[1] + cols
+    return _from_keys(np.unique(keys), (a.shape[0], b.shape[1]))
+
+
+def _matvec(m: Any, x: np.ndarray) -> np.ndarray:
+    """Sum of ``x[j]`` over the stored entries ``(i, j)`` of each row *i*."""
+    if sparse is not None:
+        return m @ x
+    return np.bincount(_rows(m), weights=x[m.indices], minlength=m.shape[0])
+
+
+class Traceability:
+    """Traceability links between model elements as sparse matrices.
+
+    *links* maps each kind (``"satisfy"``, ``"verify"``, ``"derive"``,
+    ``"refine"``) to ``(source_id, target_id)`` pairs: the satisfying part
+    or verification case and the requirement, the original and the derived
+    requirement, or the refining and the refined element.
+
+    Usage::
+
+        trace = Traceability.from_elements(client.get_elements(project_id, commit_id))
+        report = trace.coverage()
+        report.unsatisfied                    # requirement IDs
+        trace.export("satisfy", "satisfy.mtx")
+    """
+
+    def __init__(
+        self,
+        links: Mapping[str, Iterable[tuple[str, str]]],
+        *,
+        requirements: Iterable[str] = (),
+        parts: Iterable[str] = (),
+    ) -> None:
+        require_numpy("Traceability matrices")
+        unknown = set(links) - set(KINDS)
+        if unknown:
+            raise ValueError(f"Unknown link kinds: {', '.join(sorted(unknown))}")
+        self.ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        pairs = {
+            kind: [(self._add(s), self._add(t)) for s, t in links.get(kind, ())]
+            for kind in KINDS
+        }
+        self._requirements = np.array(
+            [self._add(r) for r in dict.fromkeys(requirements)], dtype=np.int64
+        )
+        self._parts = np.array([self._add(p) for p in dict.fromkeys(parts)], dtype=np.int64)
+
+        n = len(self.ids)
+        self.shape = (n, n)
+        self._matrices = {}
+        for kind, edges in pairs.items():
+            edges = np.array(edges, dtype=np.int64).reshape(-1, 2)
+            keys = np.unique(edges[:, 0] * n + edges[:, 1])
+            self._matrices[kind] = _from_keys(keys, self.shape)
+        self._closures: dict[tuple[str, ...], Any] = {}
+
+    def _add(self, element_id: str) -> int:
+        position = self._positions.get(element_id)
+        if position is None:
+            position = self._positions[element_id] = len(self.ids)
+            self.ids.append(element_id)
+        return position
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def index(self, element_id: str) -> int:
+        """Row/column of an element."""
+        return self._positions[element_id]
+
+    @classmethod
+    def from_elements(cls, elements: Iterable[dict[str, Any]]) -> Traceability:
+        """Extract links from SysML v2 API elements.
+
+        ``SatisfyRequirementUsage`` gives satisfy links and a verification
+        case's ``verifiedRequirement`` verify links.  Dependencies and
+        connections annotated with derivation or refinement metadata (or
+        typed by ``DerivationConnection``) give derive and refine links
+        from their sources to their targets.
+        """
+        index = ElementIndex(elements)
+        links: dict[str, list[tuple[str, str]]] = {kind: [] for kind in KINDS}
+        requirements: list[str] = []
+        parts: list[str] = []
+        for element in index.by_id.values():
+            kind = element.get("@type")
+            if kind in REQUIREMENT_TYPES:
+                requirements.append(element["@id"])
+            elif kind in PART_TYPES:
+                parts.append(element["@id"])
+            elif kind == "SatisfyRequirementUsage":
+                for req in ref_ids(element.get("satisfiedRequirement")):
+                    for by in ref_ids(element.get("satisfyingFeature")):
+                        links["satisfy"].append((by, req))
+            elif kind in ("VerificationCaseUsage", "VerificationCaseDefinition"):
+                for req in ref_ids(element.get("verifiedRequirement")):
+                    links["verify"].append((element["@id"], req))
+            else:
+                link = _link_kind(index, element)
+                if link is not None:
+                    sources = ref_ids(element.get("source")) or ref_ids(element.get("client"))
+                    targets = ref_ids(element.get("target")) or ref_ids(element.get("supplier"))
+                    links[link].extend((s, t) for s in sources for t in targets)
+        return cls(links, requirements=requirements, parts=parts)
+
+    # -- Matrices -------------------------------------------------------------
+
+    def matrix(self, kind: str) -> Any:
+        """Boolean adjacency matrix of *kind* links (sources x targets)."""
+        return self._matrices[kind]
+
+    def closure(self, kinds: str | Iterable[str] = "derive") -> Any:
+        """Transitive closure of the union of *kinds* links.
+
+        Entry ``(i, j)`` is set when ``j`` can be reached from ``i`` by one
+        or more links, e.g. every requirement derived from ``i`` directly or
+        indirectly.  Computed by repeated squaring (log of the chain
+        length in sparse products) and cached.
+        """
+        kinds = (kinds,) if isinstance(kinds, str) else tuple(sorted(kinds))
+        if not kinds:
+            raise ValueError("closure() needs at least one link kind")
+        if kinds not in self._closures:
+            reach = self._matrices[kinds[0]]
+            for kind in kinds[1:]:
+                reach = _union(reach, self._matrices[kind])
+            while True:
+                grown = _union(reach, _matmul(reach, reach))
+                if grown.nnz == reach.nnz:
+                    break
+                reach = grown
+            self._closures[kinds] = reach
+        return self._closures[kinds]
+
+    def targets(self, kind: str, element_id: str, *, transitive: bool = False) -> list[str]:
+        """IDs linked from *element_id* by *kind* links (or their closure)."""
+        m = self.closure(kind) if transitive else self._matrices[kind]
+        i = self.index(element_id)
+        return [self.ids[j] for j in m.indices[m.indptr[i] : m.indptr[i + 1]]]
+
+    # -- Coverage -------------------------------------------------------------
+
+    def _covered(self, kind: str, transitive: bool) -> np.ndarray:
+        """Mask of elements that are targets of *kind* links.
+
+        With *transitive*, a requirement also counts as covered when it has
+        derived requirements and all of them are covered.
+        """
+        covered = np.bincount(self._matrices[kind].indices, minlength=len(self)) > 0
+        if not transitive:
+            return covered
+        derive = self._matrices["derive"]
+        has_derived = np.diff(derive.indptr) > 0
+        while True:
+            uncovered_children = _matvec(derive, (~covered).astype(np.float64))
+            grown = covered | (has_derived & (uncovered_children == 0))
+            if np.array_equal(grown, covered):
+                return covered
+            covered = grown
+
+    def unsatisfied(self, *, transitive: bool = True) -> list[str]:
+        """Requirements with no satisfy link (see :meth:`coverage`)."""
+        return self._missing("satisfy", transitive)
+
+    def unverified(self, *, transitive: bool = True) -> list[str]:
+        """Requirements with no verify link (see :meth:`coverage`)."""
+        return self._missing("verify", transitive)
+
+    def _missing(self, kind: str, transitive: bool) -> list[str]:
+        covered = self._covered(kind, transitive)[self._requirements]
+        return [self.ids[i] for i in self._requirements[~covered]]
+
+    def orphan_parts(self) -> list[str]:
+        """Parts that satisfy no requirement."""
+        satisfying = np.diff(self._matrices["satisfy"].indptr) > 0
+        return [self.ids[i] for i in self._parts[~satisfying[self._parts]]]
+
+    def coverage(self, *, transitive: bool = True) -> Coverage:
+        """Satisfaction and verification coverage of the requirements.
+
+        With *transitive*, a requirement without a direct link is covered
+        when every requirement derived from it is, recursively.
+        """
+        unsatisfied = self.unsatisfied(transitive=transitive)
+        unverified = self.unverified(transitive=transitive)
+        total = len(self._requirements)
+        return Coverage(
+            requirements=total,
+            satisfied=total - len(unsatisfied),
+            verified=total - len(unverified),
+            unsatisfied=unsatisfied,
+            unverified=unverified,
+            orphan_parts=self.orphan_parts(),
+        )
+
+    # -- Export ---------------------------------------------------------------
+
+    def iter_links(self, kind: str, *, transitive: bool = False) -> Iterator[tuple[str, str]]:
+        """Yield ``(source_id, target_id)`` pairs row by row."""
+        m = self.closure(kind) if transitive else self._matrices[kind]
+        for i in np.flatnonzero(np.diff(m.indptr)):
+            for j in m.indices[m.indptr[i] : m.indptr[i + 1]]:
+                yield self.ids[i], self.ids[j]
+
+    def export(
+        self, kind: str, dest: str | Path | IO[str], *, transitive: bool = False
+    ) -> int:
+        """Write *kind* links as a Matrix Market coordinate pattern file.
+
+        Rows and columns are 1-based element positions; the element IDs are
+        written, in order, as ``%`` comment lines after the header.  Entries
+        are written in blocks of rows, so memory stays bounded.  Returns the
+        number of entries.
+        """
+        m = self.closure(kind) if transitive else self._matrices[kind]
+        if not hasattr(dest, "write"):
+            with open(dest, "w") as f:
+                return self.export(kind, f, transitive=transitive)
+        dest.write("%%MatrixMarket matrix coordinate pattern general\n")
+        dest.write(f"% sysml-v2 traceability: {kind}{' (transitive)' if transitive else ''}\n")
+        for element_id in self.ids:
+            dest.write(f"% {element_id}\n")
+        dest.write(f"{m.shape[0]} {m.shape[1]} {m.nnz}\n")
+        for start in range(0, m.shape[0], _EXPORT_ROWS):
+            stop = min(start + _EXPORT_ROWS, m.shape[0])
+            lo, hi = m.indptr[start], m.indptr[stop]
+            rows = np.repeat(np.arange(start, stop), np.diff(m.indptr[start : stop + 1]))
+            block = np.column_stack((rows + 1, np.asarray(m.indices[lo:hi]) + 1))
+            np.savetxt(dest, block, fmt="%d")
+        return int(m.nnz)
+
+
+def _link_kind(index: ElementIndex, element: dict[str, Any]) -> str | None:
+    """``"derive"``/``"refine"`` for relationships marked as such, else None."""
+    if element.get("@type") not in (
+        "Dependency",
+        "ConnectionUsage",
+        "AllocationUsage",
+        "BindingConnectorAsUsage",
+    ):
+        return None
+    names = []
+    for key in ("connectionDefinition", "definition"):
+        refs = ref_ids(element.get(key))
+        names += [element_name(index.by_id[r]) for r in refs if r in index.by_id]
+    for owned in index.owned[element["@id"]]:
+        if owned.get("@type") == "MetadataUsage":
+            for ref in ref_ids(owned.get("metadataDefinition")):
+                if ref in index.by_id:
+                    names.append(element_name(index.by_id[ref]))
+    for name in filter(None, names):
+        lowered = name.lower()
+        if lowered.startswith("deriv"):
+            return "derive"
+        if lowered.startswith("refine"):
+            return "refine"
+    return None
@@ -1,5 +1,7 @@
 """SysML v2 API client."""
 
 from sysml_v2.api.client import SysMLClient
+from sysml_v2.api.mirror import Mirror, MirrorClient
+from sysml_v2.api.query import Query, run_query
 
-__all__ = ["SysMLClient"]
+__all__ = ["Mirror", "MirrorClient", "Query", "SysMLClient", "run_query"]
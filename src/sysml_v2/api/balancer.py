@@ -0,0 +1,301 @@
+"""Client-side load balancing across SysML v2 API replicas.
+
+:class:`BalancingTransport` is an httpx transport that sends each request
+to one of several replicas of the same API:
+
+* Reads (``GET``/``HEAD``, and requests marked with the
+  :data:`READ_ONLY` extension such as queries) go to the healthy replica with the lowest
+  ``(outstanding requests + 1) * EWMA latency``, so slow or busy replicas
+  get less traffic; replicas without samples yet are tried first.  A read
+  that fails with a connection error or 5xx is retried on another replica.
+* Writes stick to one replica (the first URL) so they apply in order; they
+  only move, and stay, elsewhere if that replica is ejected.
+* Replicas that fail repeatedly are ejected for a cooldown that doubles on
+  each consecutive ejection.  After the cooldown, a replica is readmitted
+  only once a health probe (the same request as ``SysMLClient.healthy()``)
+  succeeds.
+
+Replica state is shared by all clients in the process using the same URLs
+(see :meth:`ReplicaSet.shared`), so concurrent clients see each other's
+load.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+import httpx
+
+# Path probed by SysMLClient.healthy() and before readmitting a replica
+HEALTH_PATH = "/projects"
+
+# Request extension marking a request with a body (e.g. a query POST) as a read
+READ_ONLY = "sysml_v2.read_only"
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_PROBE_TIMEOUT = {"connect": 2.0, "read": 2.0, "write": 2.0, "pool": 2.0}
+
+
+@dataclass
+class Replica:
+    url: httpx.URL
+    outstanding: int = 0
+    # Smoothed response time in seconds (0 until the first response)
+    ewma: float = 0.0
+    # Consecutive failed requests, and consecutive ejections
+    failures: int = 0
+    ejections: int = 0
+    # time.monotonic() until which the replica is ejected (0: in service)
+    ejected_until: float = 0.0
+    probing: bool = False
+
+    @property
+    def ejected(self) -> bool:
+        return self.ejected_until > 0
+
+
+class ReplicaSet:
+    """Health and load state of a set of replicas.
+
+    A replica is ejected after *max_failures* consecutive failures, for
+    *cooldown* seconds doubling up to *max_cooldown*.  *alpha* is the
+    weight of the newest latency sample in the EWMA.
+    """
+
+    _shared: dict[tuple[str, ...], ReplicaSet] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        *,
+        max_failures: int = 2,
+        cooldown: float = 5.0,
+        max_cooldown: float = 60.0,
+        alpha: float = 0.3,
+    ) -> None:
+        if not urls:
+            raise ValueError("At least one replica URL is required")
+        self.replicas = [Replica(httpx.URL(url)) for url in urls]
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._writer = 0
+        self._turn = 0
+
+    @classmethod
+    def shared(cls, urls: Sequence[str]) -> ReplicaSet:
+        """Return the process-wide replica set for *urls*."""
+        key = tuple(urls)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(key)
+            return cls._shared[key]
+
+    def pick(self, write: bool, exclude: set[int]) -> tuple[int, bool] | None:
+        """Choose a replica for a request; return ``(index, needs_probe)``.
+
+        Replicas in *exclude* (already tried for this request) are skipped.
+        If every other replica is ejected, the one whose cooldown ends first
+        is returned rather than failing outright.
+        """
+        with self._lock:
+            now = time.monotonic()
+            available = []
+            for i, r in enumerate(self.replicas):
+                if i in exclude or r.probing:
+                    continue
+                if r.ejected and now < r.ejected_until:
+                    continue
+                available.append(i)
+
+            if not available:
+                rest = [i for i in range(len(self.replicas)) if i not in exclude]
+                if not rest:
+                    return None
+                chosen = min(rest, key=lambda i: self.replicas[i].ejected_until)
+                self.replicas[chosen].outstanding += 1
+                return chosen, False
+
+            if write:
+                if self._writer not in available:
+                    # Move writes to the next replica in URL order, and keep them there.
+                    n = len(self.replicas)
+                    self._writer = min(available, key=lambda i: (i - self._writer) % n)
+                chosen = self._writer
+            else:
+                # Rotate the scan start so equally loaded replicas share traffic.
+                self._turn += 1
+                n = len(available)
+                order = [available[(self._turn + k) % n] for k in range(n)]
+                chosen = min(order, key=self._cost)
+
+            replica = self.replicas[chosen]
+            needs_probe = replica.ejected
+            if needs_probe:
+                replica.probing = True
+            else:
+                replica.outstanding += 1
+            return chosen, needs_probe
+
+    def _cost(self, i: int) -> float:
+        r = self.replicas[i]
+        return (r.outstanding + 1) * r.ewma
+
+    def readmit(self, i: int, ok: bool) -> None:
+        """Record the result of a health probe of an ejected replica."""
+        with self._lock:
+            r = self.replicas[i]
+            r.probing = False
+            if ok:
+                r.failures = r.ejections = 0
+                r.ejected_until = 0.0
+            else:
+                self._eject(r)
+
+    def begin(self, i: int) -> None:
+        """Count a request on a replica that was readmitted by a probe."""
+        with self._lock:
+            self.replicas[i].outstanding += 1
+
+    def done(self, i: int, elapsed: float, ok: bool) -> None:
+        """Record a finished request on replica *i*."""
+        with self._lock:
+            r = self.replicas[i]
+            r.outstanding -= 1
+            if ok:
+                r.failures = r.ejections = 0
+                r.ejected_until = 0.0
+                r.ewma = elapsed if r.ewma == 0 else r.ewma + self.alpha * (elapsed - r.ewma)
+                return
+            r.failures += 1
+            if r.failures >= self.max_failures or r.ejected:
+                self._eject(r)
+
+    def _eject(self, r: Replica) -> None:
+        delay = min(self.cooldown * 2**r.ejections, self.max_cooldown)
+        r.ejections += 1
+        r.failures = 0
+        r.ejected_until = time.monotonic() + delay
+
+
+class _TrackedStream(httpx.SyncByteStream):
+    """Response body that reports to the replica set when it is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, on_close) -> None:
+        self._stream = stream
+        self._on_close = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class BalancingTransport(httpx.BaseTransport):
+    """httpx transport that routes requests across replicas (see module docs).
+
+    Requests must be addressed to the first replica's URL, i.e. made by an
+    ``httpx.Client`` whose ``base_url`` is ``replicas.replicas[0].url``.
+    """
+
+    def __init__(self, replicas: ReplicaSet) -> None:
+        self.replicas = replicas
+        self._base = replicas.replicas[0].url
+        self._transports = [httpx.HTTPTransport() for _ in replicas.replicas]
+
+    def _request(self, i: int, request: httpx.Request, **extensions) -> httpx.Request:
+        """*request* re-addressed to replica *i*."""
+        target = self.replicas.replicas[i].url
+        prefix = self._base.path.rstrip("/")
+        path = request.url.path
+        if path.startswith(prefix):
+            path = path[len(prefix) :]
+        url = request.url.copy_with(
+            scheme=target.scheme,
+            host=target.host,
+            port=target.port,
+            path=target.path.rstrip("/") + path,
+        )
+        headers = request.headers.copy()
+        headers["Host"] = target.netloc.decode("ascii")
+        return httpx.Request(
+            request.method,
+            url,
+            headers=headers,
+            stream=request.stream,
+            extensions={**request.extensions, **extensions},
+        )
+
+    def probe(self, i: int) -> bool:
+        """Return True if replica *i* answers the health request."""
+        url = self._base.copy_with(path=self._base.path.rstrip("/") + HEALTH_PATH)
+        request = self._request(i, httpx.Request("GET", url), timeout=_PROBE_TIMEOUT)
+        try:
+            response = self._transports[i].handle_request(request)
+            response.close()
+        except httpx.TransportError:
+            return False
+        return response.status_code < 500
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        write = request.method not in _READ_METHODS and not request.extensions.get(READ_ONLY)
+        tried: set[int] = set()
+        error: Exception | None = None
+        while True:
+            picked = self.replicas.pick(write, tried)
+            if picked is None:
+                break
+            i, needs_probe = picked
+            tried.add(i)
+            if needs_probe:
+                ok = self.probe(i)
+                self.replicas.readmit(i, ok)
+                if not ok:
+                    continue
+                self.replicas.begin(i)
+
+            start = time.perf_counter()
+            try:
+                response = self._transports[i].handle_request(self._request(i, request))
+            except httpx.TransportError as exc:
+                self.replicas.done(i, time.perf_counter() - start, ok=False)
+                # A write is only retried elsewhere if it never reached the server.
+                if write and not isinstance(exc, httpx.ConnectError):
+                    raise
+                error = exc
+                continue
+
+            ok = response.status_code < 500
+            if not ok and not write and len(tried) < len(self.replicas.replicas):
+                response.close()
+                self.replicas.done(i, time.perf_counter() - start, ok=False)
+                continue
+
+            def finished(i: int = i, start: float = start, ok: bool = ok) -> None:
+                self.replicas.done(i, time.perf_counter() - start, ok)
+
+            return httpx.Response(
+                response.status_code,
+                headers=response.headers,
+                stream=_TrackedStream(response.stream, finished),
+                extensions=response.extensions,
+            )
+        if error is not None:
+            raise error
+        raise httpx.ConnectError("No API replica available", request=request)
+
+    def close(self) -> None:
+        for transport in self._transports:
+            transport.close()
@@ -0,0 +1,160 @@
+"""Load generator for SysML v2 API servers, driven through :class:`SysMLClient`."""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any
+
+from sysml_v2.api.client import SysMLClient
+from sysml_v2.api.query import Query
+
+# Query used by the "query" operation: all part usages in the commit.
+_PART_USAGE_QUERY = Query().where(type="PartUsage")
+
+OPERATIONS: dict[str, Callable[[SysMLClient, str, str], Any]] = {
+    "projects": lambda client, project, commit: client.list_projects(),
+    "commits": lambda client, project, commit: client.list_commits(project),
+    "elements": lambda client, project, commit: client.get_elements(project, commit),
+    "query": lambda client, project, commit: client.query(project, commit, _PART_USAGE_QUERY),
+}
+
+DEFAULT_MIX = "projects=1,commits=1,elements=4,query=2"
+
+
+def parse_mix(spec: str) -> dict[str, int]:
+    """Parse a request mix like ``"projects=1,elements=4"`` into weights."""
+    mix: dict[str, int] = {}
+    for item in spec.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(
+                f"Unknown operation {name!r}; expected one of {', '.join(OPERATIONS)}"
+            )
+        try:
+            mix[name] = int(weight or 1)
+        except ValueError:
+            raise ValueError(f"Invalid weight for {name!r}: {weight!r}") from None
+        if mix[name] < 0:
+            raise ValueError(f"Weight for {name!r} must not be negative: {weight!r}")
+    if not any(mix.values()):
+        raise ValueError("Request mix must have at least one positive weight")
+    return mix
+
+
+def resolve_target(client: SysMLClient) -> tuple[str, str]:
+    """Pick the first project on the server and its latest commit."""
+    projects = client.list_projects()
+    if not projects:
+        raise LookupError("The server has no projects to benchmark")
+    project_id = projects[0]["@id"]
+    commits = client.list_commits(project_id)
+    if not commits:
+        raise LookupError(f"Project {project_id} has no commits")
+    return project_id, commits[-1]["@id"]
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _summarize(latencies: list[float], errors: int, elapsed: float) -> dict[str, Any]:
+    ordered = sorted(latencies)
+    count = len(ordered) + errors
+    return {
+        "requests": count,
+        "errors": errors,
+        "throughput_rps": count / elapsed if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "mean": 1000 * sum(ordered) / len(ordered) if ordered else 0.0,
+            "p50": 1000 * _percentile(ordered, 50),
+            "p90": 1000 * _percentile(ordered, 90),
+            "p99": 1000 * _percentile(ordered, 99),
+            "max": 1000 * ordered[-1] if ordered else 0.0,
+        },
+    }
+
+
+def run_bench(
+    client_factory: Callable[[], SysMLClient],
+    project_id: str,
+    commit_id: str,
+    *,
+    mix: dict[str, int] | None = None,
+    concurrency: int = 4,
+    requests: int | None = 200,
+    duration: float | None = None,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """Drive the server with *concurrency* workers and return a results dict.
+
+    Each worker owns a client from *client_factory* and issues operations
+    picked at random according to the *mix* weights, until *requests* have
+    been sent in total or *duration* seconds have passed.  Latencies are
+    reported in milliseconds and throughput in requests per second.
+    """
+    mix = mix or parse_mix(DEFAULT_MIX)
+    if requests is None and duration is None:
+        raise ValueError("Either requests or duration must be given")
+    names = list(mix)
+    weights = [mix[name] for name in names]
+
+    counter = itertools.count()
+    lock = threading.Lock()
+    latencies: dict[str, list[float]] = {name: [] for name in names}
+    errors: dict[str, int] = dict.fromkeys(names, 0)
+    started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    start = time.perf_counter()
+    deadline = start + duration if duration is not None else None
+
+    def worker(index: int) -> None:
+        rng = random.Random(seed + index)
+        with client_factory() as client:
+            while True:
+                if requests is not None and next(counter) >= requests:
+                    return
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+                name = rng.choices(names, weights)[0]
+                t0 = time.perf_counter()
+                try:
+                    OPERATIONS[name](client, project_id, commit_id)
+                except Exception:
+                    with lock:
+                        errors[name] += 1
+                    continue
+                elapsed = time.perf_counter() - t0
+                with lock:
+                    latencies[name].append(elapsed)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    overall = _summarize(
+        [lat for values in latencies.values() for lat in values],
+        sum(errors.values()),
+        elapsed,
+    )
+    return {
+        "started_at": started_at,
+        "project_id": project_id,
+        "commit_id": commit_id,
+        "concurrency": concurrency,
+        "mix": mix,
+        "duration_s": elapsed,
+        **overall,
+        "operations": {
+            name: _summarize(latencies[name], errors[name], elapsed) for name in names
+        },
+    }
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 import httpx
 
+from sysml_v2 import tracing
+from sysml_v2.api.balancer import HEALTH_PATH, READ_ONLY, BalancingTransport, ReplicaSet
+from sysml_v2.api.query import Query
 from sysml_v2.config import load_config
 
 _DEFAULT_TIMEOUT = 30
@@ -19,16 +23,37 @@ class SysMLClient:
 
     Usage::
 
-        client = SysMLClient()              # reads url from sysml.toml or default
+        client = SysMLClient()              # reads url(s) from sysml.toml or default
         client = SysMLClient("http://localhost:8083")
+        client = SysMLClient(urls=["http://api-1:8083", "http://api-2:8083"])
         projects = client.list_projects()
+
+    With several *urls* (or ``[server] urls`` in sysml.toml), reads are
+    spread over the healthy replicas and writes stick to the first one;
+    see :mod:`sysml_v2.api.balancer`.
     """
 
-    def __init__(self, base_url: str | None = None, timeout: float = _DEFAULT_TIMEOUT) -> None:
-        if base_url is None:
+    _balancer: BalancingTransport | None = None
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float = _DEFAULT_TIMEOUT,
+        *,
+        urls: Sequence[str] | None = None,
+    ) -> None:
+        if base_url is None and not urls:
             cfg = load_config()
             base_url = cfg.server.url
-        self._client = httpx.Client(base_url=base_url, timeout=timeout)
+            urls = cfg.server.urls
+        if urls and len(urls) > 1:
+            base_url = urls[0]
+            self._balancer = BalancingTransport(ReplicaSet.shared(urls))
+        elif urls:
+            base_url = urls[0]
+        self._client = httpx.Client(
+            base_url=base_url, timeout=timeout, **tracing.client_options(self._balancer)
+        )
 
     def close(self) -> None:
         """Close the underlying HTTP connection."""
@@ -43,9 +68,19 @@ class SysMLClient:
     # -- Health ---------------------------------------------------------------
 
     def healthy(self) -> bool:
-        """Return True if the API server is reachable."""
+        """Return True if the API server (or any replica) is reachable.
+
+        With several replicas, each one is probed and readmitted or
+        ejected accordingly.
+        """
+        if self._balancer is not None:
+            replicas = self._balancer.replicas
+            results = [self._balancer.probe(i) for i in range(len(replicas.replicas))]
+            for i, ok in enumerate(results):
+                replicas.readmit(i, ok)
+            return any(results)
         try:
-            resp = self._client.get("/projects")
+            resp = self._client.get(HEALTH_PATH)
             return resp.status_code < 500
         except httpx.HTTPError:
             return False
@@ -110,16 +145,20 @@ class SysMLClient:
     # -- Queries --------------------------------------------------------------
 
     def query(
-        self, project_id: str, commit_id: str, body: dict[str, Any]
+        self, project_id: str, commit_id: str, body: Query | dict[str, Any]
     ) -> list[dict[str, Any]]:
         """Execute a query against a commit.
 
-        *body* should be a dict conforming to the SysML v2 Query schema,
+        *body* is a :class:`~sysml_v2.api.query.Query` or a dict conforming
+        to the SysML v2 Query schema,
         e.g. ``{"@type": "Query", "select": [...], "where": {...}}``.
         """
+        if isinstance(body, Query):
+            body = body.to_dict()
         resp = self._client.post(
             f"/projects/{project_id}/commits/{commit_id}/query",
             json=body,
+            extensions={READ_ONLY: True},
         )
         resp.raise_for_status()
         return resp.json()
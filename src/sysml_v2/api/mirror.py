@@ -0,0 +1,251 @@
+"""Incremental local SQLite mirror of server projects."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from sysml_v2.api.client import SysMLClient
+from sysml_v2.api.query import Query, evaluate
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS commits (
+    project_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (project_id, id)
+);
+-- Element versions are stored once by content hash and shared by commits.
+CREATE TABLE IF NOT EXISTS element_data (
+    hash TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS commit_elements (
+    project_id TEXT NOT NULL,
+    commit_id TEXT NOT NULL,
+    element_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    PRIMARY KEY (project_id, commit_id, element_id)
+);
+"""
+
+
+@dataclass(frozen=True)
+class PullResult:
+    project_id: str
+    new_commits: int
+    elements: int
+
+
+class Mirror:
+    """SQLite store holding projects, commits and commit elements.
+
+    Usage::
+
+        with Mirror(".sysml/mirror.db") as mirror, SysMLClient() as client:
+            mirror.pull(client, project_id)     # only fetches new commits
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def __enter__(self) -> Mirror:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def synced_commits(self, project_id: str) -> set[str]:
+        """Return IDs of the commits already mirrored for a project."""
+        rows = self._db.execute("SELECT id FROM commits WHERE project_id = ?", (project_id,))
+        return {row[0] for row in rows}
+
+    def pull(self, client: SysMLClient, project_id: str) -> PullResult:
+        """Mirror a project, fetching elements only for commits not yet stored.
+
+        Each commit is stored in its own transaction, so an interrupted pull
+        resumes where it stopped.
+        """
+        project = client.get_project(project_id)
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO projects (id, data) VALUES (?, ?)",
+                (project_id, json.dumps(project)),
+            )
+
+        known = self.synced_commits(project_id)
+        new_commits = 0
+        total_elements = 0
+        for seq, commit in enumerate(client.list_commits(project_id)):
+            commit_id = commit["@id"]
+            if commit_id in known:
+                continue
+            elements = client.get_elements(project_id, commit_id)
+            with self._db:
+                self._store_elements(project_id, commit_id, elements)
+                self._db.execute(
+                    "INSERT INTO commits (project_id, id, seq, data) VALUES (?, ?, ?, ?)",
+                    (project_id, commit_id, seq, json.dumps(commit)),
+                )
+            new_commits += 1
+            total_elements += len(elements)
+        return PullResult(project_id, new_commits, total_elements)
+
+    def _store_elements(
+        self, project_id: str, commit_id: str, elements: list[dict[str, Any]]
+    ) -> None:
+        data_rows = []
+        link_rows = []
+        for seq, element in enumerate(elements):
+            data = json.dumps(element, sort_keys=True)
+            digest = hashlib.sha1(data.encode()).hexdigest()
+            data_rows.append((digest, data))
+            link_rows.append((project_id, commit_id, element["@id"], seq, digest))
+        self._db.executemany(
+            "INSERT OR IGNORE INTO element_data (hash, data) VALUES (?, ?)", data_rows
+        )
+        self._db.executemany(
+            "INSERT OR REPLACE INTO commit_elements "
+            "(project_id, commit_id, element_id, seq, hash) VALUES (?, ?, ?, ?, ?)",
+            link_rows,
+        )
+
+
+def _error(status: int, method: str, path: str) -> httpx.HTTPStatusError:
+    """Build the error SysMLClient would raise for an HTTP error *status*."""
+    request = httpx.Request(method, f"mirror://{path}")
+    response = httpx.Response(status, request=request)
+    return httpx.HTTPStatusError(
+        f"{status} {response.reason_phrase} for mirror path {path}",
+        request=request,
+        response=response,
+    )
+
+
+class MirrorClient:
+    """Read-only stand-in for :class:`SysMLClient` backed by a :class:`Mirror`.
+
+    Has the same methods as ``SysMLClient`` so existing scripts can run
+    offline.  Missing items raise ``httpx.HTTPStatusError`` with status 404
+    and writes raise it with status 405, as a server would.
+
+    Usage::
+
+        with MirrorClient(".sysml/mirror.db") as client:
+            elements = client.get_elements(project_id, commit_id)
+    """
+
+    def __init__(self, mirror: Mirror | str | Path) -> None:
+        self._owned = not isinstance(mirror, Mirror)
+        self._mirror = Mirror(mirror) if self._owned else mirror
+        self._db = self._mirror._db
+
+    def close(self) -> None:
+        """Close the mirror if this client opened it."""
+        if self._owned:
+            self._mirror.close()
+
+    def __enter__(self) -> MirrorClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _one(self, sql: str, args: tuple, path: str) -> dict[str, Any]:
+        row = self._db.execute(sql, args).fetchone()
+        if row is None:
+            raise _error(404, "GET", path)
+        return json.loads(row[0])
+
+    # -- Health ---------------------------------------------------------------
+
+    def healthy(self) -> bool:
+        """Return True; the mirror is always available."""
+        return True
+
+    # -- Projects -------------------------------------------------------------
+
+    def list_projects(self) -> list[dict[str, Any]]:
+        """List all mirrored projects."""
+        rows = self._db.execute("SELECT data FROM projects ORDER BY id")
+        return [json.loads(row[0]) for row in rows]
+
+    def get_project(self, project_id: str) -> dict[str, Any]:
+        """Get a single mirrored project by ID."""
+        return self._one(
+            "SELECT data FROM projects WHERE id = ?", (project_id,), f"/projects/{project_id}"
+        )
+
+    def create_project(self, name: str, description: str = "") -> dict[str, Any]:
+        """Not supported: the mirror is read-only."""
+        raise _error(405, "POST", "/projects")
+
+    # -- Commits --------------------------------------------------------------
+
+    def list_commits(self, project_id: str) -> list[dict[str, Any]]:
+        """List mirrored commits for a project, in server order."""
+        rows = self._db.execute(
+            "SELECT data FROM commits WHERE project_id = ? ORDER BY seq", (project_id,)
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def get_commit(self, project_id: str, commit_id: str) -> dict[str, Any]:
+        """Get a single mirrored commit."""
+        return self._one(
+            "SELECT data FROM commits WHERE project_id = ? AND id = ?",
+            (project_id, commit_id),
+            f"/projects/{project_id}/commits/{commit_id}",
+        )
+
+    # -- Elements -------------------------------------------------------------
+
+    def get_elements(self, project_id: str, commit_id: str) -> list[dict[str, Any]]:
+        """List all elements in a mirrored commit."""
+        self.get_commit(project_id, commit_id)
+        rows = self._db.execute(
+            "SELECT d.data FROM commit_elements c JOIN element_data d ON d.hash = c.hash "
+            "WHERE c.project_id = ? AND c.commit_id = ? ORDER BY c.seq",
+            (project_id, commit_id),
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def get_element(
+        self, project_id: str, commit_id: str, element_id: str
+    ) -> dict[str, Any]:
+        """Get a single element by ID."""
+        return self._one(
+            "SELECT d.data FROM commit_elements c JOIN element_data d ON d.hash = c.hash "
+            "WHERE c.project_id = ? AND c.commit_id = ? AND c.element_id = ?",
+            (project_id, commit_id, element_id),
+            f"/projects/{project_id}/commits/{commit_id}/elements/{element_id}",
+        )
+
+    # -- Queries --------------------------------------------------------------
+
+    def query(
+        self, project_id: str, commit_id: str, body: Query | dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Evaluate a query locally against a mirrored commit."""
+        if isinstance(body, Query):
+            body = body.to_dict()
+        return evaluate(body, self.get_elements(project_id, commit_id))
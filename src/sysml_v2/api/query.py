@@ -0,0 +1,192 @@
+"""Typed builder for SysML v2 API queries, with a local evaluator."""
+
+from __future__ import annotations
+
+import operator
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+if TYPE_CHECKING:
+    from sysml_v2.api.client import SysMLClient
+
+_OPERATORS = {
+    "=": operator.eq,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+# Keyword arguments of ``Query.where`` that map to differently named properties
+_PROPERTY_ALIASES = {"type": "@type", "id": "@id"}
+
+
+def _primitive(prop: str, value: Any, op: str = "=") -> dict[str, Any]:
+    return {
+        "@type": "PrimitiveConstraint",
+        "inverse": False,
+        "operator": op,
+        "property": prop,
+        "value": value,
+    }
+
+
+def _composite(op: str, constraints: list[dict[str, Any]]) -> dict[str, Any]:
+    if len(constraints) == 1:
+        return constraints[0]
+    return {"@type": "CompositeConstraint", "operator": op, "constraint": constraints}
+
+
+class Query:
+    """Builder that compiles to the SysML v2 Query schema.
+
+    Constraints passed to :meth:`where` are combined with AND; a tuple or
+    list of values matches any of them.  References such as ``owner`` are
+    compared by element ID.
+
+    Usage::
+
+        q = (
+            Query()
+            .where(type="PartUsage")
+            .scope(package_id)            # everything owned under the package
+            .select("@id", "name")
+        )
+        parts = client.query(project_id, commit_id, q)
+    """
+
+    def __init__(self) -> None:
+        self._constraints: list[dict[str, Any]] = []
+        self._select: list[str] = []
+        self._scope: list[str] = []
+
+    def where(self, op: str = "=", **properties: Any) -> Query:
+        """Add constraints on element properties, e.g. ``where(type="PartUsage")``.
+
+        *op* is the comparison operator for all given properties: one of
+        ``=``, ``<``, ``>``, ``<=`` or ``>=``.
+        """
+        if op not in _OPERATORS:
+            raise ValueError(f"Unsupported operator {op!r}")
+        for key, value in properties.items():
+            prop = _PROPERTY_ALIASES.get(key, key)
+            if isinstance(value, (list, tuple, set, frozenset)):
+                self._constraints.append(
+                    _composite("or", [_primitive(prop, v, op) for v in value])
+                )
+            else:
+                self._constraints.append(_primitive(prop, value, op))
+        return self
+
+    def select(self, *properties: str) -> Query:
+        """Only return the given properties of each matching element."""
+        self._select.extend(properties)
+        return self
+
+    def scope(self, *element_ids: str) -> Query:
+        """Restrict matches to elements owned, directly or not, by these elements."""
+        self._scope.extend(element_ids)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Compile to a request body conforming to the SysML v2 Query schema."""
+        body: dict[str, Any] = {"@type": "Query"}
+        if self._select:
+            body["select"] = list(self._select)
+        if self._scope:
+            body["scope"] = [{"@id": element_id} for element_id in self._scope]
+        if self._constraints:
+            body["where"] = _composite("and", self._constraints)
+        return body
+
+    def evaluate(self, elements: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Evaluate the query locally over *elements*."""
+        return evaluate(self.to_dict(), elements)
+
+
+def _identity(value: Any) -> Any:
+    if isinstance(value, dict) and "@id" in value:
+        return value["@id"]
+    return value
+
+
+def _matches(constraint: dict[str, Any], element: dict[str, Any]) -> bool:
+    if constraint.get("@type") == "CompositeConstraint":
+        results = (_matches(c, element) for c in constraint.get("constraint", []))
+        return any(results) if constraint.get("operator") == "or" else all(results)
+
+    compare = _OPERATORS[constraint.get("operator", "=")]
+    actual = element.get(constraint["property"])
+    values = actual if isinstance(actual, list) else [actual]
+    expected = constraint["value"]
+    try:
+        hit = any(
+            v is not None and compare(_identity(v), expected) for v in values
+        )
+    except TypeError:
+        hit = False
+    return hit != bool(constraint.get("inverse", False))
+
+
+def evaluate(body: dict[str, Any], elements: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Evaluate a SysML v2 Query request *body* locally over *elements*.
+
+    Supports primitive and composite ``where`` constraints, ``scope``
+    (transitive ownership) and ``select`` projections.
+    """
+    elements = list(elements)
+    matched = elements
+
+    scope = {ref["@id"] for ref in body.get("scope", [])}
+    if scope:
+        owners = {
+            el["@id"]: _identity(el.get("owner") or el.get("owningNamespace"))
+            for el in elements
+        }
+
+        def in_scope(element_id: str) -> bool:
+            seen = set()
+            owner = owners.get(element_id)
+            while owner is not None and owner not in seen:
+                if owner in scope:
+                    return True
+                seen.add(owner)
+                owner = owners.get(owner)
+            return False
+
+        matched = [el for el in matched if in_scope(el["@id"])]
+
+    where = body.get("where")
+    if where:
+        matched = [el for el in matched if _matches(where, el)]
+
+    select = body.get("select")
+    if select:
+        keep = ["@id", *(p for p in select if p != "@id")]
+        matched = [{p: el[p] for p in keep if p in el} for el in matched]
+    return matched
+
+
+def run_query(
+    client: SysMLClient,
+    project_id: str,
+    commit_id: str,
+    query: Query | dict[str, Any],
+    *,
+    elements: Iterable[dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Run *query* on the server, evaluating it locally if the server can't.
+
+    Servers with limited query support reject some queries with an HTTP
+    error status.  In that case the query is evaluated over *elements*
+    (e.g. a cached ``get_elements`` result), fetching them only if needed.
+    """
+    body = query.to_dict() if isinstance(query, Query) else query
+    try:
+        return client.query(project_id, commit_id, body)
+    except httpx.HTTPStatusError:
+        if elements is None:
+            elements = client.get_elements(project_id, commit_id)
+        return evaluate(body, elements)
@@ -1,19 +1,45 @@
 """SysML v2 CLI — ``sysml`` command group."""
 
+import time
+
 import click
 
-from sysml_v2 import __version__
+from sysml_v2 import __version__, tracing
+from sysml_v2.cli.find import find
 from sysml_v2.cli.init_cmd import init_cmd
+from sysml_v2.cli.load_rdf import load_rdf
+from sysml_v2.cli.pull import pull
 from sysml_v2.cli.serve import serve
 from sysml_v2.cli.validate import validate
 
+_IMPORTED = time.perf_counter_ns()
+
 
 @click.group()
 @click.version_option(__version__, prog_name="sysml")
-def main() -> None:
+@click.option(
+    "--trace",
+    metavar="PATH",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write a Chrome trace-event timeline of the command to PATH (or set SYSML_TRACE).",
+)
+@click.pass_context
+def main(ctx: click.Context, trace: str | None) -> None:
     """SysML v2 toolchain — model development and analysis."""
+    if trace:
+        tracing.enable(trace)
+    if not tracing.enabled():
+        return
+    tracing.complete("import", tracing.IMPORT_START, _IMPORTED)
+    # Resources close in reverse order: the command span ends, then the trace is written.
+    ctx.call_on_close(tracing.write)
+    ctx.with_resource(tracing.span(f"sysml {ctx.invoked_subcommand}"))
 
 
+main.add_command(find)
 main.add_command(init_cmd, name="init")
+main.add_command(load_rdf)
+main.add_command(pull)
 main.add_command(serve)
 main.add_command(validate)
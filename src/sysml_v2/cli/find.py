@@ -0,0 +1,135 @@
+"""``sysml find`` — find model elements by partial or fuzzy name."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import click
+import httpx
+from rich.console import Console
+from rich.table import Table
+
+from sysml_v2 import tracing
+from sysml_v2.config import STATE_DIRNAME, load_config, project_dir, state_dir
+from sysml_v2.search import FILE_SOURCE, NameIndex
+
+console = Console()
+
+
+def default_index_path() -> Path:
+    """Return ``.sysml/names.db`` in the current project (or cwd)."""
+    return (state_dir() or Path(STATE_DIRNAME)) / "names.db"
+
+
+def _index_commit(
+    index: NameIndex, urls: list[str], project: str, commit: str | None
+) -> str:
+    """Index *commit* (default: the latest) of a server project; return its source name."""
+    from sysml_v2.api.client import SysMLClient
+
+    with SysMLClient(urls=urls) as client:
+        if commit is None:
+            commits = client.list_commits(project)
+            if not commits:
+                raise click.ClickException(f"Project {project} has no commits")
+            commit = commits[-1]["@id"]
+        source = f"{project}@{commit}"
+        if index.stamp(source) is None:
+            console.print(f"Indexing commit {commit} of project {project}...")
+            index.index_elements(client.get_elements(project, commit), source, commit)
+    return source
+
+
+def _location(source: str, line: int | None) -> str:
+    if not source.startswith(FILE_SOURCE):
+        return source
+    path = Path(source[len(FILE_SOURCE) :])
+    if path.is_relative_to(Path.cwd()):
+        path = path.relative_to(Path.cwd())
+    return f"{path}:{line}" if line else str(path)
+
+
+@click.command()
+@click.argument("pattern")
+@click.argument("path", default="models", type=click.Path(file_okay=False))
+@click.option("--fuzzy", is_flag=True, default=False, help="Rank names by similarity.")
+@click.option("--doc", is_flag=True, default=False, help="Also match doc text.")
+@click.option("--project", default=None, help="Search a server project instead of files.")
+@click.option("--commit", default=None, help="Commit to search (default: latest).")
+@click.option("--url", default=None, help="API server URL (default: from sysml.toml).")
+@click.option(
+    "--limit",
+    "-n",
+    type=click.IntRange(min=1),
+    default=50,
+    show_default=True,
+    help="Maximum number of results.",
+)
+@click.option(
+    "--index",
+    "index_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Index database (default: .sysml/names.db in the project).",
+)
+def find(
+    pattern: str,
+    path: str,
+    fuzzy: bool,
+    doc: bool,
+    project: str | None,
+    commit: str | None,
+    url: str | None,
+    limit: int,
+    index_path: str | None,
+) -> None:
+    """Find elements whose names match PATTERN.
+
+    PATTERN is a substring or a glob (e.g. '*driveOut*'), matched against
+    qualified names if it contains '::'.  Model files under PATH (default:
+    models/) are indexed first; only changed files are re-scanned.
+    """
+    cfg = load_config()
+    db = Path(index_path) if index_path else default_index_path()
+    try:
+        with NameIndex(db) as index:
+            if project is not None:
+                urls = [url] if url else list(cfg.server.urls or [cfg.server.url])
+                source = _index_commit(index, urls, project, commit)
+            else:
+                directory = Path(path)
+                if not directory.is_dir():
+                    raise click.UsageError(f"Directory '{path}' does not exist.")
+                state = state_dir()
+                with tracing.span("index", directory=str(directory)):
+                    index.index_directory(
+                        directory,
+                        exclude=cfg.validate.exclude,
+                        exclude_base=project_dir(),
+                        cache=state / "discovery.json" if state is not None else None,
+                    )
+                source = FILE_SOURCE + os.path.join(directory.resolve(), "")
+            with tracing.span("find", pattern=pattern):
+                matches = index.find(pattern, fuzzy=fuzzy, doc=doc, source=source, limit=limit)
+    except (httpx.HTTPError, RuntimeError) as exc:
+        console.print(f"[red]Error:[/red] {exc}")
+        sys.exit(1)
+
+    if not matches:
+        console.print("[yellow]No matching elements.[/yellow]")
+        sys.exit(1)
+
+    table = Table(show_header=True, box=None)
+    table.add_column("Name", style="bold")
+    table.add_column("Kind")
+    table.add_column("Qualified name")
+    table.add_column("Location", style="dim")
+    if fuzzy:
+        table.add_column("Score", justify="right")
+    for m in matches:
+        row = [m.name, m.kind or "", m.qualified_name, _location(m.source, m.line)]
+        table.add_row(*row, *([f"{m.score:.2f}"] if fuzzy else []))
+    with tracing.span("render", rows=len(matches)):
+        console.print(table)
@@ -11,6 +11,8 @@ from string import Template
 import click
 from rich.console import Console
 
+from sysml_v2 import library
+
 console = Console()
 
 # Mapping from template path → output path for files that need renaming.
@@ -75,12 +77,32 @@ def _copy_templates(dest: Path, project_name: str, backend: str) -> None:
     default="flexo",
     help="API server backend (default: flexo).",
 )
+@click.option(
+    "--release",
+    default=library.DEFAULT_RELEASE,
+    show_default=True,
+    help="Standard library branch or tag to install.",
+)
+@click.option(
+    "--refresh-library",
+    is_flag=True,
+    help="Re-fetch the standard library release even if it is cached.",
+)
 @click.option("--yes", "-y", is_flag=True, help="Skip interactive prompts.")
-def init_cmd(path: str, backend: str, yes: bool) -> None:
+def init_cmd(path: str, backend: str, release: str, refresh_library: bool, yes: bool) -> None:
     """Scaffold a new SysML v2 project.
 
-    PATH is the target directory (default: current directory).
+    PATH is the target directory (default: current directory).  The
+    standard library is fetched once into a user-level cache and linked
+    into each project from there, so later projects need no network.
+    Use --refresh-library to update a cached branch such as master.
     """
+    try:
+        cached = library.cached_release(release)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--release") from None
+    if refresh_library:
+        cached = None
     dest = Path(path).resolve()
     project_name = dest.name
 
@@ -105,31 +127,24 @@ def init_cmd(path: str, backend: str, yes: bool) -> None:
         subprocess.run(["git", "init", str(dest)], capture_output=True, check=False)
         console.print("[green]\u2713[/green] Git repository initialized")
 
-    # 3. Clone standard library
+    # 3. Install the standard library from the user-level cache
     lib_dest = dest / "lib" / "SysML-v2-Release"
     if not lib_dest.exists():
-        if yes or click.confirm("Clone the SysML v2 standard library?", default=True):
-            console.print("  Cloning standard library...")
-            result = subprocess.run(
-                [
-                    "git",
-                    "clone",
-                    "--depth",
-                    "1",
-                    "https://github.com/Systems-Modeling/SysML-v2-Release.git",
-                    str(lib_dest),
-                ],
-                capture_output=True,
-            )
-            if result.returncode == 0:
-                console.print("[green]\u2713[/green] Standard library cloned")
-            else:
+        if cached is not None or yes or click.confirm(
+            "Download the SysML v2 standard library?", default=True
+        ):
+            if cached is None:
+                console.print(f"  Fetching standard library ({release})...")
+            try:
+                method = library.install(lib_dest, release, refresh=refresh_library)
+            except (OSError, RuntimeError) as exc:
                 console.print(
-                    "[yellow]![/yellow] Could not clone standard library. "
-                    "Clone manually:\n"
-                    f"  git clone --depth 1 https://github.com/Systems-Modeling/"
-                    f"SysML-v2-Release.git {lib_dest}"
+                    f"[yellow]![/yellow] Could not fetch standard library: {exc}\n"
+                    "  Clone manually:\n"
+                    f"  git clone --depth 1 --branch {release} {library.release_url()} {lib_dest}"
                 )
+            else:
+                console.print(f"[green]\u2713[/green] Standard library installed ({method})")
 
     console.print()
     console.print("[bold green]Done![/bold green] Next steps:")
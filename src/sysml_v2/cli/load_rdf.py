@@ -0,0 +1,156 @@
+"""``sysml load-rdf`` — bulk-load models into the quad store as N-Quads."""
+
+from __future__ import annotations
+
+import itertools
+import json
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import click
+import httpx
+from rich.console import Console
+
+from sysml_v2 import rdf
+from sysml_v2.config import load_config
+from sysml_v2.parsing.loader import find_models, load
+
+console = Console()
+
+
+def _file_quads(paths: tuple[str, ...], graph: str | None) -> Iterator[str]:
+    """N-Quads for ``.json`` element exports and parsed ``.sysml`` files.
+
+    Each file goes into its own named graph unless *graph* is given.
+    """
+    for name in paths:
+        path = Path(name)
+        files = find_models(path) if path.is_dir() else [path]
+        for file in files:
+            if file.suffix == ".json":
+                elements = json.loads(file.read_text())
+            else:
+                try:
+                    model = load(file)
+                except Exception as exc:
+                    raise click.ClickException(f"Could not parse {file}: {exc}") from None
+                elements = rdf.model_elements(model)
+            yield from rdf.element_quads(elements, graph or rdf.file_graph_iri(file))
+
+
+def _server_elements(
+    urls: list[str], project: str, commit: str | None
+) -> tuple[list[dict[str, Any]], str]:
+    """Elements of *commit* (default: the latest) of a server project."""
+    from sysml_v2.api.client import SysMLClient
+
+    with SysMLClient(urls=urls) as client:
+        if commit is None:
+            commits = client.list_commits(project)
+            if not commits:
+                raise click.ClickException(f"Project {project} has no commits")
+            commit = commits[-1]["@id"]
+        elements = client.get_elements(project, commit)
+    return elements, commit
+
+
+@click.command("load-rdf")
+@click.argument("paths", nargs=-1, type=click.Path(exists=True))
+@click.option("--project", default=None, help="Load a server project instead of files.")
+@click.option("--commit", default=None, help="Commit to load (default: latest).")
+@click.option("--url", default=None, help="API server URL (default: from sysml.toml).")
+@click.option(
+    "--store",
+    default=None,
+    help="Graph Store Protocol endpoint (default: [server] store_url).",
+)
+@click.option(
+    "--graph", default=None, help="Named graph IRI (default: per file, or per project commit)."
+)
+@click.option(
+    "--chunk-bytes",
+    type=click.IntRange(min=1),
+    default=rdf.CHUNK_BYTES,
+    show_default=True,
+    help="Request body size.",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Requests in flight.",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.File("w"),
+    default=None,
+    help="Write N-Quads to a file ('-' for stdout) instead of posting them.",
+)
+def load_rdf(
+    paths: tuple[str, ...],
+    project: str | None,
+    commit: str | None,
+    url: str | None,
+    store: str | None,
+    graph: str | None,
+    chunk_bytes: int,
+    concurrency: int,
+    output: Any,
+) -> None:
+    """Stream models into the quad store as N-Quads.
+
+    PATHS are .sysml files, directories or .json element exports, each
+    file loaded into its own named graph (``urn:sysml:file:<path>``) unless
+    --graph is given; with --project, a server commit is loaded instead.
+    """
+    cfg = load_config()
+    if project is not None:
+        urls = [url] if url else list(cfg.server.urls or [cfg.server.url])
+        try:
+            elements, commit = _server_elements(urls, project, commit)
+        except httpx.HTTPError as exc:
+            console.print(f"[red]Error:[/red] {exc}")
+            sys.exit(1)
+        graph_name = f"<{graph}>" if graph else rdf.graph_iri(project, commit)
+        lines = rdf.element_quads(elements, graph_name)
+        target = f"graph {graph_name}"
+    elif paths:
+        lines = _file_quads(paths, f"<{graph}>" if graph else None)
+        target = f"graph <{graph}>" if graph else "one graph per file"
+    else:
+        raise click.UsageError("Give model PATHS or --project.")
+
+    if output is not None:
+        count = 0
+        for line in lines:
+            output.write(line)
+            count += 1
+        if output is not sys.stdout:
+            console.print(f"[green]✓[/green] Wrote {count} quad(s)")
+        return
+
+    store = store or cfg.server.store_url
+    console.print(f"Loading into {store} ({target})...")
+    chunks = rdf.chunk_lines(lines, chunk_bytes)
+    try:
+        first = next(chunks, None)
+        if first is None:
+            console.print("[yellow]No elements to load.[/yellow]")
+            return
+        result = rdf.load_quads(
+            itertools.chain([first], chunks), store, concurrency=concurrency
+        )
+    except httpx.HTTPError as exc:
+        console.print(f"[red]Error:[/red] {exc}")
+        sys.exit(1)
+
+    rate = result.quads / result.elapsed if result.elapsed > 0 else 0.0
+    console.print(
+        f"[green]✓[/green] Loaded {result.quads} quad(s) in {result.chunks} "
+        f"request(s), {result.elapsed:.1f}s ({rate:,.0f} quads/s)"
+    )
@@ -0,0 +1,56 @@
+"""``sysml pull`` — mirror a server project into a local SQLite store."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import click
+import httpx
+from rich.console import Console
+
+from sysml_v2.api.client import SysMLClient
+from sysml_v2.api.mirror import Mirror
+from sysml_v2.config import STATE_DIRNAME, load_config, state_dir
+
+console = Console()
+
+
+def default_mirror_path() -> Path:
+    """Return ``.sysml/mirror.db`` in the current project (or cwd)."""
+    return (state_dir() or Path(STATE_DIRNAME)) / "mirror.db"
+
+
+@click.command()
+@click.argument("project")
+@click.option("--url", default=None, help="API server URL (default: from sysml.toml).")
+@click.option(
+    "--db",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Mirror database (default: .sysml/mirror.db in the project).",
+)
+def pull(project: str, url: str | None, db: str | None) -> None:
+    """Mirror PROJECT's commits and elements for offline use.
+
+    Only commits that are not yet in the mirror are fetched.
+    """
+    cfg = load_config()
+    urls = [url] if url else list(cfg.server.urls or [cfg.server.url])
+    path = Path(db) if db else default_mirror_path()
+
+    console.print(f"Pulling project [bold]{project}[/bold] from {', '.join(urls)}...")
+    try:
+        with Mirror(path) as mirror, SysMLClient(urls=urls) as client:
+            result = mirror.pull(client, project)
+    except httpx.HTTPError as exc:
+        console.print(f"[red]Error:[/red] {exc}")
+        sys.exit(1)
+
+    if result.new_commits:
+        console.print(
+            f"[green]✓[/green] {result.new_commits} new commit(s), "
+            f"{result.elements} element(s) mirrored to {path}"
+        )
+    else:
+        console.print(f"[green]✓[/green] Already up to date ({path})")
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
 import sys
-import time
 from pathlib import Path
 
 import click
 import httpx
 from rich.console import Console
+from rich.table import Table
 
+from sysml_v2 import tracing
+from sysml_v2.api.bench import DEFAULT_MIX, parse_mix, resolve_target, run_bench
+from sysml_v2.api.client import SysMLClient
 from sysml_v2.config import BACKENDS, load_config
+from sysml_v2.readiness import Probe, ProbeResult, compose_probes, wait_ready
 
 console = Console()
 
@@ -53,29 +58,26 @@ def _find_compose_file(backend: str | None = None) -> Path | None:
 def _compose(args: list[str], compose_file: Path) -> int:
     """Run ``docker compose -f <file> <args>`` and return the exit code."""
     cmd = ["docker", "compose", "-f", str(compose_file), *args]
-    result = subprocess.run(cmd)
+    with tracing.span(f"docker compose {' '.join(args)}", cat="subprocess"):
+        result = subprocess.run(cmd)
     return result.returncode
 
 
-def _init_flexo_org(layer1_url: str = "http://localhost:8080") -> bool:
+def _init_flexo_org(layer1_url: str = "http://localhost:8080", wait: bool = True) -> bool:
     """Initialize the Flexo MMS org after first startup.
 
-    Waits for the layer1 service, then creates the ``sysmlv2`` org.
+    Waits for the layer1 service (unless *wait* is false because the caller
+    already knows it is up), then creates the ``sysmlv2`` org.
     This is idempotent — safe to call on every ``serve up``.
     """
-    # Wait for layer1 to be reachable
-    console.print("  Waiting for Flexo layer1 service...")
-    for attempt in range(30):
-        try:
-            resp = httpx.get(f"{layer1_url}/", timeout=2)
-            if resp.status_code < 500:
-                break
-        except httpx.ConnectError:
-            pass
-        time.sleep(2)
-    else:
-        console.print("[yellow]![/yellow] Layer1 service not reachable — org init skipped.")
-        return False
+    if wait:
+        console.print("  Waiting for Flexo layer1 service...")
+        (result,) = wait_ready([Probe("layer1-service", f"{layer1_url}/")], timeout=60)
+        if not result.ready:
+            console.print(
+                "[yellow]![/yellow] Layer1 service not reachable — org init skipped."
+            )
+            return False
 
     # Create the sysmlv2 org (idempotent PUT)
     console.print("  Initializing sysmlv2 org...")
@@ -118,9 +120,16 @@ def serve(ctx: click.Context, backend: str | None) -> None:
 
 
 @serve.command()
+@click.option(
+    "--timeout",
+    type=float,
+    default=90.0,
+    show_default=True,
+    help="Seconds to wait for services to become ready.",
+)
 @click.pass_context
-def up(ctx: click.Context) -> None:
-    """Start the API server."""
+def up(ctx: click.Context, timeout: float) -> None:
+    """Start the API server and wait until its services are ready."""
     compose_file = _find_compose_file(ctx.obj.get("backend"))
     if compose_file is None:
         console.print("[red]Error:[/red] No docker-compose file found.")
@@ -142,30 +151,36 @@ def up(ctx: click.Context) -> None:
     if rc != 0:
         sys.exit(rc)
 
-    # Flexo requires org initialization after first startup
-    if backend == "flexo":
-        _init_flexo_org()
+    # Probe every published service concurrently.  Flexo also needs its org
+    # initialized, which can start as soon as layer1 answers.
+    probes = compose_probes(compose_file)
+    org_started = False
 
-        # Confirm the SysML v2 API is responding
-        api_url = cfg.server.url
-        console.print(f"  Checking API at {api_url}...")
-        for attempt in range(15):
-            try:
-                resp = httpx.get(f"{api_url}/projects", timeout=3)
-                if resp.status_code < 500:
-                    console.print(
-                        f"[green]\u2713[/green] API server ready at {api_url}"
-                    )
-                    break
-            except httpx.ConnectError:
-                pass
-            time.sleep(2)
-        else:
+    def on_ready(result: ProbeResult) -> None:
+        nonlocal org_started
+        console.print(
+            f"[green]\u2713[/green] {result.name} ready in {result.elapsed:.2f}s"
+        )
+        if backend == "flexo" and result.name == "layer1-service":
+            org_started = True
+            _init_flexo_org(result.url.rstrip("/"), wait=False)
+
+    if probes:
+        console.print(f"  Waiting for {len(probes)} service(s)...")
+    results = wait_ready(probes, timeout=timeout, on_ready=on_ready)
+    for result in results:
+        if not result.ready:
             console.print(
-                f"[yellow]![/yellow] API not yet responding at {api_url} — "
-                "it may still be starting up"
+                f"[yellow]![/yellow] {result.name} not ready at {result.url} after "
+                f"{result.elapsed:.1f}s ({result.error}) — it may still be starting up"
             )
 
+    if backend == "flexo" and not org_started:
+        _init_flexo_org()
+
+    if results and all(result.ready for result in results):
+        console.print(f"[green]\u2713[/green] API server ready at {cfg.server.url}")
+
 
 @serve.command()
 @click.pass_context
@@ -224,3 +239,106 @@ def status(ctx: click.Context) -> None:
         )
     except httpx.ConnectError:
         console.print(f"[yellow]![/yellow] API server not reachable at {url}")
+
+
+@serve.command()
+@click.option("--url", default=None, help="API server URL (default: from sysml.toml).")
+@click.option("--project", default=None, help="Project ID (default: first project).")
+@click.option("--commit", default=None, help="Commit ID (default: latest commit).")
+@click.option(
+    "--concurrency", "-c", type=click.IntRange(min=1), default=4, show_default=True,
+    help="Number of concurrent clients.",
+)
+@click.option(
+    "--requests", "-n", type=click.IntRange(min=1), default=200, show_default=True,
+    help="Total number of requests to send.",
+)
+@click.option(
+    "--duration", type=click.FloatRange(min=0, min_open=True), default=None,
+    help="Run for this many seconds instead of a fixed request count.",
+)
+@click.option(
+    "--mix", default=DEFAULT_MIX, show_default=True,
+    help="Weighted request mix of projects, commits, elements and query.",
+)
+@click.option(
+    "--output", "-o", type=click.Path(dir_okay=False), default=None,
+    help="Write results as JSON to this file.",
+)
+@click.pass_context
+def bench(
+    ctx: click.Context,
+    url: str | None,
+    project: str | None,
+    commit: str | None,
+    concurrency: int,
+    requests: int,
+    duration: float | None,
+    mix: str,
+    output: str | None,
+) -> None:
+    """Benchmark the running API server.
+
+    Without --url, all ``[server] urls`` replicas from sysml.toml are used.
+    """
+    cfg = load_config()
+    urls = [url] if url else list(cfg.server.urls or [cfg.server.url])
+    url = urls[0]
+    try:
+        weights = parse_mix(mix)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="--mix") from None
+
+    if project is None or commit is None:
+        try:
+            with SysMLClient(urls=urls) as client:
+                default_project, default_commit = resolve_target(client)
+        except (httpx.HTTPError, LookupError) as exc:
+            console.print(f"[red]Error:[/red] Could not pick a benchmark target: {exc}")
+            console.print("  Pass --project and --commit explicitly.")
+            sys.exit(1)
+        project = project or default_project
+        commit = commit or default_commit
+
+    console.print(
+        f"Benchmarking [bold]{', '.join(urls)}[/bold] with {concurrency} client(s) "
+        f"({f'{duration:g}s' if duration else f'{requests} requests'})..."
+    )
+    results = run_bench(
+        lambda: SysMLClient(urls=urls),
+        project,
+        commit,
+        mix=weights,
+        concurrency=concurrency,
+        requests=None if duration else requests,
+        duration=duration,
+    )
+    compose_file = _find_compose_file(ctx.obj.get("backend"))
+    results = {
+        "url": url,
+        **({"replicas": urls} if len(urls) > 1 else {}),
+        "backend": ctx.obj.get("backend") or cfg.server.backend,
+        "compose_file": str(compose_file) if compose_file else None,
+        **results,
+    }
+
+    table = Table(title="Benchmark Results")
+    table.add_column("Operation")
+    for column in ("Requests", "Errors", "req/s", "p50 ms", "p90 ms", "p99 ms", "max ms"):
+        table.add_column(column, justify="right")
+    rows = [*results["operations"].items(), ("total", results)]
+    for name, stats in rows:
+        lat = stats["latency_ms"]
+        table.add_row(
+            name,
+            str(stats["requests"]),
+            str(stats["errors"]),
+            f"{stats['throughput_rps']:.1f}",
+            *(f"{lat[key]:.1f}" for key in ("p50", "p90", "p99", "max")),
+        )
+    with tracing.span("render", rows=len(rows)):
+        console.print(table)
+
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2) + "\n")
+        console.print(f"Results written to {output}")
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import os
+import re
+import subprocess
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import click
@@ -10,31 +15,229 @@ import httpx
 from rich.console import Console
 from rich.table import Table
 
-from sysml_v2.config import load_config
-from sysml_v2.parsing.loader import find_models, load
+from sysml_v2 import tracing
+from sysml_v2.config import load_config, project_dir, state_dir
+from sysml_v2.parsing.graph import DependencyGraph
+from sysml_v2.parsing.loader import find_models, iter_bytes, load, read_text
+from sysml_v2.parsing.scan import complete, outline
 
 console = Console()
 
 
-def _validate_local(files: list[Path]) -> list[tuple[Path, str]]:
-    """Parse each file with sysml2py. Return list of (path, error_message)."""
-    errors: list[tuple[Path, str]] = []
+# A lone file at least this large is parsed by top-level package in parallel.
+_SPLIT_BYTES = 256 * 1024
+
+
+def _check_file(path: Path, jobs: int = 1) -> str | None:
+    """Parse one file with sysml2py. Return the error message, or None."""
+    try:
+        load(path, jobs=jobs)
+    except Exception as exc:
+        return str(exc)
+    return None
+
+
+def _validate_local(files: list[Path], jobs: int = 1) -> list[tuple[Path, str]]:
+    """Parse each file with sysml2py. Return list of (path, error_message).
+
+    With *jobs* > 1 the files are parsed in a pool of worker processes,
+    or a single large file is split by top-level package across them.
+    """
+    if jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as pool:
+            results = list(pool.map(_check_file, files))
+    elif jobs > 1 and files and files[0].stat().st_size >= _SPLIT_BYTES:
+        results = [_check_file(files[0], jobs)]
+    else:
+        results = [_check_file(path) for path in files]
+    return [(path, msg) for path, msg in zip(files, results) if msg is not None]
+
+
+def _git(args: list[str], cwd: Path) -> str:
+    """Run a git command in *cwd* and return its stdout. Raise on failure."""
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, capture_output=True, text=True, check=False
+    )
+    if result.returncode != 0:
+        raise click.ClickException(result.stderr.strip() or f"git {args[0]} failed")
+    return result.stdout
+
+
+def _git_changes(ref: str, cwd: Path) -> tuple[set[Path], list[str]]:
+    """Return ``.sysml`` files changed since git *ref*, and deleted files' old text.
+
+    Changed files include committed, staged, unstaged and untracked changes,
+    as absolute paths.
+    """
+    root = Path(_git(["rev-parse", "--show-toplevel"], cwd).strip())
+    changed: set[Path] = set()
+    deleted: list[str] = []
+
+    fields = _git(["diff", "--name-status", "--no-renames", "-z", ref, "--"], cwd)
+    entries = fields.split("\0")
+    for status, name in zip(entries[0::2], entries[1::2]):
+        if not name.endswith(".sysml"):
+            continue
+        if status == "D":
+            deleted.append(_git(["show", f"{ref}:{name}"], root))
+        else:
+            changed.add((root / name).resolve())
+
+    untracked = _git(["ls-files", "--others", "--exclude-standard", "-z"], root)
+    for name in untracked.split("\0"):
+        if name.endswith(".sysml"):
+            changed.add((root / name).resolve())
+
+    return changed, deleted
+
+
+# Line numbers in server error messages, e.g. "line 12" or "input:12:5".
+_LINE_RE = re.compile(r"\bline[\s:=]+(\d+)|:(\d+):\d+", re.IGNORECASE)
+
+
+def _post(client: httpx.Client, files: list[Path]) -> tuple[str, int | None] | None:
+    """POST *files* concatenated as one ``/parse`` body.
+
+    Returns None if the server accepts the text, else the error message and
+    the line it refers to (if the server reported one).  Files are streamed
+    from disk; a newline is inserted after any file but the last that lacks
+    one, so each file starts on a fresh line.
+    """
+    sizes = [path.stat().st_size for path in files]
+    separators = _separators(files)
+
+    def body():
+        for path, sep in zip(files, separators):
+            yield from iter_bytes(path)
+            if sep:
+                yield b"\n"
+
+    headers = {
+        "Content-Type": "text/plain",
+        "Content-Length": str(sum(sizes) + sum(separators)),
+    }
+    resp = client.post("/parse", content=body(), headers=headers)
+    if resp.status_code == 200:
+        return None
+    data = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else {}
+    msg = data.get("error", data.get("message", f"HTTP {resp.status_code}"))
+    line = data.get("line")
+    if not isinstance(line, int):
+        match = _LINE_RE.search(str(msg))
+        line = int(match.group(1) or match.group(2)) if match else None
+    return str(msg), line
+
+
+def _separators(files: list[Path]) -> list[bool]:
+    """Whether a newline must follow each file when concatenating *files*."""
+    result = []
+    for path in files[:-1]:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                result.append(False)
+                continue
+            f.seek(-1, os.SEEK_END)
+            result.append(f.read(1) != b"\n")
+    return [*result, False] if files else []
+
+
+def _locate(files: list[Path], line: int) -> int | None:
+    """Index of the file containing *line* (1-based) of the files' concatenation."""
+    if line < 1:
+        return None
+    start = 1
+    for i, (path, sep) in enumerate(zip(files, _separators(files))):
+        newlines = sum(chunk.count(b"\n") for chunk in iter_bytes(path)) + sep
+        if line < start + newlines or i == len(files) - 1:
+            return i
+        start += newlines
+    return None
+
+
+def _complete(path: Path) -> bool:
+    """Whether *path* holds only whole top-level elements (see :func:`complete`)."""
+    try:
+        return complete(read_text(path))
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def _batches(files: list[Path], budget: int) -> list[list[Path]]:
+    """Group *files* in order into batches of at most *budget* bytes.
+
+    A file that leaves a block, comment or string open, or closes one it
+    did not open, gets a batch of its own: joined with its neighbours it
+    could be completed by them and pass.  Files larger than *budget* are
+    sent alone anyway and are not scanned.
+    """
+    batches: list[list[Path]] = []
+    size = 0
+    alone = False
     for path in files:
+        file_size = path.stat().st_size
+        whole = file_size <= budget and _complete(path)
+        if not batches or alone or not whole or size + file_size > budget:
+            batches.append([])
+            size = 0
+        batches[-1].append(path)
+        size += file_size
+        alone = not whole
+    return batches
+
+
+def _validate_batched(
+    client: httpx.Client, files: list[Path], budget: int
+) -> list[tuple[Path, str]]:
+    """Validate *files* in batches of up to *budget* bytes per request.
+
+    A passing batch passes all its files.  On an error the reported line
+    is mapped back to a file: earlier files passed, the culprit is checked
+    on its own (so cross-file clashes are not blamed on it) and the rest is
+    resubmitted.  Without a line number the batch is bisected.  Files that
+    are not lexically self-contained are always sent alone, so no file is
+    passed because its neighbours complete it.
+    """
+    errors: list[tuple[Path, str]] = []
+    queue = deque(_batches(files, budget))
+    while queue:
+        batch = queue.popleft()
         try:
-            load(path)
+            failure = _post(client, batch)
+        except httpx.ConnectError:
+            raise
         except Exception as exc:
-            errors.append((path, str(exc)))
+            failure = (str(exc), None)
+        if failure is None:
+            continue
+        msg, line = failure
+        if len(batch) == 1:
+            errors.append((batch[0], msg))
+            continue
+        index = _locate(batch, line) if line is not None else None
+        if index is None:
+            mid = len(batch) // 2
+            queue.extendleft([batch[mid:], batch[:mid]])
+            continue
+        rest = batch[index + 1 :]
+        if rest:
+            queue.appendleft(rest)
+        queue.appendleft([batch[index]])
     return errors
 
 
-def _validate_server(files: list[Path], server_url: str) -> list[tuple[Path, str]]:
+def _validate_server(
+    files: list[Path], server_url: str, batch_bytes: int = 0
+) -> list[tuple[Path, str]]:
     """POST file contents to a Gearshift ``/parse`` endpoint for validation.
 
-    Falls back gracefully if the server is unreachable.
+    With *batch_bytes* > 0, many files are sent per request (see
+    :func:`_validate_batched`).  Falls back gracefully if the server is
+    unreachable.
     """
     errors: list[tuple[Path, str]] = []
     try:
-        client = httpx.Client(base_url=server_url, timeout=10)
+        client = httpx.Client(base_url=server_url, timeout=10, **tracing.client_options())
     except Exception:
         console.print(
             "[yellow]![/yellow] Could not connect to server. "
@@ -42,14 +245,23 @@ def _validate_server(files: list[Path], server_url: str) -> list[tuple[Path, str
         )
         return _validate_local(files)
 
+    if batch_bytes > 0:
+        try:
+            return _validate_batched(client, files, batch_bytes)
+        except httpx.ConnectError:
+            console.print(
+                "[yellow]![/yellow] Server unreachable. "
+                "Falling back to local validation."
+            )
+            return _validate_local(files)
+        finally:
+            client.close()
+
     for path in files:
-        content = path.read_text()
         try:
-            resp = client.post("/parse", content=content, headers={"Content-Type": "text/plain"})
-            if resp.status_code != 200:
-                data = resp.json() if resp.headers.get("content-type", "").startswith("application/json") else {}
-                msg = data.get("error", data.get("message", f"HTTP {resp.status_code}"))
-                errors.append((path, msg))
+            failure = _post(client, [path])
+            if failure is not None:
+                errors.append((path, failure[0]))
         except httpx.ConnectError:
             console.print(
                 "[yellow]![/yellow] Server unreachable. "
@@ -76,7 +288,32 @@ def _validate_server(files: list[Path], server_url: str) -> list[tuple[Path, str
     default=False,
     help="Validate via a running Gearshift server (deeper analysis).",
 )
-def validate(path: str, server: bool) -> None:
+@click.option(
+    "--changed-since",
+    metavar="REF",
+    default=None,
+    help="Only validate files changed since a git ref, plus files that depend on them.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parallel parser processes (default: CPU count).",
+)
+@click.option(
+    "--batch-bytes",
+    type=click.IntRange(min=0),
+    default=None,
+    help="With --server, pack files into requests of up to this many bytes (0: one per file).",
+)
+def validate(
+    path: str,
+    server: bool,
+    changed_since: str | None,
+    jobs: int | None,
+    batch_bytes: int | None,
+) -> None:
     """Validate SysML v2 model files.
 
     PATH can be a file or directory (default: models/).
@@ -85,20 +322,58 @@ def validate(path: str, server: bool) -> None:
     if target.is_file():
         files = [target]
     else:
-        files = find_models(target)
+        state = state_dir()
+        files = find_models(
+            target,
+            exclude=load_config().validate.exclude,
+            # Patterns in sysml.toml are relative to the project, not to PATH.
+            exclude_base=project_dir(),
+            cache=state / "discovery.json" if state is not None else None,
+        )
 
     if not files:
         console.print("[yellow]No .sysml files found.[/yellow]")
         sys.exit(0)
 
-    console.print(f"Validating {len(files)} file(s)...")
+    if changed_since is None:
+        levels = [files]
+        console.print(f"Validating {len(files)} file(s)...")
+    else:
+        with tracing.span("dependency graph", files=len(files)):
+            graph = DependencyGraph.build(files)
+        cwd = target if target.is_dir() else target.parent
+        with tracing.span("git diff", ref=changed_since):
+            changed, deleted = _git_changes(changed_since, cwd)
+        seeds = {f for f in files if f.resolve() in changed}
+        for text in deleted:
+            seeds |= graph.referencing(outline(text).packages)
+        levels = graph.levels(graph.impacted(seeds))
+        selected = sum(len(level) for level in levels)
+        if not selected:
+            console.print(
+                f"[green]No changes since {changed_since} affect "
+                f"{len(files)} file(s).[/green]"
+            )
+            sys.exit(0)
+        console.print(
+            f"Validating {selected} of {len(files)} file(s) "
+            f"affected by changes since {changed_since}..."
+        )
+        files = [f for level in levels for f in level]
 
     mode = "server" if server else load_config().validate.mode
     if mode == "server":
         cfg = load_config()
-        errors = _validate_server(files, cfg.server.url)
+        if batch_bytes is None:
+            batch_bytes = cfg.validate.batch_bytes
+        errors = _validate_server(files, cfg.server.url, batch_bytes)
     else:
-        errors = _validate_local(files)
+        # Levels are in dependency order; files within a level run in parallel.
+        jobs = jobs or os.cpu_count() or 1
+        errors = []
+        for level in levels:
+            with tracing.span("validate level", files=len(level), jobs=jobs):
+                errors.extend(_validate_local(level, jobs))
 
     # Report results
     passed = len(files) - len(errors)
@@ -109,7 +384,8 @@ def validate(path: str, server: bool) -> None:
         table.add_column("Error")
         for file_path, msg in errors:
             table.add_row(str(file_path), msg)
-        console.print(table)
+        with tracing.span("render", rows=len(errors)):
+            console.print(table)
 
     console.print()
     console.print(
@@ -6,8 +6,13 @@ import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from sysml_v2 import tracing
+
 CONFIG_FILENAME = "sysml.toml"
 
+# Per-project directory for caches and local state (next to sysml.toml)
+STATE_DIRNAME = ".sysml"
+
 # Backends supported by ``sysml serve``
 BACKENDS = ("flexo", "gearshift")
 
@@ -16,6 +21,10 @@ BACKENDS = ("flexo", "gearshift")
 class ServerConfig:
     backend: str = "flexo"
     url: str = "http://localhost:8083"
+    # API replicas to balance requests across (the first one takes writes)
+    urls: tuple[str, ...] = ()
+    # Graph Store Protocol endpoint of the Flexo quad store (for bulk loads)
+    store_url: str = "http://localhost:3030/ds/data"
 
 
 @dataclass(frozen=True)
@@ -26,6 +35,8 @@ class LibraryConfig:
 @dataclass(frozen=True)
 class ValidateConfig:
     mode: str = "local"
+    exclude: tuple[str, ...] = ()
+    batch_bytes: int = 0
 
 
 @dataclass(frozen=True)
@@ -45,28 +56,64 @@ def find_config(start: Path | None = None) -> Path | None:
     return None
 
 
+def project_dir(start: Path | None = None) -> Path | None:
+    """Return the directory holding ``sysml.toml``, or None outside a project."""
+    path = find_config(start)
+    return path.parent if path is not None else None
+
+
+def state_dir(start: Path | None = None) -> Path | None:
+    """Return the project's ``.sysml`` state directory, or None outside a project."""
+    root = project_dir(start)
+    return root / STATE_DIRNAME if root is not None else None
+
+
+def _string_list(table: dict, section: str, key: str, path: Path) -> tuple[str, ...]:
+    """``[section] key`` as a tuple; raises ``ValueError`` unless a list of strings."""
+    value = table.get(key, [])
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"{path}: [{section}] {key} must be a list of strings, got {value!r}")
+    return tuple(value)
+
+
+def _non_negative_int(table: dict, section: str, key: str, path: Path) -> int:
+    """``[section] key`` as an int; raises ``ValueError`` unless a non-negative integer."""
+    value = table.get(key, 0)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"{path}: [{section}] {key} must be a non-negative integer, got {value!r}")
+    return value
+
+
 def load_config(start: Path | None = None) -> ProjectConfig:
-    """Load project config from the nearest ``sysml.toml``, or return defaults."""
+    """Load project config from the nearest ``sysml.toml``, or return defaults.
+
+    Raises ``ValueError`` if a list or size setting has the wrong type.
+    """
     path = find_config(start)
     if path is None:
         return ProjectConfig()
 
-    with open(path, "rb") as f:
+    with tracing.span("load config", path=str(path)), open(path, "rb") as f:
         raw = tomllib.load(f)
 
     server_raw = raw.get("server", {})
+    urls = _string_list(server_raw, "server", "urls", path)
     library_raw = raw.get("library", {})
     validate_raw = raw.get("validate", {})
 
     return ProjectConfig(
         server=ServerConfig(
             backend=server_raw.get("backend", "flexo"),
-            url=server_raw.get("url", "http://localhost:8083"),
+            url=server_raw.get("url", urls[0] if urls else "http://localhost:8083"),
+            urls=urls,
+            store_url=server_raw.get("store_url", "http://localhost:3030/ds/data"),
         ),
         library=LibraryConfig(
             path=library_raw.get("path", "lib/SysML-v2-Release"),
         ),
         validate=ValidateConfig(
             mode=validate_raw.get("mode", "local"),
+            exclude=_string_list(validate_raw, "validate", "exclude", path),
+            batch_bytes=_non_negative_int(validate_raw, "validate", "batch_bytes", path),
         ),
     )
@@ -0,0 +1,173 @@
+"""User-level cache of the SysML v2 standard library.
+
+Each release of ``SysML-v2-Release`` is cloned once into the cache and
+then materialized into projects without network access: files are
+reflinked (copy-on-write) where the filesystem supports it, hardlinked
+where it does not, and copied as a last resort.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import secrets
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from sysml_v2 import tracing
+
+RELEASE_REPO = "https://github.com/Systems-Modeling/SysML-v2-Release.git"
+
+# Branch or tag checked out when no release is given.
+DEFAULT_RELEASE = "master"
+
+# ioctl request number for FICLONE on Linux (``_IOW(0x94, 9, int)``).
+_FICLONE = 0x40049409
+
+
+def cache_dir() -> Path:
+    """Return the library cache root.
+
+    ``$SYSML_CACHE_DIR`` if set, else ``$XDG_CACHE_HOME/sysml-v2``, else
+    ``~/.cache/sysml-v2``.
+    """
+    if os.environ.get("SYSML_CACHE_DIR"):
+        return Path(os.environ["SYSML_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "sysml-v2"
+
+
+def release_url() -> str:
+    """Return the repository URL to fetch from (``$SYSML_LIBRARY_URL`` overrides)."""
+    return os.environ.get("SYSML_LIBRARY_URL") or RELEASE_REPO
+
+
+def _release_dir(release: str) -> Path:
+    """Cache directory of *release*; raises ``ValueError`` for unsafe names."""
+    if not release or "/" in release or "\\" in release or ".." in release:
+        raise ValueError(f"Invalid release name {release!r}")
+    return cache_dir() / "SysML-v2-Release" / release
+
+
+def cached_release(release: str = DEFAULT_RELEASE) -> Path | None:
+    """Return the cached checkout of *release*, or None if not fetched yet."""
+    path = _release_dir(release)
+    return path if path.is_dir() else None
+
+
+def fetch(release: str = DEFAULT_RELEASE, *, url: str | None = None, refresh: bool = False) -> Path:
+    """Return the cached checkout of *release*, cloning it on first use.
+
+    A cached checkout is kept until *refresh* is true, which re-clones it;
+    use that to pick up new commits on a branch such as ``master``.  The
+    clone goes to a temporary directory that is renamed into place, so
+    concurrent fetches never see a partial checkout.  Raises
+    ``ValueError`` for release names that are not a single path component
+    and ``RuntimeError`` if the clone fails.
+    """
+    target = _release_dir(release)
+    if target.is_dir() and not refresh:
+        return target
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(prefix=f".{release}-", dir=target.parent))
+    old = None
+    try:
+        cmd = ["git", "clone", "--depth", "1", "--branch", release, url or release_url(), str(tmp)]
+        with tracing.span("git clone", cat="subprocess", release=release):
+            result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"git clone of {release} failed")
+        shutil.rmtree(tmp / ".git")
+        # Cached files are shared with projects via hardlinks; keep them read-only.
+        for root, _, files in os.walk(tmp):
+            for name in files:
+                path = os.path.join(root, name)
+                os.chmod(path, os.stat(path).st_mode & ~0o222)
+        if refresh and target.is_dir():
+            # Projects keep their links to the old files; only the cache moves on.
+            old = Path(tempfile.mkdtemp(prefix=f".{release}-old-", dir=target.parent))
+            os.replace(target, old / release)
+        try:
+            tmp.rename(target)
+        except OSError:
+            if not target.is_dir():
+                raise
+            # Another process finished the same fetch first.
+    finally:
+        for leftover in (tmp, old):
+            if leftover is not None and leftover.exists():
+                shutil.rmtree(leftover)
+    return target
+
+
+def _reflink(src: str, dst: str) -> None:
+    import fcntl
+
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            os.unlink(dst)
+            raise
+
+
+def materialize(source: str | Path, dest: str | Path) -> str:
+    """Populate *dest* with the files of *source* without copying data if possible.
+
+    Returns the method used: ``"reflink"``, ``"hardlink"`` or ``"copy"``.
+    The first method that fails for a file is not tried again for the
+    remaining files.  The files are gathered in a temporary sibling of
+    *dest* that is renamed into place, so a failure never leaves a partial
+    *dest* behind; *dest* must not exist or be an empty directory.
+    """
+    source, dest = Path(source), Path(dest)
+    methods = ["reflink", "hardlink", "copy"] if sys.platform == "linux" else ["hardlink", "copy"]
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}-{secrets.token_hex(4)}")
+    tmp.mkdir()
+    try:
+        for root, dirs, files in os.walk(source):
+            out = tmp / os.path.relpath(root, source)
+            for name in dirs:
+                (out / name).mkdir(exist_ok=True)
+            for name in files:
+                src, dst = os.path.join(root, name), str(out / name)
+                while True:
+                    method = methods[0]
+                    try:
+                        if method == "reflink":
+                            _reflink(src, dst)
+                        elif method == "hardlink":
+                            os.link(src, dst)
+                        else:
+                            shutil.copy2(src, dst)
+                        break
+                    except OSError as exc:
+                        if method == "copy" or exc.errno == errno.EEXIST:
+                            raise
+                        methods.pop(0)
+        os.replace(tmp, dest)
+    finally:
+        if tmp.exists():
+            shutil.rmtree(tmp)
+    return methods[0]
+
+
+def install(
+    dest: str | Path,
+    release: str = DEFAULT_RELEASE,
+    *,
+    url: str | None = None,
+    refresh: bool = False,
+) -> str:
+    """Materialize *release* of the standard library at *dest*, fetching it if needed.
+
+    *refresh* re-fetches a cached release (see :func:`fetch`).  Returns the
+    method used (see :func:`materialize`).
+    """
+    return materialize(fetch(release, url=url, refresh=refresh), dest)
@@ -1,5 +1,6 @@
 """SysML v2 model parsing utilities."""
 
+from sysml_v2.parsing.graph import DependencyGraph
 from sysml_v2.parsing.loader import find_models, load, loads
 
-__all__ = ["find_models", "load", "loads"]
+__all__ = ["DependencyGraph", "find_models", "load", "loads"]
@@ -0,0 +1,256 @@
+"""Concurrent ``.sysml`` file discovery with ignore rules and a listing cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+_CACHE_VERSION = 2
+
+# Coarsest directory mtime resolution to allow for (FAT stores even
+# seconds; some network file systems whole seconds).
+_MTIME_RESOLUTION_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class _Rule:
+    base: str  # directory the rule is relative to, as a posix path ("" for root)
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob (without leading ``!`` / trailing ``/``) to a regex."""
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+    out = [] if anchored else ["(?:.*/)?"]
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 1 :]:
+            end = pattern.index("]", i + 1)
+            body = pattern[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out) + r"\Z"
+
+
+def parse_rules(lines: Iterable[str], base: str = "") -> list[_Rule]:
+    """Parse gitignore-style *lines* into rules relative to *base*."""
+    rules: list[_Rule] = []
+    for line in lines:
+        line = line.rstrip("\n")
+        if not line.strip() or line.startswith("#"):
+            continue
+        line = line.rstrip(" ")
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        rules.append(_Rule(base, re.compile(_translate(line)), negate, dir_only))
+    return rules
+
+
+def is_ignored(rules: list[_Rule], rel: str, is_dir: bool) -> bool:
+    """Return True if posix path *rel* is ignored by *rules* (last match wins)."""
+    ignored = False
+    for rule in rules:
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.base:
+            if not rel.startswith(rule.base + "/"):
+                continue
+            sub = rel[len(rule.base) + 1 :]
+        else:
+            sub = rel
+        if rule.regex.match(sub):
+            ignored = not rule.negate
+    return ignored
+
+
+def _git_root(directory: Path) -> Path | None:
+    for candidate in (directory, *directory.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return None
+
+
+def _read_rules(path: Path, base: str) -> list[_Rule]:
+    try:
+        return parse_rules(path.read_text().splitlines(), base)
+    except OSError:
+        return []
+
+
+class _ListingCache:
+    """Directory listings keyed by path and validated by directory stat.
+
+    A directory's mtime and ctime change whenever entries are added, removed
+    or renamed in it, and its inode changes if it is replaced, so matching
+    values mean the cached listing is current.  On file systems with coarse
+    timestamps a change in the same tick as the listing leaves them equal,
+    so listings taken within that resolution of the mtime are not trusted.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.entries: dict[str, list] = {}
+        self.used: dict[str, list] = {}
+        self.dirty = False
+        if path is not None and path.is_file():
+            try:
+                data = json.loads(path.read_text())
+                if data.get("version") == _CACHE_VERSION:
+                    self.entries = data["dirs"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+    def listing(self, directory: str) -> tuple[list[str], list[str], bool]:
+        """Return (subdirectories, .sysml files, has .gitignore) for *directory*."""
+        try:
+            st = os.stat(directory)
+        except OSError:
+            return [], [], False
+        stamp = [st.st_mtime_ns, st.st_ctime_ns, st.st_ino]
+        cached = self.entries.get(directory)
+        if cached is not None and cached[0] == stamp:
+            self.used[directory] = cached
+            return cached[1], cached[2], cached[3]
+
+        listed = time.time_ns()
+        dirs: list[str] = []
+        files: list[str] = []
+        has_gitignore = False
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != ".git":
+                            dirs.append(entry.name)
+                    elif entry.name.endswith(".sysml"):
+                        files.append(entry.name)
+                    elif entry.name == ".gitignore":
+                        has_gitignore = True
+        except OSError:
+            return [], [], False
+        # An entry added in the mtime's tick after the stat would go unseen,
+        # so a listing that recent is stored without a stamp to match.
+        if st.st_mtime_ns + _MTIME_RESOLUTION_NS >= listed:
+            stamp = None
+        self.used[directory] = [stamp, dirs, files, has_gitignore]
+        self.dirty = True
+        return dirs, files, has_gitignore
+
+    def save(self, root: str) -> None:
+        """Store the listings used in a walk of *root*, keeping other subtrees.
+
+        Cached directories under *root* that the walk did not reach (deleted
+        or now ignored) are dropped.
+        """
+        if self.path is None:
+            return
+        inside = root.rstrip(os.sep) + os.sep
+        dirs = {
+            d: entry
+            for d, entry in self.entries.items()
+            if d != root and not d.startswith(inside)
+        }
+        dirs.update(self.used)
+        if not self.dirty and dirs.keys() == self.entries.keys():
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": _CACHE_VERSION, "dirs": dirs}))
+        os.replace(tmp, self.path)
+
+
+def _rel(path: Path, anchor: Path) -> str:
+    """Posix path of *path* relative to *anchor* ("" for the anchor itself)."""
+    return path.relative_to(anchor).as_posix() if path != anchor else ""
+
+
+def discover(
+    directory: Path,
+    *,
+    exclude: Iterable[str] = (),
+    exclude_base: Path | None = None,
+    gitignore: bool = True,
+    cache: Path | None = None,
+    workers: int | None = None,
+) -> list[Path]:
+    """Find ``.sysml`` files under *directory*; see :func:`~sysml_v2.parsing.find_models`."""
+    root = directory.resolve()
+    git_root = _git_root(root) if gitignore else None
+    anchor = git_root or root
+    base_dir = exclude_base.resolve() if exclude_base is not None else root
+    if anchor.is_relative_to(base_dir):
+        # Rule bases are relative to the anchor, so it must contain base_dir.
+        anchor = base_dir
+    prefix = _rel(root, anchor)
+
+    rules: list[_Rule] = []
+    if base_dir.is_relative_to(anchor):
+        # Otherwise the patterns are anchored outside the walk and match nothing.
+        rules = parse_rules(exclude, _rel(base_dir, anchor))
+    if git_root is not None:
+        # Repository-wide excludes, then ignore files in the ancestors of
+        # *directory* up to the repository root.
+        git_base = _rel(git_root, anchor)
+        rules = _read_rules(git_root / ".git" / "info" / "exclude", git_base) + rules
+        parts = root.relative_to(git_root).parts
+        for depth in range(len(parts)):
+            base = "/".join([git_base, *parts[:depth]] if git_base else parts[:depth])
+            rules += _read_rules(git_root.joinpath(*parts[:depth], ".gitignore"), base)
+
+    listings = _ListingCache(cache)
+    found: list[str] = []
+    # Breadth-first walk; each level's directories are listed concurrently.
+    frontier: list[tuple[str, list[_Rule]]] = [(prefix, rules)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while frontier:
+            paths = [str(anchor / rel) if rel else str(anchor) for rel, _ in frontier]
+            results = pool.map(listings.listing, paths)
+            next_frontier: list[tuple[str, list[_Rule]]] = []
+            for (rel, inherited), (dirs, files, has_gitignore) in zip(frontier, results):
+                scoped = inherited
+                if gitignore and has_gitignore:
+                    scoped = inherited + _read_rules(anchor / rel / ".gitignore", rel)
+                for name in files:
+                    child = f"{rel}/{name}" if rel else name
+                    if not is_ignored(scoped, child, is_dir=False):
+                        found.append(child)
+                for name in dirs:
+                    child = f"{rel}/{name}" if rel else name
+                    if not is_ignored(scoped, child, is_dir=True):
+                        next_frontier.append((child, scoped))
+            frontier = next_frontier
+    listings.save(str(root))
+
+    offset = len(prefix) + 1 if prefix else 0
+    return sorted(directory / rel[offset:] for rel in found)
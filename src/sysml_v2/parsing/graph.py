@@ -0,0 +1,138 @@
+"""File-level dependency graph built from package imports and qualified references."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from sysml_v2.parsing.loader import read_text
+from sysml_v2.parsing.scan import Outline, outline
+
+
+def _resolve(name: str, scope: str, namespaces: dict[str, set[Path]]) -> set[Path]:
+    """Resolve a (possibly relative) qualified *name* seen inside *scope*.
+
+    Tries every enclosing scope from the innermost outwards and returns the
+    files declaring the longest matching namespace prefix, if any.
+    """
+    name = name.removesuffix("::**").removesuffix("::*")
+    parts = name.split("::")
+    outer = scope.split("::") if scope else []
+    for depth in range(len(outer), -1, -1):
+        prefix = outer[:depth]
+        for end in range(len(parts), 0, -1):
+            candidate = "::".join(prefix + parts[:end])
+            if candidate in namespaces:
+                return namespaces[candidate]
+    return set()
+
+
+def _scan(path: Path) -> Outline:
+    try:
+        return outline(read_text(path))
+    except UnicodeDecodeError:
+        # Declares nothing that can be resolved; validation reports the file.
+        return Outline()
+
+
+class DependencyGraph:
+    """Dependencies between ``.sysml`` files.
+
+    File A depends on file B when A imports, or refers by qualified name to,
+    a package declared in B.  A package split across several files makes A
+    depend on each of them.  References that do not resolve to any of the
+    given files (e.g. the standard library) are ignored.
+
+    Usage::
+
+        graph = DependencyGraph.build(find_models("models"))
+        graph.impacted([Path("models/vehicle.sysml")])
+    """
+
+    def __init__(self, files: Iterable[Path], outlines: dict[Path, Outline]) -> None:
+        self.files: list[Path] = list(files)
+        self.outlines = outlines
+        self.dependencies: dict[Path, set[Path]] = {f: set() for f in self.files}
+        self.dependents: dict[Path, set[Path]] = {f: set() for f in self.files}
+
+        # Qualified namespace name -> declaring files.  A package may be
+        # re-opened in several files; a reference depends on all of them.
+        self.namespaces: dict[str, set[Path]] = {}
+        for path in self.files:
+            for pkg in outlines[path].packages:
+                self.namespaces.setdefault(pkg, set()).add(path)
+
+        for path in self.files:
+            info = outlines[path]
+            for scope, name in [*info.imports, *info.references]:
+                for target in _resolve(name, scope, self.namespaces) - {path}:
+                    self.dependencies[path].add(target)
+                    self.dependents[target].add(path)
+
+    @classmethod
+    def build(cls, files: Iterable[Path]) -> DependencyGraph:
+        """Scan *files* and build their dependency graph."""
+        files = list(files)
+        outlines = {path: _scan(path) for path in files}
+        return cls(files, outlines)
+
+    def referencing(self, packages: Iterable[str]) -> set[Path]:
+        """Return files that import or refer to any of the given packages.
+
+        Useful for deleted files, whose packages are no longer declared by
+        any file in the graph and are known only from history.
+        """
+        marker = Path()
+        namespaces = {pkg: {marker} for pkg in packages}
+        hits: set[Path] = set()
+        for path in self.files:
+            info = self.outlines[path]
+            for scope, name in [*info.imports, *info.references]:
+                if marker in _resolve(name, scope, namespaces):
+                    hits.add(path)
+                    break
+        return hits
+
+    def impacted(self, changed: Iterable[Path]) -> set[Path]:
+        """Return *changed* files plus all of their transitive dependents."""
+        seen: set[Path] = set()
+        stack = [p for p in changed if p in self.dependents]
+        while stack:
+            path = stack.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            stack.extend(self.dependents[path] - seen)
+        return seen
+
+    def levels(self, subset: Iterable[Path] | None = None) -> list[list[Path]]:
+        """Group files into topologically ordered levels.
+
+        Every file appears after the files it depends on; files within one
+        level are independent of each other and can be processed in
+        parallel.  Only dependencies inside *subset* are considered.  Files in
+        or downstream of an import cycle are placed together in a final level.
+        """
+        nodes = set(self.files if subset is None else subset)
+        remaining = {n: len(self.dependencies.get(n, set()) & nodes) for n in nodes}
+        result: list[list[Path]] = []
+        ready = sorted(n for n, count in remaining.items() if count == 0)
+        while ready:
+            result.append(ready)
+            for n in ready:
+                del remaining[n]
+            next_ready = set()
+            for n in ready:
+                for dependent in self.dependents.get(n, set()):
+                    if dependent in remaining:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            next_ready.add(dependent)
+            ready = sorted(next_ready)
+        if remaining:
+            result.append(sorted(remaining))
+        return result
+
+    def order(self, subset: Iterable[Path] | None = None) -> list[Path]:
+        """Return files in dependency-first (topological) order."""
+        return [path for level in self.levels(subset) for path in level]
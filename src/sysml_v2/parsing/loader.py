@@ -2,35 +2,104 @@
 
 from __future__ import annotations
 
+import mmap
+import os
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
+from sysml_v2 import tracing
+from sysml_v2.parsing.discovery import discover
 
-def find_models(directory: str | Path) -> list[Path]:
-    """Recursively find all ``.sysml`` files under *directory*."""
+# Chunk size for streaming model files (e.g. into HTTP request bodies).
+CHUNK_SIZE = 1 << 20
+
+
+def find_models(
+    directory: str | Path,
+    *,
+    exclude: Iterable[str] = (),
+    exclude_base: str | Path | None = None,
+    gitignore: bool = True,
+    cache: str | Path | None = None,
+) -> list[Path]:
+    """Recursively find all ``.sysml`` files under *directory*.
+
+    Directories are listed concurrently with ``os.scandir``.  Paths matching
+    *exclude* (gitignore-style patterns relative to *exclude_base*, by default
+    *directory*) are skipped, as are paths ignored by ``.gitignore`` files
+    when *gitignore* is true.
+    If *cache* names a file, directory listings are stored there and reused
+    on later calls for directories that have not changed since.
+    """
     directory = Path(directory)
     if not directory.is_dir():
         return []
-    return sorted(directory.rglob("*.sysml"))
+    with tracing.span("discover", directory=str(directory)):
+        return discover(
+            directory,
+            exclude=exclude,
+            exclude_base=Path(exclude_base) if exclude_base is not None else None,
+            gitignore=gitignore,
+            cache=Path(cache) if cache is not None else None,
+        )
 
 
-def load(path: str | Path) -> Any:
-    """Load a ``.sysml`` file and return the parsed model.
+def read_text(path: str | Path) -> str:
+    """Read a UTF-8 model file into a ``str`` via a read-only memory map.
 
-    Uses sysml2py's grammar-based parser. Raises on parse errors.
+    The file bytes stay in the page cache instead of being copied into a
+    Python ``bytes`` object first, so peak memory is close to the size of
+    the decoded text alone.  Line endings are normalized to ``\n`` as in
+    text mode.  Raises :class:`UnicodeDecodeError` if the file is not UTF-8.
     """
-    import sysml2py
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped.
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
 
-    path = Path(path)
-    text = path.read_text()
-    return sysml2py.loads(text)
+def iter_bytes(path: str | Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the raw contents of *path* in chunks of at most *chunk_size* bytes."""
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
 
 
-def loads(text: str) -> Any:
+def load(path: str | Path, *, jobs: int = 1) -> Any:
+    """Load a ``.sysml`` file and return the parsed model.
+
+    Uses sysml2py's grammar-based parser. Raises on parse errors.  With
+    *jobs* > 1, a file with several top-level packages is split and the
+    packages are parsed in that many worker processes (see :func:`loads`).
+    """
+    with tracing.span("read", path=str(path)):
+        text = read_text(path)
+    return loads(text, jobs=jobs)
+
+
+def loads(text: str, *, jobs: int = 1) -> Any:
     """Parse a SysML v2 model from a string.
 
-    Uses sysml2py's grammar-based parser. Raises on parse errors.
+    Uses sysml2py's grammar-based parser. Raises on parse errors.  With
+    *jobs* > 1 the text is split at top-level element boundaries and the
+    pieces are parsed in parallel worker processes, then merged; syntax
+    error line numbers still refer to the whole text.  Worth it only for
+    large texts, since each worker pays the sysml2py import cost.
     """
-    import sysml2py
+    if jobs > 1:
+        from sysml_v2.parsing.split import parse_parallel
+
+        with tracing.span("parse", chars=len(text), jobs=jobs):
+            return parse_parallel(text, jobs)
+
+    with tracing.span("import sysml2py"):
+        import sysml2py
 
-    return sysml2py.loads(text)
+    with tracing.span("parse", chars=len(text)):
+        return sysml2py.loads(text)
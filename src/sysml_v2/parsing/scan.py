@@ -0,0 +1,191 @@
+"""Cheap lexical scanning of SysML v2 text.
+
+This is not a parser: it tokenizes just enough of the textual notation
+(names, qualified names, braces, comments and strings) to recover the
+namespace outline of a file without invoking sysml2py.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Iterator
+
+_NAME = r"(?:'(?:[^'\\]|\\.)*'|[A-Za-z_][A-Za-z0-9_]*)"
+
+_TOKEN_RE = re.compile(
+    rf"""
+    (?P<note>//\*.*?\*/|//(?!\*)[^\n]*)                # notes are not model elements
+    |(?P<comment>/\*.*?\*/)                            # comments (doc bodies, etc.)
+    |(?P<unclosed>//?\*.*)                             # note or comment open at the end
+    |(?P<string>"(?:[^"\\]|\\.)*")
+    |(?P<name>{_NAME}(?:\s*::\s*(?:{_NAME}|\*\*?))*)   # simple or qualified name
+    |(?P<punct>[{{}};])
+    |(?P<space>\s+)
+    |(?P<other>.)
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# Keywords that introduce a named declaration.
+DECLARATION_KEYWORDS = frozenset(
+    {
+        "action", "allocation", "analysis", "attribute", "calc", "case",
+        "concern", "connection", "constraint", "enum", "flow", "interface",
+        "item", "metadata", "occurrence", "package", "part", "port",
+        "rendering", "requirement", "state", "subject", "use", "verification",
+        "view", "viewpoint",
+    }
+)
+
+_KEYWORDS = DECLARATION_KEYWORDS | {
+    "abstract", "alias", "by", "def", "doc", "import", "in", "inout",
+    "library", "out", "private", "protected", "public", "ref", "satisfy",
+    "standard", "variation",
+}
+
+
+@dataclass(frozen=True)
+class Token:
+    kind: str
+    value: str
+    line: int
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class Declaration:
+    keyword: str
+    name: str
+    qualified_name: str
+    line: int
+
+
+@dataclass
+class Outline:
+    """Namespace outline of one SysML v2 text."""
+
+    declarations: list[Declaration] = field(default_factory=list)
+    # (enclosing scope, imported qualified name) pairs, e.g. ("A", "B::*")
+    imports: list[tuple[str, str]] = field(default_factory=list)
+    # (enclosing scope, qualified name) pairs for ``X::Y`` references
+    references: list[tuple[str, str]] = field(default_factory=list)
+    # (documented element's qualified name, text) pairs for ``doc /* ... */``
+    docs: list[tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def packages(self) -> list[str]:
+        """Qualified names of all packages declared in the text."""
+        return [d.qualified_name for d in self.declarations if d.keyword == "package"]
+
+
+def _normalize(name: str) -> str:
+    """Strip whitespace around ``::`` and quotes from unrestricted names."""
+    parts = [p.strip() for p in name.split("::")]
+    return "::".join(p[1:-1] if p.startswith("'") else p for p in parts)
+
+
+def _comment_text(comment: str) -> str:
+    """Body of a ``/* ... */`` comment without delimiters or leading ``*``."""
+    lines = comment[2:-2].splitlines()
+    return "\n".join(line.strip().removeprefix("*").strip() for line in lines).strip()
+
+
+def tokenize(text: str) -> Iterator[Token]:
+    """Yield significant tokens of *text*, skipping whitespace and notes.
+
+    Line numbers are 1-based.
+    """
+    line = 1
+    pos = 0
+    for match in _TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        start, end = match.span()
+        line += text.count("\n", pos, start)
+        pos = start
+        if kind in ("space", "note"):
+            continue
+        yield Token(kind, match.group(), line, start, end)
+
+
+def outline(text: str) -> Outline:
+    """Recover declarations, imports, qualified references and docs from *text*."""
+    result = Outline()
+    scopes: list[str | None] = []
+    pending: str | None = None
+    keyword: str | None = None
+    importing = False
+    documenting = False
+
+    def scope_name() -> str:
+        return "::".join(s for s in scopes if s)
+
+    for tok in tokenize(text):
+        if tok.kind == "punct":
+            if tok.value == "{":
+                scopes.append(pending)
+            elif tok.value == "}":
+                if scopes:
+                    scopes.pop()
+            pending = keyword = None
+            importing = documenting = False
+            continue
+        if tok.kind == "comment" and documenting:
+            result.docs.append((scope_name(), _comment_text(tok.value)))
+            documenting = False
+            continue
+        if tok.kind != "name":
+            continue
+
+        value = _normalize(tok.value)
+        if importing:
+            result.imports.append((scope_name(), value))
+            importing = False
+            continue
+        if value == "import":
+            importing = True
+            continue
+        if value == "doc":
+            documenting = True
+            continue
+        if value in DECLARATION_KEYWORDS:
+            keyword = value
+            continue
+        if value in _KEYWORDS:
+            continue
+        if keyword is not None and "::" not in value:
+            outer = scope_name()
+            qualified = f"{outer}::{value}" if outer else value
+            result.declarations.append(Declaration(keyword, value, qualified, tok.line))
+            pending = value
+            keyword = None
+            continue
+        keyword = None
+        if "::" in value:
+            result.references.append((scope_name(), value))
+
+    return result
+
+
+def complete(text: str) -> bool:
+    """Whether *text* is a run of whole top-level elements.
+
+    That is, it never closes a block it did not open, leaves no block,
+    comment or string open, and ends after a ``}`` or ``;``.  Such texts
+    can be concatenated without changing how each one is tokenized.
+    """
+    depth = 0
+    last: Token | None = None
+    for tok in tokenize(text):
+        if tok.kind == "unclosed" or (tok.kind == "other" and tok.value in "\"'"):
+            return False  # unterminated note, comment, string or name
+        if tok.kind == "punct":
+            if tok.value == "{":
+                depth += 1
+            elif tok.value == "}":
+                depth -= 1
+                if depth < 0:
+                    return False
+        last = tok
+    return depth == 0 and (last is None or last.value in ("}", ";"))
@@ -0,0 +1,124 @@
+"""Split SysML v2 text at top-level element boundaries for parallel parsing.
+
+A very large file, such as a generated export, is usually a sequence of
+top-level packages.  :func:`split` finds their boundaries with the lexical
+scanner, so braces inside strings and comments are ignored, and
+:func:`parse_parallel` parses the pieces in worker processes and merges
+them back into one model.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from sysml_v2.parsing.scan import tokenize
+
+
+@dataclass(frozen=True)
+class Segment:
+    """A run of complete top-level elements and where it starts."""
+
+    text: str
+    line: int  # 1-based line of the segment's first character in the full text
+
+
+def _boundaries(text: str) -> list[int]:
+    """Offsets just past each top-level ``}`` or ``;``."""
+    ends = []
+    depth = 0
+    for tok in tokenize(text):
+        if tok.kind != "punct":
+            continue
+        if tok.value == "{":
+            depth += 1
+        elif tok.value == "}":
+            depth = max(depth - 1, 0)
+            if depth == 0:
+                ends.append(tok.end)
+        elif depth == 0:
+            ends.append(tok.end)
+    return ends
+
+
+def split(text: str, max_segments: int | None = None) -> list[Segment]:
+    """Split *text* into segments of whole top-level elements.
+
+    Comments and whitespace before an element stay with it, and anything
+    after the last complete element joins the final segment.  With
+    *max_segments*, neighbouring elements are grouped into at most that
+    many segments of similar size.
+    """
+    ends = _boundaries(text)
+    if not ends:
+        return [Segment(text, 1)]
+    ends[-1] = len(text)
+
+    if max_segments is not None and len(ends) > max_segments:
+        target = len(text) / max(max_segments, 1)
+        grouped = []
+        for end in ends:
+            if end >= target * (len(grouped) + 1) or end == len(text):
+                grouped.append(end)
+        ends = grouped
+
+    segments = []
+    start = 0
+    line = 1
+    for end in ends:
+        segments.append(Segment(text[start:end], line))
+        line += text.count("\n", start, end)
+        start = end
+    return segments
+
+
+def _parse_segment(segment: Segment) -> Any:
+    """Parse one segment; syntax errors are returned as ``(line, col)``.
+
+    textX errors lose their position when pickled, so it is sent back
+    explicitly and the error is re-raised in the calling process.
+    """
+    import sysml2py
+    from textx import TextXSyntaxError
+
+    try:
+        return sysml2py.loads(segment.text)
+    except TextXSyntaxError as exc:
+        cause = exc.__context__ if exc.__context__ is not None else exc
+        line = getattr(cause, "line", None)
+        col = getattr(cause, "col", None)
+        message = getattr(cause, "message", str(cause))
+        return ("error", line, col, message)
+
+
+def parse_parallel(text: str, jobs: int) -> Any:
+    """Parse *text* by top-level elements in *jobs* worker processes.
+
+    Returns a single sysml2py model with the packages of all segments.  A
+    syntax error is raised as ``TextXSyntaxError`` with ``line`` set
+    relative to the whole text, as if it had been parsed in one call.
+    """
+    import sysml2py
+    from sysml2py.definition import Model
+    from textx import TextXSyntaxError
+
+    segments = split(text, max_segments=jobs)
+    if len(segments) < 2 or jobs < 2:
+        return sysml2py.loads(text)
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(segments))) as pool:
+        results = list(pool.map(_parse_segment, segments))
+
+    model = Model()
+    for segment, result in zip(segments, results):
+        if isinstance(result, tuple):
+            _, line, col, message = result
+            if line is not None:
+                line += segment.line - 1
+            # Mirror sysml2py, which chains the positioned textX error.
+            error = TextXSyntaxError("Invalid SysML", line=line, col=col)
+            error.__context__ = TextXSyntaxError(message, line=line, col=col)
+            raise error
+        model.children.extend(result.children)
+    return model._ensure_body()
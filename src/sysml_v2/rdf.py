@@ -0,0 +1,227 @@
+"""Stream models into an RDF quad store as N-Quads.
+
+Elements (SysML v2 API JSON, or models parsed with sysml2py) are turned
+into N-Quads lines by generators, grouped into chunks of whole lines and
+posted to the store's Graph Store Protocol endpoint with a bounded number
+of requests in flight.  Nothing holds the full model in memory, so large
+initial loads run at the store's ingest speed.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+import httpx
+
+from sysml_v2 import tracing
+
+# Namespaces for element subjects, properties and named graphs
+ELEMENT_NS = "urn:uuid:"
+VOCAB_NS = "https://www.omg.org/spec/SysML/vocab#"
+GRAPH_NS = "urn:sysml:"
+
+_RDF_TYPE = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+_XSD = "http://www.w3.org/2001/XMLSchema#"
+_RDF_JSON = "http://www.w3.org/1999/02/22-rdf-syntax-ns#JSON"
+
+# Default request body size for chunked uploads.
+CHUNK_BYTES = 4 << 20
+
+_UUID_RE = re.compile(r"^[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$")
+_LITERAL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+# Namespace for element IDs derived from qualified names of parsed models
+_MODEL_NS = uuid.UUID("6f1f6a57-3c0e-4c55-9a1e-6b7a0f3d2c11")
+
+
+def _iri(value: str) -> str:
+    return "<" + quote(value, safe=":/?#[]@!$&'()*+,;=%~.-_") + ">"
+
+
+def element_iri(element_id: str) -> str:
+    """IRI (in angle brackets) for an element ID."""
+    if _UUID_RE.match(element_id):
+        return f"<{ELEMENT_NS}{element_id.lower()}>"
+    return _iri(f"{GRAPH_NS}element:{element_id}")
+
+
+def graph_iri(project_id: str, commit_id: str | None = None) -> str:
+    """Named graph IRI (in angle brackets) for a project commit."""
+    name = f"{GRAPH_NS}project:{project_id}"
+    if commit_id:
+        name += f":commit:{commit_id}"
+    return _iri(name)
+
+
+def file_graph_iri(path: str | Path) -> str:
+    """Named graph IRI (in angle brackets) for a model file."""
+    return _iri(f"{GRAPH_NS}file:{Path(path).resolve().as_posix()}")
+
+
+def _literal(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return f'"{str(value).lower()}"^^<{_XSD}boolean>'
+    if isinstance(value, int):
+        return f'"{value}"^^<{_XSD}integer>'
+    if isinstance(value, float):
+        return f'"{value!r}"^^<{_XSD}double>'
+    if isinstance(value, dict):
+        if "@id" in value:
+            return element_iri(str(value["@id"]))
+        text = json.dumps(value, sort_keys=True, separators=(",", ":"))
+        return f'"{text.translate(_LITERAL_ESCAPES)}"^^<{_RDF_JSON}>'
+    return f'"{str(value).translate(_LITERAL_ESCAPES)}"'
+
+
+def element_quads(elements: Iterable[dict[str, Any]], graph: str) -> Iterator[str]:
+    """Yield N-Quads lines for *elements* in named *graph* (an IRI in ``<>``).
+
+    ``@type`` becomes ``rdf:type``, references (``{"@id": ...}``) become
+    element IRIs and other values typed literals; list values give one
+    quad per item.
+    """
+    for element in elements:
+        subject = element_iri(str(element["@id"]))
+        for key, value in element.items():
+            if key == "@id" or value is None:
+                continue
+            if key == "@type":
+                yield f"{subject} {_RDF_TYPE} <{VOCAB_NS}{value}> {graph} .\n"
+                continue
+            predicate = _iri(VOCAB_NS + key.lstrip("@"))
+            for item in value if isinstance(value, list) else [value]:
+                obj = _literal(item)
+                if obj is not None:
+                    yield f"{subject} {predicate} {obj} {graph} .\n"
+
+
+# sysml2py classes -> SysML v2 metaclass names
+_MODEL_TYPES = {
+    "Package": "Package",
+    "Part": "PartUsage",
+    "Item": "ItemUsage",
+    "Attribute": "AttributeUsage",
+    "Port": "PortUsage",
+}
+
+
+def model_elements(model: Any) -> Iterator[dict[str, Any]]:
+    """Yield API-style element dicts for a model parsed by ``sysml2py``.
+
+    IDs are derived from each element's path in the model, so reloading the
+    same model produces the same subjects.  The path uses the element's
+    name, its sibling position (``#3``) when it is unnamed, and an
+    occurrence suffix (``x#2``) for repeated sibling names.  Unnamed
+    elements and their members have no ``qualifiedName``.
+    """
+
+    def visit(
+        obj: Any, owner: dict[str, Any] | None, path: str, qualified: str | None
+    ) -> Iterator[dict[str, Any]]:
+        seen: dict[str, int] = {}
+        for position, child in enumerate(getattr(obj, "children", None) or []):
+            name = getattr(child, "name", None)
+            if name is None:
+                segment = f"#{position}"
+            else:
+                seen[name] = seen.get(name, 0) + 1
+                segment = name if seen[name] == 1 else f"{name}#{seen[name]}"
+            child_path = f"{path}::{segment}" if path else segment
+            child_qualified = None
+            if name is not None and (qualified is not None or owner is None):
+                child_qualified = f"{qualified}::{name}" if qualified else name
+            element: dict[str, Any] = {
+                "@id": str(uuid.uuid5(_MODEL_NS, child_path)),
+                "@type": _MODEL_TYPES.get(type(child).__name__, type(child).__name__),
+                "name": name,
+                "qualifiedName": child_qualified,
+            }
+            if owner is not None:
+                element["owner"] = {"@id": owner["@id"]}
+            yield element
+            yield from visit(child, element, child_path, child_qualified)
+
+    yield from visit(model, None, "", None)
+
+
+def chunk_lines(lines: Iterable[str], chunk_bytes: int = CHUNK_BYTES) -> Iterator[bytes]:
+    """Group *lines* into UTF-8 chunks of whole lines, each about *chunk_bytes*."""
+    buffer: list[bytes] = []
+    size = 0
+    for line in lines:
+        data = line.encode("utf-8")
+        if buffer and size + len(data) > chunk_bytes:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+        buffer.append(data)
+        size += len(data)
+    if buffer:
+        yield b"".join(buffer)
+
+
+@dataclass(frozen=True)
+class LoadResult:
+    chunks: int
+    quads: int
+    bytes: int
+    elapsed: float
+
+
+def load_quads(
+    chunks: Iterable[bytes],
+    store_url: str,
+    *,
+    concurrency: int = 4,
+    retries: int = 2,
+    timeout: float = 300,
+) -> LoadResult:
+    """POST N-Quads *chunks* to a Graph Store Protocol endpoint.
+
+    At most *concurrency* requests are in flight; the chunk generator is
+    only advanced as requests complete, so memory stays bounded.  Failed
+    requests (connection errors or 5xx) are retried *retries* times with
+    backoff; any other error status raises ``httpx.HTTPStatusError``.
+    """
+    start = time.perf_counter()
+    client = httpx.Client(timeout=timeout, **tracing.client_options())
+    headers = {"Content-Type": "application/n-quads"}
+
+    def post(body: bytes) -> int:
+        attempt = 0
+        while True:
+            try:
+                resp = client.post(store_url, content=body, headers=headers)
+                if resp.status_code < 500 or attempt >= retries:
+                    resp.raise_for_status()
+                    return body.count(b"\n")
+            except httpx.TransportError:
+                if attempt >= retries:
+                    raise
+            time.sleep(0.5 * 2**attempt)
+            attempt += 1
+
+    count = quads = size = 0
+    pending: set[Future[int]] = set()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for chunk in chunks:
+                if len(pending) >= concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    quads += sum(f.result() for f in done)
+                pending.add(pool.submit(post, chunk))
+                count += 1
+                size += len(chunk)
+            quads += sum(f.result() for f in pending)
+    finally:
+        client.close()
+    return LoadResult(count, quads, size, time.perf_counter() - start)
@@ -0,0 +1,133 @@
+"""Readiness probing for the services of the local API server stack."""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from sysml_v2 import tracing
+
+# Path to probe for known compose services; anything else is probed at "/".
+_PROBE_PATHS: dict[str, str] = {
+    "quad-store": "/ds",
+    "layer1-service": "/",
+    "sysmlv2-api": "/projects",
+}
+
+_PORT_RE = re.compile(r"""^\s*-\s*["']?(?:[\d.]+:)?(\d+):\d+(?:/tcp)?["']?\s*$""")
+
+
+@dataclass(frozen=True)
+class Probe:
+    name: str
+    url: str
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    name: str
+    url: str
+    ready: bool
+    elapsed: float
+    attempts: int
+    error: str = ""
+
+
+def compose_probes(compose_file: Path) -> list[Probe]:
+    """Return one HTTP probe per service that publishes a host port.
+
+    Reads the ``services`` section of a docker-compose file line by line;
+    only the subset of YAML used by the bundled templates is understood.
+    """
+    probes: list[Probe] = []
+    in_services = False
+    service: str | None = None
+    service_indent = None
+    in_ports = False
+    for raw in compose_file.read_text().splitlines():
+        line = raw.split(" #")[0].rstrip()
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip())
+        if indent == 0:
+            in_services = line.startswith("services:")
+            service = None
+            continue
+        if not in_services:
+            continue
+        if service_indent is None:
+            service_indent = indent
+        if indent == service_indent and line.endswith(":"):
+            service = line.strip()[:-1]
+            in_ports = False
+            continue
+        if service is None:
+            continue
+        key = line.strip()
+        if key.endswith(":") and not key.startswith("-"):
+            in_ports = key == "ports:"
+            continue
+        if in_ports and (match := _PORT_RE.match(line)):
+            path = _PROBE_PATHS.get(service, "/")
+            probes.append(Probe(service, f"http://localhost:{match.group(1)}{path}"))
+            in_ports = False
+    return probes
+
+
+def wait_ready(
+    probes: Iterable[Probe],
+    *,
+    timeout: float = 90.0,
+    initial_delay: float = 0.025,
+    max_delay: float = 1.0,
+    on_ready: Callable[[ProbeResult], None] | None = None,
+) -> list[ProbeResult]:
+    """Poll all *probes* concurrently until each is ready or *timeout* expires.
+
+    A service is ready once it answers HTTP with a status below 500.  Each
+    probe retries with exponential backoff starting at *initial_delay* and
+    capped at *max_delay*, so readiness is detected within a few tens of
+    milliseconds early on.  *on_ready* is called from the probing thread as
+    soon as a service becomes ready.  Results are returned in probe order.
+    """
+    probes = list(probes)
+    start = time.monotonic()
+    deadline = start + timeout
+
+    def poll(probe: Probe) -> ProbeResult:
+        delay = initial_delay
+        attempts = 0
+        error = ""
+        with httpx.Client(**tracing.client_options()) as client:
+            while True:
+                attempts += 1
+                remaining = max(deadline - time.monotonic(), 0.1)
+                try:
+                    resp = client.get(probe.url, timeout=min(2.0, remaining))
+                    if resp.status_code < 500:
+                        result = ProbeResult(
+                            probe.name, probe.url, True, time.monotonic() - start, attempts
+                        )
+                        if on_ready is not None:
+                            on_ready(result)
+                        return result
+                    error = f"HTTP {resp.status_code}"
+                except httpx.HTTPError as exc:
+                    error = str(exc) or type(exc).__name__
+                if time.monotonic() + delay > deadline:
+                    return ProbeResult(
+                        probe.name, probe.url, False, time.monotonic() - start, attempts, error
+                    )
+                time.sleep(delay)
+                delay = min(delay * 2, max_delay)
+
+    if not probes:
+        return []
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        return list(pool.map(poll, probes))
@@ -0,0 +1,398 @@
+"""Trigram index for finding model elements by partial or fuzzy name.
+
+Element names, qualified names and doc text are stored in SQLite with an
+FTS5 ``trigram`` full-text index, so substring, glob and fuzzy lookups
+read a few posting lists instead of scanning every element.  The index
+is a file (``.sysml/names.db`` by default) that is updated incrementally:
+model files are re-scanned only when their mtime or size changes, and a
+server commit is indexed once.
+
+Usage::
+
+    with NameIndex(".sysml/names.db") as index:
+        index.index_directory("models")
+        for match in index.find("*driveOut*"):
+            print(match.qualified_name, match.source, match.line)
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sysml_v2.parsing.loader import find_models, read_text
+from sysml_v2.parsing.scan import Outline, outline
+
+# Prefix of source names for local model files
+FILE_SOURCE = "file:"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL,
+    stamp TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS elements (
+    id INTEGER PRIMARY KEY,
+    source INTEGER NOT NULL,
+    element_id TEXT,
+    kind TEXT,
+    name TEXT,
+    qualified_name TEXT,
+    doc TEXT,
+    line INTEGER
+);
+CREATE INDEX IF NOT EXISTS elements_source ON elements (source);
+CREATE INDEX IF NOT EXISTS elements_name ON elements (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS elements_qualified_name ON elements (qualified_name COLLATE NOCASE);
+CREATE VIRTUAL TABLE IF NOT EXISTS element_text USING fts5 (
+    name, qualified_name, doc,
+    content='elements', content_rowid='id', tokenize='trigram'
+);
+-- Documents per trigram, to pick selective trigrams for fuzzy search
+CREATE VIRTUAL TABLE IF NOT EXISTS element_terms USING fts5vocab (element_text, 'row');
+"""
+
+_COLUMNS = "e.element_id, e.kind, e.name, e.qualified_name, s.name, e.line"
+_WILDCARDS = re.compile(r"[*?\[\]]")
+# fnmatch character classes, e.g. "[abc]", "[!a-z]", "[]x]"
+_CLASSES = re.compile(r"\[!?\]?[^\]]*\]")
+# Most candidate elements scored per fuzzy search
+_FUZZY_BUDGET = 20_000
+
+
+@dataclass(frozen=True)
+class Match:
+    element_id: str | None
+    kind: str | None
+    name: str
+    qualified_name: str
+    # Source name: "file:<path>" or "<project>@<commit>"
+    source: str
+    line: int | None
+    # Trigram similarity of the pattern to the name (1.0 for an exact match)
+    score: float
+
+
+@dataclass(frozen=True)
+class IndexStats:
+    indexed: int
+    unchanged: int
+    removed: int
+    elements: int
+
+
+def trigrams(text: str) -> set[str]:
+    """Lower-cased trigrams of *text*, padded at word ends as in ``pg_trgm``."""
+    padded = f"  {text.lower()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a: str, b: str) -> float:
+    """Share of trigrams common to *a* and *b* (0 to 1)."""
+    ta, tb = trigrams(a), trigrams(b)
+    return len(ta & tb) / len(ta | tb) if ta or tb else 1.0
+
+
+def _phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+class NameIndex:
+    """SQLite trigram index of element names, qualified names and doc text.
+
+    Requires SQLite 3.34+ (the FTS5 ``trigram`` tokenizer).
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(path)
+        try:
+            self._db.executescript(_SCHEMA)
+        except sqlite3.OperationalError as exc:
+            self._db.close()
+            raise RuntimeError(
+                f"SQLite {sqlite3.sqlite_version} lacks the FTS5 trigram tokenizer: {exc}"
+            ) from None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def __enter__(self) -> NameIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -- Building -------------------------------------------------------------
+
+    def stamp(self, source: str) -> str | None:
+        """Return the stamp *source* was indexed with, or None if it is not indexed."""
+        row = self._db.execute("SELECT stamp FROM sources WHERE name = ?", (source,)).fetchone()
+        return row[0] if row else None
+
+    # The full-text index is updated per source with one statement rather than
+    # by triggers, which is several times faster for large sources.
+
+    def _replace(self, source: str, stamp: str, rows: Iterable[tuple[Any, ...]]) -> int:
+        """Replace the elements of *source*; call inside a transaction."""
+        self._remove(source)
+        cur = self._db.execute(
+            "INSERT INTO sources (name, stamp) VALUES (?, ?)", (source, stamp)
+        )
+        source_id = cur.lastrowid
+        cur = self._db.executemany(
+            "INSERT INTO elements (source, element_id, kind, name, qualified_name, doc, line) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((source_id, *row) for row in rows),
+        )
+        self._db.execute(
+            "INSERT INTO element_text (rowid, name, qualified_name, doc) "
+            "SELECT id, name, qualified_name, doc FROM elements WHERE source = ?",
+            (source_id,),
+        )
+        return cur.rowcount
+
+    def _remove(self, source: str) -> None:
+        row = self._db.execute("SELECT id FROM sources WHERE name = ?", (source,)).fetchone()
+        if row is not None:
+            self._db.execute(
+                "INSERT INTO element_text (element_text, rowid, name, qualified_name, doc) "
+                "SELECT 'delete', id, name, qualified_name, doc FROM elements WHERE source = ?",
+                row,
+            )
+            self._db.execute("DELETE FROM elements WHERE source = ?", row)
+            self._db.execute("DELETE FROM sources WHERE id = ?", row)
+
+    def index_files(self, files: Iterable[str | Path]) -> IndexStats:
+        """Index declarations of ``.sysml`` *files* whose mtime or size changed.
+
+        Files are scanned lexically (see :func:`sysml_v2.parsing.scan.outline`),
+        not parsed, so files with syntax errors are still indexed.
+        """
+        indexed = unchanged = elements = 0
+        with self._db:
+            for path in files:
+                path = Path(path).resolve()
+                st = path.stat()
+                source = FILE_SOURCE + str(path)
+                stamp = f"{st.st_mtime_ns}:{st.st_size}"
+                if self.stamp(source) == stamp:
+                    unchanged += 1
+                    continue
+                try:
+                    info = outline(read_text(path))
+                except UnicodeDecodeError:
+                    # Not a readable model file, so it has no names to index.
+                    info = Outline()
+                docs: dict[str, str] = {}
+                for owner, text in info.docs:
+                    docs[owner] = f"{docs[owner]}\n{text}" if owner in docs else text
+                rows = [
+                    (None, d.keyword, d.name, d.qualified_name, docs.get(d.qualified_name), d.line)
+                    for d in info.declarations
+                ]
+                elements += self._replace(source, stamp, rows)
+                indexed += 1
+        return IndexStats(indexed, unchanged, 0, elements)
+
+    def index_directory(
+        self,
+        directory: str | Path,
+        *,
+        exclude: Iterable[str] = (),
+        exclude_base: str | Path | None = None,
+        cache: str | Path | None = None,
+    ) -> IndexStats:
+        """Bring the index up to date with the model files under *directory*.
+
+        *exclude* and *exclude_base* are passed to :func:`find_models`.
+        Files that no longer exist (or are now excluded) are dropped.
+        """
+        directory = Path(directory).resolve()
+        files = find_models(directory, exclude=exclude, exclude_base=exclude_base, cache=cache)
+        stats = self.index_files(files)
+        current = {FILE_SOURCE + str(path.resolve()) for path in files}
+        prefix = FILE_SOURCE + str(directory)
+        stale = [
+            name
+            for (name,) in self._db.execute(
+                "SELECT name FROM sources WHERE substr(name, 1, ?) = ?", (len(prefix), prefix)
+            )
+            if name not in current and Path(name[len(FILE_SOURCE) :]).is_relative_to(directory)
+        ]
+        with self._db:
+            for name in stale:
+                self._remove(name)
+        return IndexStats(stats.indexed, stats.unchanged, len(stale), stats.elements)
+
+    def index_elements(
+        self, elements: Iterable[dict[str, Any]], source: str, stamp: str = ""
+    ) -> IndexStats:
+        """Index API element dicts (e.g. a server commit) as *source*.
+
+        Nothing is done if *source* is already indexed with the same
+        *stamp*.  ``Documentation`` and ``Comment`` bodies are attached to
+        their owning element.
+        """
+        if self.stamp(source) == stamp:
+            return IndexStats(0, 1, 0, 0)
+        named: list[dict[str, Any]] = []
+        docs: dict[str, list[str]] = {}
+        for element in elements:
+            body = element.get("body")
+            owner = element.get("owner") or element.get("owningRelatedElement")
+            if body and element.get("@type") in ("Documentation", "Comment") and owner:
+                docs.setdefault(owner["@id"], []).append(body)
+            elif element.get("name") or element.get("declaredName"):
+                named.append(element)
+        rows = []
+        for element in named:
+            name = element.get("name") or element.get("declaredName")
+            doc = docs.get(element["@id"])
+            rows.append(
+                (
+                    element["@id"],
+                    element.get("@type"),
+                    name,
+                    element.get("qualifiedName") or name,
+                    "\n".join(doc) if doc else None,
+                    None,
+                )
+            )
+        with self._db:
+            count = self._replace(source, stamp, rows)
+        return IndexStats(1, 0, 0, count)
+
+    # -- Searching ------------------------------------------------------------
+
+    def find(
+        self,
+        pattern: str,
+        *,
+        fuzzy: bool = False,
+        doc: bool = False,
+        source: str | None = None,
+        limit: int = 50,
+    ) -> list[Match]:
+        """Find elements whose name matches *pattern*, case-insensitively.
+
+        *pattern* is a substring, or a glob if it contains ``*``, ``?`` or
+        ``[``.  A pattern containing ``::`` is matched against qualified
+        names.  With *doc*, elements whose doc text contains the pattern
+        also match; with *fuzzy*, names are ranked by trigram similarity
+        instead.  *source* restricts results to sources with that prefix.
+        Exact name matches come first.
+        """
+        if fuzzy:
+            return self._find_fuzzy(pattern, source, limit)
+        lowered = pattern.lower()
+        column = "qualified_name" if "::" in pattern else "name"
+        glob = lowered if _WILDCARDS.search(lowered) else f"*{lowered}*"
+
+        def accept(row: tuple[Any, ...], text: str | None) -> bool:
+            value = row[3] if column == "qualified_name" else row[2]
+            if fnmatch.fnmatchcase((value or "").lower(), glob):
+                return True
+            return doc and text is not None and fnmatch.fnmatchcase(text.lower(), f"*{glob}*")
+
+        results: list[Match] = []
+        seen: set[int] = set()
+        if not _WILDCARDS.search(pattern):
+            exact = self._query(f"e.{column} = ? COLLATE NOCASE", (pattern,), source, limit=limit)
+            for rowid, *row in exact:
+                seen.add(rowid)
+                results.append(self._match(row, pattern))
+            if len(results) >= limit:
+                return results
+
+        # A character class matches one of several characters, so it is not
+        # part of any literal the name must contain.
+        pieces = _WILDCARDS.split(_CLASSES.sub("?", pattern))
+        literals = [part for part in pieces if len(part) >= 3]
+        columns = f"{{{column} doc}}" if doc else f"{{{column}}}"
+        if literals:
+            expr = f"{columns} : (" + " AND ".join(_phrase(part) for part in literals) + ")"
+            rows = self._query("element_text MATCH ?", (expr,), source, fts=True)
+        else:
+            # Too short for trigrams: scan.  SQLite negates classes with "^".
+            sql_glob = glob.replace("[!", "[^")
+            where = f"lower(e.{column}) GLOB ?"
+            args: tuple[str, ...] = (sql_glob,)
+            if doc:
+                where = f"({where} OR lower(e.doc) GLOB ?)"
+                args = (sql_glob, f"*{sql_glob}*")
+            rows = self._query(where, args, source, fts=doc)
+        # Rank every candidate before applying the limit.
+        ranked = [
+            self._match(row, pattern)
+            for rowid, *row, text in rows
+            if rowid not in seen and accept(row, text)
+        ]
+        ranked.sort(key=lambda m: (-m.score, len(m.name), m.qualified_name))
+        return results + ranked[: limit - len(results)]
+
+    def _find_fuzzy(self, pattern: str, source: str | None, limit: int) -> list[Match]:
+        """Score names sharing the pattern's most selective trigrams."""
+        grams = sorted(g for g in trigrams(pattern) if " " not in g)
+        if not grams:
+            return self.find(pattern, source=source, limit=limit)
+        counts = self._db.execute(
+            f"SELECT term, doc FROM element_terms WHERE term IN ({','.join('?' * len(grams))})",
+            grams,
+        ).fetchall()
+        selected: list[str] = []
+        total = 0
+        for term, count in sorted(counts, key=lambda tc: tc[1]):
+            if len(selected) >= 2 and total + count > _FUZZY_BUDGET:
+                break
+            selected.append(term)
+            total += count
+        if not selected:
+            return []
+        expr = "{name} : (" + " OR ".join(_phrase(g) for g in selected) + ")"
+        rows = self._query(
+            "element_text MATCH ?", (expr,), source, fts=True, limit=_FUZZY_BUDGET
+        )
+        matches = [self._match(row[1:-1], pattern) for row in rows]
+        matches.sort(key=lambda m: (-m.score, len(m.name), m.qualified_name))
+        return matches[:limit]
+
+    def _query(
+        self,
+        where: str,
+        args: tuple[Any, ...],
+        source: str | None,
+        *,
+        fts: bool = False,
+        limit: int | None = None,
+    ):
+        """Rows of (rowid, element_id, kind, name, qualified_name, source, line[, doc])."""
+        sql = f"SELECT e.id, {_COLUMNS}" + (", e.doc" if fts else "")
+        sql += " FROM elements e JOIN sources s ON s.id = e.source"
+        if fts:
+            sql += " JOIN element_text ON element_text.rowid = e.id"
+        sql += f" WHERE {where}"
+        if source is not None:
+            sql += " AND substr(s.name, 1, ?) = ?"
+            args = (*args, len(source), source)
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        if not fts:
+            return ((*row, None) for row in self._db.execute(sql, args))
+        return self._db.execute(sql, args)
+
+    @staticmethod
+    def _match(row: tuple[Any, ...], pattern: str) -> Match:
+        element_id, kind, name, qualified_name, source, line = row[:6]
+        value = qualified_name if "::" in pattern else name
+        score = similarity(pattern, value or "")
+        return Match(element_id, kind, name or "", qualified_name or "", source, line, score)
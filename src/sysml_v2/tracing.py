@@ -0,0 +1,138 @@
+"""Phase tracing in Chrome trace-event format.
+
+Spans are recorded only when tracing is enabled, with ``sysml --trace
+out.json`` or the ``SYSML_TRACE`` environment variable; otherwise
+:func:`span` returns a shared no-op context manager.  The trace is written
+when the process exits and opens in ``chrome://tracing`` or Perfetto.
+
+Usage::
+
+    with tracing.span("parse", path=str(path)):
+        model = sysml2py.loads(text)
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+# Time this module was imported; the CLI reports module imports from here.
+IMPORT_START = time.perf_counter_ns()
+
+_NULL = contextlib.nullcontext()
+
+_events: list[dict[str, Any]] = []
+_lock = threading.Lock()
+_path: Path | None = None
+_pid = os.getpid()
+
+
+def enabled() -> bool:
+    """Return True if spans are being recorded."""
+    return _path is not None
+
+
+def enable(path: str | Path) -> None:
+    """Start recording spans; they are written to *path* at exit."""
+    global _path
+    if _path is None:
+        atexit.register(write)
+    _path = Path(path)
+
+
+def complete(
+    name: str, start_ns: int, end_ns: int | None = None, cat: str = "sysml", **args: Any
+) -> None:
+    """Record a finished span from ``perf_counter_ns`` timestamps (end defaults to now)."""
+    if _path is None:
+        return
+    end_ns = time.perf_counter_ns() if end_ns is None else end_ns
+    event = {
+        "name": name,
+        "cat": cat,
+        "ph": "X",
+        "ts": start_ns / 1000,
+        "dur": (end_ns - start_ns) / 1000,
+        "pid": _pid,
+        "tid": threading.get_native_id(),
+    }
+    if args:
+        event["args"] = args
+    with _lock:
+        _events.append(event)
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "start")
+
+    def __init__(self, name: str, cat: str, args: dict[str, Any]) -> None:
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self) -> _Span:
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: object) -> None:
+        if exc_type is not None and not issubclass(exc_type, SystemExit):
+            self.args["error"] = exc_type.__name__
+        complete(self.name, self.start, cat=self.cat, **self.args)
+
+
+def span(name: str, cat: str = "sysml", **args: Any) -> contextlib.AbstractContextManager:
+    """Context manager recording a span named *name*, with *args* as details."""
+    if _path is None:
+        return _NULL
+    return _Span(name, cat, args)
+
+
+class TracingTransport(httpx.BaseTransport):
+    """httpx transport recording a span per request, up to the response headers."""
+
+    def __init__(self, inner: httpx.BaseTransport | None = None) -> None:
+        self._inner = inner or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        name = f"{request.method} {request.url.path}"
+        start = time.perf_counter_ns()
+        response = self._inner.handle_request(request)
+        complete(name, start, cat="http", url=str(request.url), status=response.status_code)
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+def client_options(transport: httpx.BaseTransport | None = None) -> dict[str, Any]:
+    """``httpx.Client`` arguments using *transport*, wrapped to trace requests if enabled."""
+    if _path is not None:
+        return {"transport": TracingTransport(transport)}
+    return {"transport": transport} if transport is not None else {}
+
+
+def write(path: str | Path | None = None) -> None:
+    """Write recorded spans as a Chrome trace-event JSON file."""
+    path = Path(path) if path is not None else _path
+    if path is None or os.getpid() != _pid:
+        return
+    with _lock:
+        events = list(_events)
+    metadata = {"name": "process_name", "ph": "M", "pid": _pid, "args": {"name": "sysml"}}
+    path.write_text(
+        json.dumps({"traceEvents": [metadata, *events], "displayTimeUnit": "ms"}) + "\n"
+    )
+
+
+# SYSML_TRACE enables tracing for any entry point.  It is removed from the
+# environment so worker processes do not overwrite the trace.
+if os.environ.get("SYSML_TRACE"):
+    enable(os.environ.pop("SYSML_TRACE"))
@@ -0,0 +1,122 @@
+"""Shared test fixtures."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from sysml_v2.api.client import SysMLClient
+
+
+@pytest.fixture
+def stub_server():
+    """Start local HTTP stand-in servers and return their base URLs.
+
+    Call the fixture with ``handler(method, path, headers, body)`` returning
+    ``(status, payload)``; dict/list payloads are sent as JSON.
+    """
+    servers = []
+
+    def start(handler) -> str:
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                status, payload = handler(self.command, self.path, self.headers, body)
+                content_type = "text/plain"
+                if isinstance(payload, (dict, list)):
+                    payload = json.dumps(payload)
+                    content_type = "application/json"
+                if isinstance(payload, str):
+                    payload = payload.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def mock_client():
+    """Create SysMLClients backed by an in-process ``httpx.MockTransport``.
+
+    Call the fixture with a ``{path: payload}`` dict (unknown paths return
+    404) or with a ``handler(request) -> httpx.Response``.
+    """
+    clients = []
+
+    def make(routes) -> SysMLClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path in routes:
+                return httpx.Response(200, json=routes[request.url.path])
+            return httpx.Response(404, json={"error": "not found"})
+
+        client = SysMLClient.__new__(SysMLClient)
+        client._client = httpx.Client(
+            base_url="http://test",
+            transport=httpx.MockTransport(routes if callable(routes) else handler),
+        )
+        clients.append(client)
+        return client
+
+    yield make
+
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def parse_server(stub_server):
+    """A stand-in for Gearshift's ``/parse`` endpoint.
+
+    Rejects any text with a line containing ``ERROR`` or with unbalanced
+    braces (reporting the line number in the message, or omitting it when
+    ``server.report_lines`` is false) and records each request body in
+    ``server.bodies``.
+    """
+
+    class ParseServer:
+        report_lines = True
+        bodies: list[bytes] = []
+
+        def handle(self, method, path, headers, body):
+            if method != "POST" or path != "/parse":
+                return 404, {"error": "not found"}
+            self.bodies.append(body)
+            depth = 0
+            lines = body.decode().splitlines()
+            for number, line in enumerate(lines, start=1):
+                depth += line.count("{") - line.count("}")
+                if "ERROR" in line or depth < 0:
+                    return 400, {"error": self.message(number)}
+            if depth:
+                return 400, {"error": self.message(len(lines))}
+            return 200, {}
+
+        def message(self, line):
+            return f"Syntax error at line {line}" if self.report_lines else "Syntax error"
+
+    server = ParseServer()
+    server.bodies = []
+    server.url = stub_server(server.handle)
+    return server
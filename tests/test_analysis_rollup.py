@@ -0,0 +1,121 @@
+"""Tests for the vectorized roll-up engine."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sysml_v2.analysis.rollup import PartTree, RollUp, rollup  # noqa: E402
+
+
+def _attr(owner, name, value):
+    """AttributeUsage + FeatureValue + literal elements for ``name = value``."""
+    aid = f"{owner}.{name}"
+    return [
+        {"@id": aid, "@type": "AttributeUsage", "name": name, "owner": {"@id": owner}},
+        {"@id": f"{aid}.fv", "@type": "FeatureValue", "owner": {"@id": aid},
+         "value": {"@id": f"{aid}.lit"}},
+        {"@id": f"{aid}.lit", "@type": "LiteralRational", "value": value},
+    ]
+
+
+def _vehicle_elements():
+    """The template's Vehicle with masses set on the part definitions."""
+    elements = [
+        {"@id": "Vehicle", "@type": "PartDefinition", "name": "Vehicle"},
+        {"@id": "Wheel", "@type": "PartDefinition", "name": "Wheel"},
+        {"@id": "Engine", "@type": "PartDefinition", "name": "Engine"},
+        {"@id": "v.chassis", "@type": "PartUsage", "name": "chassis", "owner": {"@id": "Vehicle"}},
+        {"@id": "v.engine", "@type": "PartUsage", "name": "engine", "owner": {"@id": "Vehicle"},
+         "partDefinition": [{"@id": "Engine"}]},
+        {"@id": "v.wheels", "@type": "PartUsage", "name": "wheels", "owner": {"@id": "Vehicle"},
+         "partDefinition": [{"@id": "Wheel"}], "multiplicity": {"@id": "m4"}},
+        {"@id": "m4", "@type": "MultiplicityRange", "bound": [{"@id": "four"}]},
+        {"@id": "four", "@type": "LiteralInteger", "value": 4},
+        {"@id": "testVehicle", "@type": "PartUsage", "name": "testVehicle",
+         "partDefinition": [{"@id": "Vehicle"}]},
+    ]
+    elements += _attr("v.chassis", "mass", 400)
+    elements += _attr("Engine", "mass", 200)
+    elements += _attr("Wheel", "mass", 20)
+    return elements
+
+
+def test_from_elements_flattens_with_multiplicity():
+    tree = PartTree.from_elements(_vehicle_elements(), "testVehicle")
+
+    assert tree.paths == [
+        "testVehicle",
+        "testVehicle.chassis",
+        "testVehicle.engine",
+        "testVehicle.wheels",
+    ]
+    assert tree.parent.tolist() == [-1, 0, 0, 0]
+    assert tree.count.tolist() == [1, 1, 1, 4]
+    assert tree.children("testVehicle").tolist() == [1, 2, 3]
+
+    mass = tree.attribute_values("mass")
+    assert np.isnan(mass[0])
+    assert mass[1:].tolist() == [400, 200, 20]
+    assert RollUp(tree, mass).total("testVehicle") == 400 + 200 + 4 * 20
+
+
+def _deep_tree():
+    return PartTree.from_edges(
+        [
+            ("root", None, 1),
+            ("root.a", "root", 2),
+            ("root.b", "root", 1),
+            ("root.a.x", "root.a", 3),
+            ("root.a.y", "root.a", 1),
+        ]
+    )
+
+
+def test_reductions():
+    tree = _deep_tree()
+    values = [0, 1, 5, 2, 7]
+
+    assert rollup(tree, values, "sum").tolist() == [2 * (1 + 3 * 2 + 7) + 5, 14, 5, 2, 7]
+    assert rollup(tree, values, "max").tolist() == [7, 7, 5, 2, 7]
+    assert rollup(tree, values, "min").tolist() == [0, 1, 5, 2, 7]
+    custom = RollUp(tree, values, np.fmax, identity=-np.inf)
+    assert custom.totals.tolist() == [7, 7, 5, 2, 7]
+    with pytest.raises(ValueError):
+        RollUp(tree, values, np.arctan2)
+
+
+def test_rollup_over_variants():
+    tree = _deep_tree()
+    values = np.array([[0, 0], [1, 1], [5, 6], [2, 2], [7, 8]], dtype=float)
+
+    totals = rollup(tree, values, "sum")
+
+    assert totals[0].tolist() == [33, 36]
+
+
+def test_update_recomputes_only_ancestors():
+    tree = _deep_tree()
+    roll = RollUp(tree, [0, 1, 5, 2, 7], "max")
+
+    changed = roll.update("root.a.x", 10)
+    assert changed == [3, 1, 0]
+    assert roll.total("root") == 10
+
+    assert roll.update("root.b", 6) == [2]  # root stays at 10
+
+    sums = RollUp(tree, [0, 1, 5, 2, 7])
+    sums.update("root.a.x", 3)
+    assert sums.totals.tolist() == rollup(tree, [0, 1, 5, 3, 7]).tolist()
+
+
+def test_from_model_reads_parsed_attributes():
+    from sysml2py import loads
+
+    model = loads(
+        "package P { part car { attribute mass = 900 [kg];"
+        " part wheel { attribute mass = 20 [kg]; } } }"
+    )
+    tree = PartTree.from_model(model)
+
+    assert tree.paths == ["car", "car.wheel"]
+    assert rollup(tree, tree.attribute_values("mass")).tolist() == [920, 20]
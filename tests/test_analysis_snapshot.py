@@ -0,0 +1,80 @@
+"""Tests for columnar element snapshots."""
+
+import pytest
+
+from sysml_v2.analysis.snapshot import export_snapshot, load_snapshot, write_snapshot
+
+pytest.importorskip("numpy")
+
+_ELEMENTS = [
+    {"@id": "pkg", "@type": "Package", "name": "X"},
+    {"@id": "e", "@type": "PartUsage", "name": "engine", "owner": {"@id": "pkg"}},
+    {"@id": "w", "@type": "PartUsage", "name": "wheels", "owner": {"@id": "pkg"}},
+    {"@id": "r", "@type": "Relationship", "owner": {"@id": "pkg"}},
+]
+
+
+@pytest.fixture(params=["numpy", "arrow"])
+def fmt(request):
+    if request.param == "arrow":
+        pytest.importorskip("pyarrow")
+    return request.param
+
+
+def test_snapshot_round_trip(tmp_path, fmt):
+    write_snapshot(_ELEMENTS, tmp_path / "snap", project_id="p1", commit_id="c1", format=fmt)
+
+    with load_snapshot(tmp_path / "snap") as snap:
+        assert snap.format == fmt
+        assert len(snap) == 4
+        assert snap.commit_id == "c1"
+        rows = snap.rows_where("@type", "PartUsage")
+        assert rows.tolist() == [1, 2]
+        assert [snap.value("name", r) for r in rows] == ["engine", "wheels"]
+        assert snap.value("name", 3) is None
+        assert snap.value("owner", 1) == "pkg"
+        assert snap.element(2) == _ELEMENTS[2]
+        assert snap.rows_where("@type", "Missing").tolist() == []
+
+
+def test_load_snapshot_is_lazy(tmp_path):
+    write_snapshot(_ELEMENTS, tmp_path / "snap", format="numpy")
+
+    snap = load_snapshot(tmp_path / "snap")
+    snap.column("@type")
+
+    assert list(snap._columns) == ["@type"]
+    snap.close()
+
+
+def test_write_snapshot_replaces_existing(tmp_path):
+    write_snapshot(_ELEMENTS, tmp_path / "snap", commit_id="c1", format="numpy")
+    (tmp_path / "snap" / "stale.bin").write_bytes(b"x")
+
+    write_snapshot(_ELEMENTS[:2], tmp_path / "snap", commit_id="c2", format="numpy")
+
+    with load_snapshot(tmp_path / "snap") as snap:
+        assert (len(snap), snap.commit_id) == (2, "c2")
+    assert not (tmp_path / "snap" / "stale.bin").exists()
+    assert [p.name for p in tmp_path.iterdir()] == ["snap"]
+
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "notes.txt").write_text("keep")
+    with pytest.raises(FileExistsError):
+        write_snapshot(_ELEMENTS, tmp_path / "other", format="numpy")
+    assert [p.name for p in (tmp_path / "other").iterdir()] == ["notes.txt"]
+
+    (tmp_path / "file").write_text("keep")
+    with pytest.raises(FileExistsError):
+        write_snapshot(_ELEMENTS, tmp_path / "file", format="numpy")
+    assert (tmp_path / "file").read_text() == "keep"
+
+
+def test_export_snapshot_uses_client(tmp_path, mock_client):
+    client = mock_client({"/projects/p1/commits/c1/elements": _ELEMENTS})
+
+    path = export_snapshot("p1", "c1", tmp_path / "snap", client=client, format="numpy")
+
+    with load_snapshot(path) as snap:
+        assert snap.project_id == "p1"
+        assert snap.column("@id").to_list() == ["pkg", "e", "w", "r"]
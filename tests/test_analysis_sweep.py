@@ -0,0 +1,98 @@
+"""Tests for batched design-space sweeps."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sysml_v2.analysis.rollup import PartTree, rollup  # noqa: E402
+from sysml_v2.analysis.sweep import Sweep, compile_expression, grid  # noqa: E402
+
+
+def _tree():
+    return PartTree.from_edges(
+        [
+            ("vehicle", None, 1),
+            ("vehicle.chassis", "vehicle", 1),
+            ("vehicle.engine", "vehicle", 1),
+            ("vehicle.wheels", "vehicle", 4),
+            ("vehicle.chassis.frame", "vehicle.chassis", 1),
+        ]
+    )
+
+
+# Own masses in the tree's breadth-first order
+_MASS = [0.0, 50.0, 200.0, 20.0, 350.0]
+
+
+def test_grid_is_cartesian_product():
+    g = grid({"a": [1, 2, 3], "b": [10, 20]})
+
+    assert g["a"].tolist() == [1, 1, 2, 2, 3, 3]
+    assert g["b"].tolist() == [10, 20, 10, 20, 10, 20]
+
+
+def test_sweep_matches_full_rollups():
+    tree = _tree()
+    sweep = Sweep(tree, {"mass": "sum"}, values={"mass": _MASS})
+    sweep.derive("accel", "thrust / vehicle.mass")
+    sweep.constrain("vehicle.mass <= 700", name="mass_limit")
+    sweep.constrain("accel > 6")
+    samples = grid(
+        {
+            "vehicle.engine.mass": [150, 200, 250],
+            "vehicle.wheels.mass": [15, 20, 25],
+            "thrust": [4000, 5000],
+        }
+    )
+
+    result = sweep.run(samples, chunk_size=5)
+
+    assert len(result) == 18
+    for i, row in enumerate(result.rows()):
+        values = list(_MASS)
+        values[2] = row["vehicle.engine.mass"]
+        values[3] = row["vehicle.wheels.mass"]
+        total = rollup(tree, values)[0]
+        assert row["vehicle.mass"] == total
+        assert row["accel"] == pytest.approx(row["thrust"] / total)
+        assert row["mass_limit"] == (total <= 700)
+        assert row["feasible"] == (total <= 700 and row["thrust"] / total > 6)
+        assert result.feasible[i] == row["feasible"]
+
+    best = result.best("vehicle.mass")
+    assert result["vehicle.mass"][best] == 50 + 350 + 150 + 4 * 15
+
+    empty = sweep.run(grid({"vehicle.engine.mass": [], "thrust": [4000]}))
+    assert len(empty) == 0
+    assert empty["accel"].shape == empty["mass_limit"].shape == (0,)
+
+
+def test_sweep_from_elements_and_process_pool():
+    elements = [
+        {"@id": "car", "@type": "PartUsage", "name": "car"},
+        {"@id": "car.motor", "@type": "PartUsage", "name": "motor", "owner": {"@id": "car"}},
+        {"@id": "mass", "@type": "AttributeUsage", "name": "mass", "owner": {"@id": "car.motor"},
+         "value": 80},
+    ]
+    tree = PartTree.from_elements(elements, "car")
+    sweep = Sweep(tree, {"mass": "sum"}).derive("double", "2 * car.mass")
+    samples = {"car.motor.mass": np.linspace(50, 100, 40)}
+
+    serial = sweep.run(samples, chunk_size=7)
+    pooled = sweep.run(samples, chunk_size=7, workers=2)
+
+    assert serial["car.mass"].tolist() == samples["car.motor.mass"].tolist()
+    for name in serial.columns:
+        assert pooled[name].tolist() == serial[name].tolist()
+
+
+def test_expressions_are_restricted():
+    values = {"a.b": np.array([1.0, 4.0]), "c": np.array([2.0, 2.0])}
+    fn = compile_expression("sqrt(a.b) < c <= 2 and not c > 3")
+    assert fn(values.__getitem__).tolist() == [True, False]
+
+    for bad in ("__import__('os')", "a.b[0]", "lambda: 1", "a +"):
+        with pytest.raises(ValueError):
+            compile_expression(bad)
+    with pytest.raises(ValueError, match="names no part"):
+        Sweep(_tree(), {"mass": "sum"}, values={"mass": _MASS}).run({"vehicle.nope.mass": [1]})
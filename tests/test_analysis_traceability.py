@@ -0,0 +1,104 @@
+"""Tests for the sparse traceability matrices."""
+
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from sysml_v2.analysis import traceability  # noqa: E402
+from sysml_v2.analysis.traceability import Traceability  # noqa: E402
+
+
+@pytest.fixture(params=["scipy", "numpy"])
+def backend(request, monkeypatch):
+    """Run with SciPy CSR matrices and with the NumPy fallback."""
+    if request.param == "scipy":
+        pytest.importorskip("scipy")
+    else:
+        monkeypatch.setattr(traceability, "sparse", None)
+    return request.param
+
+
+def _elements():
+    """The template's requirements, plus a derived requirement and a test case."""
+    return [
+        {"@id": "massReq", "@type": "RequirementUsage", "name": "vehicleMassReq"},
+        {"@id": "powerReq", "@type": "RequirementUsage", "name": "enginePowerReq"},
+        {"@id": "wheelReq", "@type": "RequirementUsage", "name": "wheelMassReq"},
+        {"@id": "vehicle", "@type": "PartUsage", "name": "testVehicle"},
+        {"@id": "engine", "@type": "PartUsage", "name": "engine"},
+        {"@id": "wheel", "@type": "PartUsage", "name": "wheel"},
+        {"@id": "sat1", "@type": "SatisfyRequirementUsage",
+         "satisfiedRequirement": {"@id": "massReq"}, "satisfyingFeature": {"@id": "vehicle"}},
+        {"@id": "sat2", "@type": "SatisfyRequirementUsage",
+         "satisfiedRequirement": {"@id": "wheelReq"}, "satisfyingFeature": {"@id": "wheel"}},
+        {"@id": "massTest", "@type": "VerificationCaseUsage",
+         "verifiedRequirement": [{"@id": "wheelReq"}]},
+        {"@id": "Derivation", "@type": "MetadataDefinition", "name": "Derivation"},
+        {"@id": "dep", "@type": "Dependency",
+         "client": [{"@id": "massReq"}], "supplier": [{"@id": "wheelReq"}]},
+        {"@id": "dep.meta", "@type": "MetadataUsage", "owner": {"@id": "dep"},
+         "metadataDefinition": {"@id": "Derivation"}},
+        {"@id": "plain", "@type": "Dependency",
+         "client": [{"@id": "engine"}], "supplier": [{"@id": "powerReq"}]},
+    ]
+
+
+def test_from_elements_extracts_links(backend):
+    trace = Traceability.from_elements(_elements())
+
+    assert trace.targets("satisfy", "vehicle") == ["massReq"]
+    assert trace.targets("verify", "massTest") == ["wheelReq"]
+    assert trace.targets("derive", "massReq") == ["wheelReq"]
+    assert trace.matrix("refine").nnz == 0
+    assert trace.targets("satisfy", "engine") == []
+
+
+def test_coverage_with_derivation(backend):
+    trace = Traceability.from_elements(_elements())
+
+    direct = trace.coverage(transitive=False)
+    assert direct.requirements == 3
+    assert direct.unsatisfied == ["powerReq"]
+    assert direct.unverified == ["massReq", "powerReq"]
+    assert direct.orphan_parts == ["engine"]
+
+    # massReq is verified through the requirement derived from it.
+    report = trace.coverage()
+    assert report.unverified == ["powerReq"]
+    assert report.verified_ratio == pytest.approx(2 / 3)
+
+
+def test_closure_of_derivation_chains(backend):
+    chain = [(f"r{i}", f"r{i + 1}") for i in range(9)] + [("r4", "x"), ("y", "r0")]
+    trace = Traceability({"derive": chain, "refine": [("r9", "z")]})
+
+    closure = trace.closure("derive")
+    assert closure.nnz == sum(range(11)) + 5 + 1
+    assert trace.targets("derive", "r7", transitive=True) == ["r8", "r9"]
+    assert sorted(trace.targets("derive", "r3", transitive=True)) == sorted(
+        [f"r{i}" for i in range(4, 10)] + ["x"]
+    )
+    both = trace.closure(["refine", "derive"])
+    assert "z" in [trace.ids[j] for j in both.indices[both.indptr[0] : both.indptr[1]]]
+    with pytest.raises(ValueError):
+        trace.closure([])
+    dense = closure.toarray()
+    assert dense.shape == (len(trace), len(trace))
+    assert bool(dense[trace.index("y"), trace.index("r9")])
+
+
+def test_export_matrix_market(backend, monkeypatch):
+    monkeypatch.setattr(traceability, "_EXPORT_ROWS", 2)
+    trace = Traceability(
+        {"satisfy": [("p1", "r1"), ("p2", "r1"), ("p2", "r2")]}, requirements=["r3"]
+    )
+    out = io.StringIO()
+
+    assert trace.export("satisfy", out) == 3
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "%%MatrixMarket matrix coordinate pattern general"
+    ids = [line[2:] for line in lines[2:7]]
+    assert ids == trace.ids == ["p1", "r1", "p2", "r2", "r3"]
+    assert lines[7:] == ["5 5 3", "1 2", "3 2", "3 4"]
@@ -0,0 +1,117 @@
+"""Tests for client-side load balancing across API replicas."""
+
+import socket
+import time
+from collections import Counter
+
+import httpx
+import pytest
+
+from sysml_v2.api.balancer import ReplicaSet
+from sysml_v2.api.client import SysMLClient
+
+
+class Replicas:
+    """Stand-in API replicas that record which one served each request."""
+
+    def __init__(self, stub_server, count, delays=None):
+        self.hits = Counter()
+        self.failing = set()
+        self.delays = delays or {}
+        self.urls = [stub_server(self._handler(i)) for i in range(count)]
+
+    def _handler(self, i):
+        def handle(method, path, headers, body):
+            self.hits[i, method] += 1
+            time.sleep(self.delays.get(i, 0))
+            if i in self.failing:
+                return 503, {"error": "unavailable"}
+            if method == "POST":
+                return 200, {"@id": f"created-on-{i}"}
+            return 200, [{"@id": "p1", "replica": i}]
+
+        return handle
+
+    def reads(self, i):
+        return self.hits[i, "GET"]
+
+
+def _closed_port_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+def test_reads_spread_and_writes_stick(stub_server):
+    replicas = Replicas(stub_server, 3)
+
+    with SysMLClient(urls=replicas.urls) as client:
+        for _ in range(30):
+            client.list_projects()
+        for _ in range(5):
+            assert client.create_project("x")["@id"] == "created-on-0"
+
+    assert all(replicas.reads(i) >= 5 for i in range(3))
+    assert sum(replicas.reads(i) for i in range(3)) == 30
+    assert replicas.hits[0, "POST"] == 5
+
+
+def test_queries_spread_across_replicas(stub_server):
+    replicas = Replicas(stub_server, 3)
+
+    with SysMLClient(urls=replicas.urls) as client:
+        for _ in range(30):
+            client.query("p1", "c1", {"@type": "Query"})
+
+    # Not pinned to the writer like other POSTs
+    assert all(replicas.hits[i, "POST"] >= 1 for i in range(3))
+
+
+def test_slow_replica_gets_less_traffic(stub_server):
+    replicas = Replicas(stub_server, 2, delays={0: 0.05})
+
+    with SysMLClient(urls=replicas.urls) as client:
+        for _ in range(20):
+            client.list_projects()
+
+    assert replicas.reads(1) > 3 * replicas.reads(0)
+
+
+def test_failing_replica_is_ejected_then_readmitted(stub_server, monkeypatch):
+    replicas = Replicas(stub_server, 2)
+    state = ReplicaSet(replicas.urls, max_failures=1, cooldown=1.0)
+    monkeypatch.setitem(ReplicaSet._shared, tuple(replicas.urls), state)
+    replicas.failing.add(1)
+
+    with SysMLClient(urls=replicas.urls) as client:
+        # Failed reads are retried on the healthy replica.
+        results = [client.list_projects()[0]["replica"] for _ in range(5)]
+        assert results == [0] * 5
+        assert replicas.reads(1) == 1
+        assert state.replicas[1].ejected
+
+        replicas.failing.clear()
+        time.sleep(1.05)
+        for _ in range(10):
+            client.list_projects()
+
+    assert not state.replicas[1].ejected
+    # The health probe plus at least one routed read
+    assert replicas.reads(1) >= 3
+
+
+def test_writes_fail_over_and_stay(stub_server):
+    replicas = Replicas(stub_server, 2)
+    urls = [_closed_port_url(), *replicas.urls]
+
+    with SysMLClient(urls=urls) as client:
+        assert client.healthy()
+        assert client.create_project("x")["@id"] == "created-on-0"
+        replicas.failing.add(0)
+        with pytest.raises(httpx.HTTPStatusError):
+            client.create_project("y")
+        assert [client.list_projects()[0]["replica"] for _ in range(4)] == [1] * 4
+
+    assert replicas.hits[0, "POST"] == 2
+    assert replicas.hits[1, "POST"] == 0
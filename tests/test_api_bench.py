@@ -0,0 +1,84 @@
+"""Tests for the API load generator."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from sysml_v2.api.bench import _percentile, parse_mix, run_bench
+from sysml_v2.cli import main
+
+_ROUTES = {
+    "/projects": [{"@id": "p1"}],
+    "/projects/p1/commits": [{"@id": "c0"}, {"@id": "c1"}],
+    "/projects/p1/commits/c1/elements": [{"@id": "e1", "@type": "PartUsage"}],
+    "/projects/p1/commits/c1/query": [{"@id": "e1", "@type": "PartUsage"}],
+}
+
+
+def _handler(method, path, headers, body):
+    if path in _ROUTES:
+        return 200, _ROUTES[path]
+    return 404, {"error": "not found"}
+
+
+def test_parse_mix():
+    assert parse_mix("projects=1, elements=4,query") == {
+        "projects": 1,
+        "elements": 4,
+        "query": 1,
+    }
+    with pytest.raises(ValueError):
+        parse_mix("deploy=1")
+    with pytest.raises(ValueError, match="negative"):
+        parse_mix("projects=2,elements=-1")
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+
+    assert _percentile(values, 50) == 50.0
+    assert _percentile(values, 99) == 99.0
+    assert _percentile([3.0], 90) == 3.0
+
+
+def test_run_bench_counts_requests_and_errors(mock_client):
+    results = run_bench(
+        lambda: mock_client(_ROUTES),
+        "p1",
+        "c1",
+        mix={"projects": 1, "elements": 1, "commits": 0},
+        concurrency=3,
+        requests=30,
+    )
+
+    assert results["requests"] == 30
+    assert results["errors"] == 0
+    assert results["operations"]["commits"]["requests"] == 0
+    ops = results["operations"]
+    assert ops["projects"]["requests"] + ops["elements"]["requests"] == 30
+    assert results["latency_ms"]["p99"] >= results["latency_ms"]["p50"]
+
+    failing = run_bench(lambda: mock_client(_ROUTES), "p1", "missing", mix={"elements": 1}, requests=5)
+    assert failing["errors"] == 5
+
+
+def test_serve_bench_writes_json(stub_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    url = stub_server(_handler)
+    out = tmp_path / "bench.json"
+
+    result = CliRunner().invoke(
+        main, ["serve", "bench", "--url", url, "-n", "12", "-c", "2", "-o", str(out)]
+    )
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(out.read_text())
+    assert data["url"] == url
+    assert data["commit_id"] == "c1"
+    assert data["requests"] == 12
+    assert data["errors"] == 0
+
+    result = CliRunner().invoke(main, ["serve", "bench", "--url", url, "--duration", "0"])
+    assert result.exit_code == 2
+    assert "--duration" in result.output
@@ -0,0 +1,94 @@
+"""Tests for the local project mirror."""
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from sysml_v2.api.mirror import Mirror, MirrorClient
+from sysml_v2.api.query import Query
+from sysml_v2.cli import main
+
+_ELEMENTS = {
+    "c1": [{"@id": "a", "@type": "PartUsage", "name": "a"}],
+    "c2": [
+        {"@id": "a", "@type": "PartUsage", "name": "a"},
+        {"@id": "b", "@type": "PortUsage", "name": "b"},
+    ],
+}
+
+
+class FakeServer:
+    """Serves one project whose commit list can grow between pulls."""
+
+    def __init__(self):
+        self.commits = ["c1"]
+        self.element_fetches = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/projects/p1":
+            return httpx.Response(200, json={"@id": "p1", "name": "Demo"})
+        if path == "/projects/p1/commits":
+            return httpx.Response(200, json=[{"@id": c} for c in self.commits])
+        for commit in self.commits:
+            if path == f"/projects/p1/commits/{commit}/elements":
+                self.element_fetches.append(commit)
+                return httpx.Response(200, json=_ELEMENTS[commit])
+        return httpx.Response(404, json={"error": "not found"})
+
+
+def test_pull_is_incremental(tmp_path, mock_client):
+    server = FakeServer()
+    with Mirror(tmp_path / "m.db") as mirror:
+        first = mirror.pull(mock_client(server.handle), "p1")
+        server.commits.append("c2")
+        second = mirror.pull(mock_client(server.handle), "p1")
+        third = mirror.pull(mock_client(server.handle), "p1")
+
+    assert (first.new_commits, first.elements) == (1, 1)
+    assert (second.new_commits, second.elements) == (1, 2)
+    assert third.new_commits == 0
+    assert server.element_fetches == ["c1", "c2"]
+
+
+def test_mirror_client_matches_client_surface(tmp_path, mock_client):
+    server = FakeServer()
+    server.commits.append("c2")
+    with Mirror(tmp_path / "m.db") as mirror:
+        mirror.pull(mock_client(server.handle), "p1")
+
+    with MirrorClient(tmp_path / "m.db") as client:
+        assert client.healthy()
+        assert client.list_projects() == [{"@id": "p1", "name": "Demo"}]
+        assert [c["@id"] for c in client.list_commits("p1")] == ["c1", "c2"]
+        assert client.get_elements("p1", "c2") == _ELEMENTS["c2"]
+        assert client.get_element("p1", "c1", "a")["name"] == "a"
+        assert client.query("p1", "c2", Query().where(type="PortUsage")) == [
+            _ELEMENTS["c2"][1]
+        ]
+
+        with pytest.raises(httpx.HTTPStatusError) as missing:
+            client.get_commit("p1", "nope")
+        assert missing.value.response.status_code == 404
+        with pytest.raises(httpx.HTTPStatusError) as write:
+            client.create_project("x")
+        assert write.value.response.status_code == 405
+
+
+def test_pull_command(stub_server, tmp_path, monkeypatch):
+    server = FakeServer()
+
+    def handler(method, path, headers, body):
+        resp = server.handle(httpx.Request(method, f"http://stub{path}"))
+        return resp.status_code, resp.json()
+
+    url = stub_server(handler)
+    monkeypatch.chdir(tmp_path)
+    db = tmp_path / "mirror.db"
+
+    result = CliRunner().invoke(main, ["pull", "p1", "--url", url, "--db", str(db)])
+
+    assert result.exit_code == 0, result.output
+    assert "1 new commit(s)" in result.output
+    with MirrorClient(db) as client:
+        assert client.get_elements("p1", "c1") == _ELEMENTS["c1"]
@@ -0,0 +1,93 @@
+"""Tests for the query builder and local evaluator."""
+
+import json
+
+import httpx
+
+from sysml_v2.api.query import Query, evaluate, run_query
+
+_ELEMENTS = [
+    {"@id": "pkg", "@type": "Package", "name": "X"},
+    {"@id": "v", "@type": "PartDefinition", "name": "Vehicle", "owner": {"@id": "pkg"}},
+    {"@id": "e", "@type": "PartUsage", "name": "engine", "owner": {"@id": "v"}},
+    {"@id": "w", "@type": "PartUsage", "name": "wheels", "owner": {"@id": "v"}},
+    {"@id": "o", "@type": "PartUsage", "name": "other", "owner": {"@id": "elsewhere"}},
+    {"@id": "m", "@type": "AttributeUsage", "name": "mass", "owner": {"@id": "e"}},
+]
+
+
+def test_query_compiles_to_schema():
+    body = Query().where(type="PartUsage", name=("engine", "wheels")).select("name").to_dict()
+
+    assert body == {
+        "@type": "Query",
+        "select": ["name"],
+        "where": {
+            "@type": "CompositeConstraint",
+            "operator": "and",
+            "constraint": [
+                {
+                    "@type": "PrimitiveConstraint",
+                    "inverse": False,
+                    "operator": "=",
+                    "property": "@type",
+                    "value": "PartUsage",
+                },
+                {
+                    "@type": "CompositeConstraint",
+                    "operator": "or",
+                    "constraint": [
+                        {
+                            "@type": "PrimitiveConstraint",
+                            "inverse": False,
+                            "operator": "=",
+                            "property": "name",
+                            "value": name,
+                        }
+                        for name in ("engine", "wheels")
+                    ],
+                },
+            ],
+        },
+    }
+
+
+def test_evaluate_scope_owner_and_select():
+    parts = Query().where(type="PartUsage").scope("pkg").select("name").evaluate(_ELEMENTS)
+    assert parts == [{"@id": "e", "name": "engine"}, {"@id": "w", "name": "wheels"}]
+
+    owned = Query().where(owner="e").evaluate(_ELEMENTS)
+    assert [el["@id"] for el in owned] == ["m"]
+
+    inverse = {
+        "@type": "Query",
+        "where": {**Query().where(type="PartUsage").to_dict()["where"], "inverse": True},
+    }
+    assert [el["@id"] for el in evaluate(inverse, _ELEMENTS)] == ["pkg", "v", "m"]
+
+
+def test_client_query_accepts_builder(mock_client):
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.read()))
+        return httpx.Response(200, json=[])
+
+    client = mock_client(handler)
+    q = Query().where(type="PartUsage")
+
+    assert client.query("p1", "c1", q) == []
+    assert bodies == [q.to_dict()]
+
+
+def test_run_query_falls_back_to_local_evaluation(mock_client):
+    def handler(request):
+        if request.url.path.endswith("/query"):
+            return httpx.Response(501, json={"error": "unsupported"})
+        return httpx.Response(200, json=_ELEMENTS)
+
+    client = mock_client(handler)
+
+    result = run_query(client, "p1", "c1", Query().where(name="wheels"))
+
+    assert [el["@id"] for el in result] == ["w"]
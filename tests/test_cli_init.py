@@ -1,10 +1,18 @@
 """Tests for ``sysml init``."""
 
+import pytest
 from click.testing import CliRunner
 
 from sysml_v2.cli import main
 
 
+@pytest.fixture(autouse=True)
+def offline_library(tmp_path, monkeypatch):
+    """Keep the library cache out of the home directory and off the network."""
+    monkeypatch.setenv("SYSML_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SYSML_LIBRARY_URL", (tmp_path / "no-such-repo").as_uri())
+
+
 def test_init_creates_project_structure(tmp_path):
     """sysml init should create the expected directory structure."""
     dest = tmp_path / "my-project"
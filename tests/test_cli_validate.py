@@ -1,11 +1,18 @@
 """Tests for ``sysml validate``."""
 
+import importlib
+import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
+import httpx
 from click.testing import CliRunner
 
 from sysml_v2.cli import main
 
+# ``sysml_v2.cli.validate`` is shadowed by the command of the same name.
+validate_mod = importlib.import_module("sysml_v2.cli.validate")
+
 
 def _write_sysml(tmp_path: Path, name: str, content: str) -> Path:
     """Write a .sysml file to tmp_path and return its path."""
@@ -41,3 +48,123 @@ def test_validate_finds_sysml_files(tmp_path):
     found = find_models(models)
     assert len(found) == 2
     assert all(f.suffix == ".sysml" for f in found)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@patch("sysml_v2.cli.validate._check_file", return_value=None)
+def test_validate_changed_since_selects_dependents(mock_check, tmp_path):
+    """--changed-since should validate changed files and their dependents in order."""
+    _write_sysml(tmp_path, "base.sysml", "package Base { }")
+    _write_sysml(tmp_path, "user.sysml", "package User { import Base::*; }")
+    _write_sysml(tmp_path, "other.sysml", "package Other { }")
+    _git(tmp_path, "init")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "init")
+
+    _write_sysml(tmp_path, "base.sysml", "package Base { part def P; }")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        main,
+        ["validate", str(tmp_path / "models"), "--changed-since", "HEAD", "-j", "1"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Validating 2 of 3 file(s)" in result.output
+    checked = [call.args[0].name for call in mock_check.call_args_list]
+    assert checked == ["base.sysml", "user.sysml"]
+
+
+def test_validate_server_streams_file_body(tmp_path, monkeypatch):
+    """Server validation should stream each file with an explicit Content-Length."""
+    f = _write_sysml(tmp_path, "a.sysml", "package A { }")
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.headers.get("content-length"), request.read()))
+        return httpx.Response(200, json={})
+
+    real_client = httpx.Client
+    monkeypatch.setattr(
+        validate_mod.httpx,
+        "Client",
+        lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw),
+    )
+
+    errors = validate_mod._validate_server([f], "http://test")
+
+    assert errors == []
+    assert seen == [("13", b"package A { }")]
+
+
+def _many_files(tmp_path, count, bad):
+    files = []
+    for i in range(count):
+        body = f"package P{i} {{\n    part p{i};\n"
+        if i in bad:
+            body += "    ERROR\n"
+        files.append(_write_sysml(tmp_path, f"m{i:03}.sysml", body + "}"))
+    return files
+
+
+def test_validate_server_batches_files(tmp_path, parse_server):
+    """Batched server validation should pack files and blame the right ones."""
+    files = _many_files(tmp_path, 200, bad={17, 150})
+
+    errors = validate_mod._validate_server(files, parse_server.url, batch_bytes=1 << 20)
+
+    assert [(path.name, msg) for path, msg in errors] == [
+        ("m017.sysml", "Syntax error at line 3"),
+        ("m150.sysml", "Syntax error at line 3"),
+    ]
+    # One batch, plus a solo check and a resubmission of the rest per error
+    assert len(parse_server.bodies) == 5
+    assert parse_server.bodies[0].count(b"\n") == sum(
+        len(f.read_text().splitlines()) for f in files
+    ) - 1
+
+
+def test_validate_server_batches_isolate_incomplete_files(tmp_path, parse_server):
+    """A file whose open block is closed by the next file should still fail."""
+    files = _many_files(tmp_path, 6, bad=set())
+    files[2].write_text("package P2 {\n    part p2;\n")
+    files[3].write_text("}\npackage P3 {\n    part p3;\n}")
+
+    errors = validate_mod._validate_server(files, parse_server.url, batch_bytes=1 << 20)
+
+    assert [(path.name, msg) for path, msg in errors] == [
+        ("m002.sysml", "Syntax error at line 2"),
+        ("m003.sysml", "Syntax error at line 1"),
+    ]
+    # The two incomplete files are each sent alone, between the others
+    assert len(parse_server.bodies) == 4
+
+
+def test_validate_server_batches_skip_scanning_oversized_files(tmp_path, monkeypatch):
+    """Files over the batch budget are sent alone without being scanned."""
+    small = _write_sysml(tmp_path, "small.sysml", "package S { }")
+    big = _write_sysml(tmp_path, "big.sysml", "package B { }" + " " * 100)
+    scanned = []
+    monkeypatch.setattr(validate_mod, "_complete", lambda p: scanned.append(p) or True)
+
+    assert validate_mod._batches([small, big, small], budget=50) == [[small], [big], [small]]
+    assert scanned == [small, small]
+
+
+def test_validate_server_batches_bisect_without_lines(tmp_path, parse_server):
+    """Errors without a line number should be isolated by bisection."""
+    parse_server.report_lines = False
+    files = _many_files(tmp_path, 64, bad={5})
+
+    errors = validate_mod._validate_server(files, parse_server.url, batch_bytes=400)
+
+    assert [(path.name, msg) for path, msg in errors] == [("m005.sysml", "Syntax error")]
+    assert len(parse_server.bodies) < len(files) // 2
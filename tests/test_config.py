@@ -1,5 +1,7 @@
 """Tests for project config loading."""
 
+import pytest
+
 from sysml_v2.config import find_config, load_config
 
 
@@ -45,3 +47,46 @@ def test_load_config_reads_toml(tmp_path):
 
     assert cfg.server.backend == "gearshift"
     assert cfg.server.url == "http://localhost:8080"
+
+
+def test_load_config_reads_validate_exclude(tmp_path):
+    (tmp_path / "sysml.toml").write_text('[validate]\nexclude = ["lib/", "data/**"]\n')
+
+    cfg = load_config(tmp_path)
+
+    assert cfg.validate.exclude == ("lib/", "data/**")
+
+
+def test_load_config_reads_validate_batch_bytes(tmp_path):
+    (tmp_path / "sysml.toml").write_text("[validate]\nbatch_bytes = 65536\n")
+
+    assert load_config(tmp_path).validate.batch_bytes == 65536
+
+
+def test_load_config_reads_server_urls(tmp_path):
+    (tmp_path / "sysml.toml").write_text(
+        '[server]\nurls = ["http://api-1:8083", "http://api-2:8083"]\n'
+    )
+
+    cfg = load_config(tmp_path)
+    assert cfg.server.urls == ("http://api-1:8083", "http://api-2:8083")
+    assert cfg.server.url == "http://api-1:8083"
+
+
+@pytest.mark.parametrize(
+    "toml",
+    ['[server]\nurls = "http://localhost:8083"\n', '[validate]\nexclude = ["lib/", 3]\n'],
+)
+def test_load_config_rejects_non_list_settings(tmp_path, toml):
+    (tmp_path / "sysml.toml").write_text(toml)
+
+    with pytest.raises(ValueError, match="must be a list of strings"):
+        load_config(tmp_path)
+
+
+@pytest.mark.parametrize("value", ['"64k"', "-1", "1.5", "true"])
+def test_load_config_rejects_bad_batch_bytes(tmp_path, value):
+    (tmp_path / "sysml.toml").write_text(f"[validate]\nbatch_bytes = {value}\n")
+
+    with pytest.raises(ValueError, match="batch_bytes must be a non-negative integer"):
+        load_config(tmp_path)
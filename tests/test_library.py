@@ -0,0 +1,127 @@
+"""Tests for the standard library cache."""
+
+import errno
+import os
+import shutil
+import subprocess
+
+import pytest
+from click.testing import CliRunner
+
+from sysml_v2 import library
+from sysml_v2.cli import main
+
+
+def _git(*args, cwd):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def release_repo(tmp_path, monkeypatch):
+    """A local stand-in for SysML-v2-Release with a ``2024-12`` tag."""
+    repo = tmp_path / "release"
+    (repo / "sysml.library" / "Kernel").mkdir(parents=True)
+    (repo / "sysml.library" / "Kernel" / "Base.kerml").write_text("package Base;\n")
+    _git("init", "-q", "-b", "master", ".", cwd=repo)
+    _git("add", ".", cwd=repo)
+    _git("commit", "-q", "-m", "release", cwd=repo)
+    _git("tag", "2024-12", cwd=repo)
+    monkeypatch.setenv("SYSML_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SYSML_LIBRARY_URL", repo.as_uri())
+    return repo
+
+
+def test_fetch_caches_each_release_once(release_repo, tmp_path, monkeypatch):
+    path = library.fetch("2024-12")
+
+    assert path == tmp_path / "cache" / "SysML-v2-Release" / "2024-12"
+    assert (path / "sysml.library" / "Kernel" / "Base.kerml").read_text() == "package Base;\n"
+    assert not (path / ".git").exists()
+    assert library.cached_release("2024-12") == path
+    assert library.cached_release("master") is None
+
+    # A second fetch is served from the cache even with the origin gone.
+    monkeypatch.setenv("SYSML_LIBRARY_URL", (tmp_path / "missing").as_uri())
+    assert library.fetch("2024-12") == path
+    with pytest.raises(RuntimeError):
+        library.fetch("master")
+    assert library.cached_release("master") is None
+
+
+def test_fetch_refresh_and_release_names(release_repo, tmp_path):
+    path = library.fetch("master")
+    (release_repo / "sysml.library" / "New.kerml").write_text("package New;\n")
+    _git("add", ".", cwd=release_repo)
+    _git("commit", "-q", "-m", "update", cwd=release_repo)
+
+    assert not (library.fetch("master") / "sysml.library" / "New.kerml").exists()
+    assert library.fetch("master", refresh=True) == path
+    assert (path / "sysml.library" / "New.kerml").is_file()
+    assert [p.name for p in path.parent.iterdir()] == ["master"]
+
+    for bad in ("../x", "a/b", "..", ""):
+        with pytest.raises(ValueError):
+            library.fetch(bad)
+    result = CliRunner().invoke(main, ["init", str(tmp_path / "p"), "-y", "--release", "../x"])
+    assert result.exit_code == 2
+    assert not (tmp_path / "cache" / "x").exists()
+
+
+def test_materialize_shares_file_data(tmp_path):
+    source = tmp_path / "source"
+    (source / "a").mkdir(parents=True)
+    (source / "a" / "x.sysml").write_text("package X;\n")
+
+    method = library.materialize(source, tmp_path / "dest")
+
+    copied = tmp_path / "dest" / "a" / "x.sysml"
+    assert copied.read_text() == "package X;\n"
+    assert method in ("reflink", "hardlink", "copy")
+    if method == "hardlink":
+        assert os.path.samefile(copied, source / "a" / "x.sysml")
+
+
+def test_materialize_leaves_nothing_on_failure(tmp_path, monkeypatch):
+    source = tmp_path / "source"
+    source.mkdir()
+    for name in ("a.sysml", "b.sysml"):
+        (source / name).write_text("package X;\n")
+    copied = []
+    real_copy2 = shutil.copy2
+
+    def unsupported(src, dst):
+        raise OSError(errno.EXDEV, "Unsupported")
+
+    def copy2(src, dst):
+        if copied:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        copied.append(real_copy2(src, dst))
+
+    monkeypatch.setattr(library, "_reflink", unsupported)
+    monkeypatch.setattr(os, "link", unsupported)
+    monkeypatch.setattr(shutil, "copy2", copy2)
+
+    with pytest.raises(OSError, match="No space left"):
+        library.materialize(source, tmp_path / "dest")
+
+    assert copied
+    assert [p.name for p in tmp_path.iterdir()] == ["source"]
+
+
+def test_init_installs_library_offline_after_first_fetch(release_repo, tmp_path, monkeypatch):
+    runner = CliRunner()
+    first = runner.invoke(main, ["init", str(tmp_path / "p1"), "-y"])
+    assert first.exit_code == 0, first.output
+    assert "Standard library installed" in first.output
+
+    monkeypatch.setenv("SYSML_LIBRARY_URL", (tmp_path / "missing").as_uri())
+    second = runner.invoke(main, ["init", str(tmp_path / "p2")], input="\n")
+    assert second.exit_code == 0, second.output
+    assert "Fetching" not in second.output
+    lib = tmp_path / "p2" / "lib" / "SysML-v2-Release" / "sysml.library"
+    assert (lib / "Kernel" / "Base.kerml").is_file()
@@ -0,0 +1,92 @@
+"""Tests for the file dependency graph."""
+
+from pathlib import Path
+
+from sysml_v2.parsing.graph import DependencyGraph
+from sysml_v2.parsing.scan import outline
+
+
+def _write(directory: Path, name: str, content: str) -> Path:
+    path = directory / name
+    path.write_text(content)
+    return path
+
+
+def test_outline_collects_packages_imports_and_references():
+    text = """
+    package Outer {
+        doc /* package Fake { } */
+        // import Commented::*;
+        package Inner {
+            import Other::*;
+            part x : Lib::Thing;
+        }
+        attribute name = "package Str {";
+    }
+    """
+    info = outline(text)
+
+    assert info.packages == ["Outer", "Outer::Inner"]
+    assert info.imports == [("Outer::Inner", "Other::*")]
+    assert ("Outer::Inner::x", "Lib::Thing") not in info.references
+    assert ("Outer::Inner", "Lib::Thing") in info.references
+    assert info.docs == [("Outer", "package Fake { }")]
+
+
+def test_graph_links_imports_and_qualified_references(tmp_path):
+    base = _write(tmp_path, "base.sysml", "package Base { part def P; }")
+    mid = _write(tmp_path, "mid.sysml", "package Mid { import Base::*; }")
+    top = _write(tmp_path, "top.sysml", "package Top { part p : Mid::Q; }")
+    lone = _write(tmp_path, "lone.sysml", "package Lone { import ISQ::*; }")
+
+    graph = DependencyGraph.build([base, mid, top, lone])
+
+    assert graph.dependencies[mid] == {base}
+    assert graph.dependencies[top] == {mid}
+    assert graph.dependencies[lone] == set()
+    assert graph.impacted([base]) == {base, mid, top}
+    assert graph.impacted([top]) == {top}
+
+
+def test_graph_links_every_file_of_a_split_package(tmp_path):
+    first = _write(tmp_path, "a.sysml", "package Shared { part def A; }")
+    second = _write(tmp_path, "b.sysml", "package Shared { part def B; }")
+    user = _write(tmp_path, "user.sysml", "package User { part b : Shared::B; }")
+    importer = _write(tmp_path, "importer.sysml", "package Imp { import Shared::*; }")
+
+    graph = DependencyGraph.build([first, second, user, importer])
+
+    assert graph.namespaces["Shared"] == {first, second}
+    assert graph.dependencies[user] == {first, second}
+    assert graph.impacted([second]) == {second, user, importer}
+
+
+def test_levels_are_topological(tmp_path):
+    a = _write(tmp_path, "a.sysml", "package A { }")
+    b = _write(tmp_path, "b.sysml", "package B { import A::*; }")
+    c = _write(tmp_path, "c.sysml", "package C { import A::*; }")
+    d = _write(tmp_path, "d.sysml", "package D { import B::*; import C::*; }")
+
+    graph = DependencyGraph.build([d, c, b, a])
+
+    assert graph.levels() == [[a], [b, c], [d]]
+    assert graph.order({a, d}) == [a, d]
+
+
+def test_levels_keep_cycles_last(tmp_path):
+    a = _write(tmp_path, "a.sysml", "package A { import B::*; }")
+    b = _write(tmp_path, "b.sysml", "package B { import A::*; }")
+    c = _write(tmp_path, "c.sysml", "package C { }")
+
+    graph = DependencyGraph.build([a, b, c])
+
+    assert graph.levels() == [[c], [a, b]]
+
+
+def test_referencing_deleted_packages(tmp_path):
+    user = _write(tmp_path, "user.sysml", "package User { import Gone::Sub::*; }")
+    other = _write(tmp_path, "other.sysml", "package Other { }")
+
+    graph = DependencyGraph.build([user, other])
+
+    assert graph.referencing(["Gone"]) == {user}
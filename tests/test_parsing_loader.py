@@ -0,0 +1,130 @@
+"""Tests for model file loading helpers."""
+
+import os
+import time
+
+import pytest
+
+from sysml_v2.parsing.loader import find_models, iter_bytes, read_text
+
+
+def test_read_text_decodes_utf8(tmp_path):
+    path = tmp_path / "m.sysml"
+    path.write_text("package Café { doc /* ✓ */ }", encoding="utf-8")
+
+    assert read_text(path) == "package Café { doc /* ✓ */ }"
+
+
+def test_read_text_empty_file(tmp_path):
+    path = tmp_path / "empty.sysml"
+    path.write_bytes(b"")
+
+    assert read_text(path) == ""
+
+
+def test_read_text_normalizes_newlines_and_rejects_non_utf8(tmp_path):
+    path = tmp_path / "m.sysml"
+    path.write_bytes(b"package P {\r\n  part a;\r}\n")
+    assert read_text(path) == "package P {\n  part a;\n}\n"
+
+    path.write_bytes(b"\xff\xfe")
+    with pytest.raises(UnicodeDecodeError):
+        read_text(path)
+
+
+def test_iter_bytes_chunks(tmp_path):
+    path = tmp_path / "m.sysml"
+    path.write_bytes(b"x" * 10)
+
+    chunks = list(iter_bytes(path, chunk_size=4))
+
+    assert chunks == [b"xxxx", b"xxxx", b"xx"]
+
+
+def _touch(root, *names):
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("package P { }")
+
+
+def test_find_models_respects_gitignore(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("build/\n*.gen.sysml\n!keep.gen.sysml\n")
+    _touch(tmp_path, "models/a.sysml", "models/x.gen.sysml", "models/keep.gen.sysml")
+    _touch(tmp_path, "models/build/b.sysml", "models/sub/.gitignore")
+    (tmp_path / "models" / "sub" / ".gitignore").write_text("/local.sysml\n")
+    _touch(tmp_path, "models/sub/local.sysml", "models/sub/deep/local.sysml")
+
+    found = find_models(tmp_path / "models")
+
+    rel = [p.relative_to(tmp_path / "models").as_posix() for p in found]
+    assert rel == ["a.sysml", "keep.gen.sysml", "sub/deep/local.sysml"]
+
+
+def test_find_models_exclude_patterns(tmp_path):
+    _touch(tmp_path, "a.sysml", "lib/SysML-v2-Release/x.sysml", "data/big/y.sysml")
+
+    found = find_models(tmp_path, exclude=["lib/", "data/**"], gitignore=False)
+
+    assert found == [tmp_path / "a.sysml"]
+
+    # Anchored at the project directory, whichever subdirectory is walked
+    exclude = ["/data/big/", "x.sysml"]
+    assert find_models(tmp_path / "data", exclude=exclude, exclude_base=tmp_path) == []
+    assert find_models(tmp_path / "data", exclude=exclude) == [tmp_path / "data/big/y.sysml"]
+
+
+def _age(*dirs):
+    """Set *dirs*' mtimes a minute back, past the cache's racy-listing window."""
+    past = time.time() - 60
+    for directory in dirs:
+        os.utime(directory, (past, past))
+
+
+def test_find_models_cache_reuses_unchanged_listings(tmp_path, monkeypatch):
+    _touch(tmp_path, "m/a.sysml", "m/sub/b.sysml")
+    _age(tmp_path / "m", tmp_path / "m" / "sub")
+    cache = tmp_path / "cache.json"
+    first = find_models(tmp_path / "m", cache=cache)
+    assert cache.is_file()
+
+    calls = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda p: calls.append(p) or real_scandir(p))
+
+    assert find_models(tmp_path / "m", cache=cache) == first
+    assert calls == []
+
+    # Restoring the old mtime, as on a file system with coarse timestamps,
+    # does not hide the new file.
+    sub = tmp_path / "m" / "sub"
+    mtime = sub.stat().st_mtime_ns
+    _touch(tmp_path, "m/sub/c.sysml")
+    os.utime(sub, ns=(mtime, mtime))
+    found = find_models(tmp_path / "m", cache=cache)
+
+    assert [p.name for p in found] == ["a.sysml", "b.sysml", "c.sysml"]
+    assert calls == [str(sub.resolve())]
+
+    # Walking another subtree keeps the cached listings of this one.
+    _touch(tmp_path, "n/d.sysml")
+    find_models(tmp_path / "n", cache=cache)
+    calls.clear()
+    find_models(tmp_path / "m", cache=cache)
+    assert calls == []
+
+
+def test_find_models_cache_relists_recently_changed_dirs(tmp_path, monkeypatch):
+    _touch(tmp_path, "m/a.sysml")
+    cache = tmp_path / "cache.json"
+    find_models(tmp_path / "m", cache=cache)
+
+    calls = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda p: calls.append(p) or real_scandir(p))
+
+    # The directory changed too recently for its mtime to tell a later
+    # change apart, so it is listed again.
+    find_models(tmp_path / "m", cache=cache)
+    assert calls == [str((tmp_path / "m").resolve())]
@@ -0,0 +1,15 @@
+"""Tests for the lexical scanner."""
+
+from sysml_v2.parsing.scan import complete
+
+
+def test_complete_rejects_unbalanced_text():
+    assert complete("")
+    assert complete('package A { doc /* { */ attribute s = "}"; }\n// trailing')
+    assert complete("package A { } //* closed note */\n// line note")
+    assert not complete("package A {")
+    assert not complete("}\npackage B { }")
+    assert not complete("package A { } /* open")
+    assert not complete("package A { } //* open note")
+    assert not complete('package A { attribute s = "open; }')
+    assert not complete("package A { } part x :")
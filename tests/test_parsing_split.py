@@ -0,0 +1,59 @@
+"""Tests for splitting and parallel parsing of large model files."""
+
+import pytest
+from textx import TextXSyntaxError
+
+from sysml_v2.parsing.loader import loads
+from sysml_v2.parsing.split import Segment, split
+
+_TEXT = """\
+// generated export {
+package A {
+    part a;
+}
+//* } not a boundary */
+package B {
+    part b;
+}
+package C {
+    part c;
+}
+"""
+
+
+def test_split_at_top_level_packages():
+    segments = split(_TEXT)
+
+    # Segments start just past the previous closing brace.
+    assert [s.line for s in segments] == [1, 4, 8]
+    assert "".join(s.text for s in segments) == _TEXT
+    assert segments[1].text.lstrip().startswith("//* } not a boundary */")
+    assert split("package A { part a;") == [Segment("package A { part a;", 1)]
+
+
+def test_split_groups_into_max_segments():
+    segments = split(_TEXT, max_segments=2)
+
+    assert len(segments) == 2
+    assert "".join(s.text for s in segments) == _TEXT
+    assert segments[1].line in (4, 8)
+
+
+def test_parallel_loads_matches_sequential():
+    sequential = loads(_TEXT)
+    parallel = loads(_TEXT, jobs=2)
+
+    assert [p.name for p in parallel.children] == ["A", "B", "C"]
+    assert parallel.dump() == sequential.dump()
+
+
+def test_parallel_syntax_error_reports_file_line():
+    bad = _TEXT.replace("part c;", "part c )")
+
+    with pytest.raises(TextXSyntaxError) as sequential:
+        loads(bad)
+    with pytest.raises(TextXSyntaxError) as parallel:
+        loads(bad, jobs=2)
+
+    assert parallel.value.__context__.line == sequential.value.__context__.line == 10
+    assert parallel.value.line == 10
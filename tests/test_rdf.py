@@ -0,0 +1,139 @@
+"""Tests for the streaming N-Quads bulk loader."""
+
+import json
+import socket
+import threading
+
+from click.testing import CliRunner
+
+from sysml_v2 import rdf
+from sysml_v2.cli import main
+from sysml_v2.parsing.loader import loads
+
+_ELEMENTS = [
+    {
+        "@id": "5d1b8c2e-0000-4000-8000-000000000001",
+        "@type": "PartUsage",
+        "name": 'wheel "front"\nleft',
+        "isAbstract": False,
+        "owner": {"@id": "5d1b8c2e-0000-4000-8000-000000000002"},
+        "ownedFeature": [{"@id": "a b"}, {"@id": "c"}],
+        "multiplicity": None,
+    },
+]
+
+
+def test_element_quads():
+    graph = rdf.graph_iri("p1", "c1")
+    lines = list(rdf.element_quads(_ELEMENTS, graph))
+
+    subject = "<urn:uuid:5d1b8c2e-0000-4000-8000-000000000001>"
+    vocab = rdf.VOCAB_NS
+    rdf_type = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+    boolean = "<http://www.w3.org/2001/XMLSchema#boolean>"
+    assert graph == "<urn:sysml:project:p1:commit:c1>"
+    assert lines == [
+        f"{subject} {rdf_type} <{vocab}PartUsage> {graph} .\n",
+        f'{subject} <{vocab}name> "wheel \\"front\\"\\nleft" {graph} .\n',
+        f'{subject} <{vocab}isAbstract> "false"^^{boolean} {graph} .\n',
+        f"{subject} <{vocab}owner> <urn:uuid:5d1b8c2e-0000-4000-8000-000000000002> {graph} .\n",
+        f"{subject} <{vocab}ownedFeature> <urn:sysml:element:a%20b> {graph} .\n",
+        f"{subject} <{vocab}ownedFeature> <urn:sysml:element:c> {graph} .\n",
+    ]
+
+
+def test_model_elements_ids_for_unnamed_and_repeated_names():
+    anonymous = list(rdf.model_elements(loads("package { part a; }")))
+    assert [(e["name"], e["qualifiedName"]) for e in anonymous] == [(None, None), ("a", None)]
+    assert anonymous[1]["owner"] == {"@id": anonymous[0]["@id"]}
+
+    named = list(rdf.model_elements(loads("package P { part x; part x; part y; }")))
+    assert [e["qualifiedName"] for e in named] == ["P", "P::x", "P::x", "P::y"]
+    assert len({e["@id"] for e in named}) == 4
+    # IDs are stable across loads.
+    again = rdf.model_elements(loads("package P { part x; part x; part y; }"))
+    assert [e["@id"] for e in again] == [e["@id"] for e in named]
+
+
+def test_chunk_lines_keeps_lines_whole():
+    lines = [f"line {i}\n" for i in range(10)]
+
+    chunks = list(rdf.chunk_lines(iter(lines), chunk_bytes=20))
+
+    assert b"".join(chunks) == "".join(lines).encode()
+    assert all(chunk.endswith(b"\n") and len(chunk) <= 20 for chunk in chunks)
+
+
+def test_load_quads_bounds_concurrency_and_retries(stub_server):
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0, "failed": False, "bodies": []}
+    release = threading.Event()
+
+    def handler(method, path, headers, body):
+        with lock:
+            if not state["failed"]:
+                state["failed"] = True
+                return 503, "busy"
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            state["bodies"].append((headers["Content-Type"], body))
+        release.wait(0.05)
+        with lock:
+            state["active"] -= 1
+        return 204, ""
+
+    url = stub_server(handler) + "/ds/data"
+    chunks = rdf.chunk_lines((f"<s> <p> \"{i}\" <g> .\n" for i in range(100)), 200)
+
+    result = rdf.load_quads(chunks, url, concurrency=3)
+
+    assert result.quads == 100
+    assert result.chunks == len(state["bodies"])
+    assert 1 <= state["peak"] <= 3
+    assert {ctype for ctype, _ in state["bodies"]} == {"application/n-quads"}
+    assert sum(body.count(b"\n") for _, body in state["bodies"]) == 100
+
+
+def test_load_rdf_command(tmp_path, stub_server):
+    received = []
+
+    def handler(method, path, headers, body):
+        received.append(body)
+        return 200, ""
+
+    url = stub_server(handler)
+    export = tmp_path / "elements.json"
+    export.write_text(json.dumps(_ELEMENTS))
+
+    result = CliRunner().invoke(
+        main, ["load-rdf", str(export), "--store", f"{url}/ds/data", "--graph", "urn:g"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Loaded 6 quad(s) in 1 request(s)" in result.output
+    assert received[0].count(b"<urn:g> .\n") == 6
+
+    second = tmp_path / "more.json"
+    second.write_text(json.dumps(_ELEMENTS))
+    out = tmp_path / "out.nq"
+    result = CliRunner().invoke(main, ["load-rdf", str(export), str(second), "-o", str(out)])
+    assert result.exit_code == 0, result.output
+    graphs = {line.rsplit(" ", 2)[1] for line in out.read_text().splitlines()}
+    assert graphs == {rdf.file_graph_iri(export), rdf.file_graph_iri(second)}
+    assert all(g.startswith("<urn:sysml:file:") for g in graphs)
+
+
+def test_load_rdf_project_uses_configured_urls(tmp_path, monkeypatch, stub_server):
+    routes = {"/projects/p/commits": [{"@id": "c1"}], "/projects/p/commits/c1/elements": _ELEMENTS}
+    url = stub_server(lambda method, path, headers, body: (200, routes[path]))
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        down = f"http://127.0.0.1:{sock.getsockname()[1]}"
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "sysml.toml").write_text(f'[server]\nurls = ["{down}", "{url}"]\n')
+    out = tmp_path / "out.nq"
+
+    result = CliRunner().invoke(main, ["load-rdf", "--project", "p", "-o", str(out)])
+
+    assert result.exit_code == 0, result.output
+    assert rdf.graph_iri("p", "c1") in out.read_text()
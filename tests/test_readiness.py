@@ -0,0 +1,67 @@
+"""Tests for service readiness probing."""
+
+import socket
+
+from sysml_v2.readiness import Probe, compose_probes, wait_ready
+
+
+def test_compose_probes_reads_published_ports(tmp_path):
+    compose = tmp_path / "docker-compose.yml"
+    compose.write_text(
+        "services:\n"
+        "  quad-store:\n"
+        "    image: fuseki\n"
+        "    ports:\n"
+        '      - "3030:3030"\n'
+        "  internal:\n"
+        "    image: x\n"
+        "  sysmlv2-api:\n"
+        "    environment:\n"
+        "      PORT: 8080\n"
+        "    ports:\n"
+        "      - 127.0.0.1:8083:8080\n"
+    )
+
+    probes = compose_probes(compose)
+
+    assert probes == [
+        Probe("quad-store", "http://localhost:3030/ds"),
+        Probe("sysmlv2-api", "http://localhost:8083/projects"),
+    ]
+
+
+def test_wait_ready_retries_until_ready(stub_server):
+    calls = []
+
+    def handler(method, path, headers, body):
+        calls.append(path)
+        return (503, "starting") if len(calls) < 3 else (200, "ok")
+
+    url = stub_server(handler)
+    seen = []
+
+    (result,) = wait_ready(
+        [Probe("api", f"{url}/projects")], timeout=5, on_ready=seen.append
+    )
+
+    assert result.ready
+    assert result.attempts == 3
+    assert result.elapsed < 1.0
+    assert seen == [result]
+
+
+def test_wait_ready_times_out(stub_server):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    up = stub_server(lambda *args: (200, "ok"))
+
+    down, ok = wait_ready(
+        [Probe("down", f"http://127.0.0.1:{port}/"), Probe("up", f"{up}/")],
+        timeout=0.3,
+    )
+
+    assert not down.ready
+    assert down.attempts > 1
+    assert down.error
+    assert ok.ready
@@ -0,0 +1,150 @@
+"""Tests for the trigram name index and ``sysml find``."""
+
+import os
+import socket
+
+from click.testing import CliRunner
+
+from sysml_v2.cli import main
+from sysml_v2.search import NameIndex
+
+_VEHICLE = """\
+package Vehicle {
+    doc /* Vehicle model with the drivetrain. */
+    part def Engine {
+        port driveOut;
+        attribute torqueMax;
+    }
+    part transmission {
+        port driveIn;
+        port driveOutShaft;
+    }
+}
+"""
+
+
+def _names(matches):
+    return [m.qualified_name for m in matches]
+
+
+def test_index_files_substring_glob_and_doc(tmp_path):
+    (tmp_path / "models").mkdir()
+    model = tmp_path / "models" / "vehicle.sysml"
+    model.write_text(_VEHICLE)
+
+    with NameIndex(tmp_path / "names.db") as index:
+        stats = index.index_directory(tmp_path / "models")
+        assert (stats.indexed, stats.elements) == (1, 7)
+
+        exact, longer = index.find("driveout")
+        assert exact.qualified_name == "Vehicle::Engine::driveOut"
+        assert (exact.kind, exact.line, exact.score) == ("port", 4, 1.0)
+        assert longer.name == "driveOutShaft"
+        assert sorted(_names(index.find("*drive*"))) == [
+            "Vehicle::Engine::driveOut",
+            "Vehicle::transmission::driveIn",
+            "Vehicle::transmission::driveOutShaft",
+        ]
+        assert _names(index.find("drive?n")) == ["Vehicle::transmission::driveIn"]
+        assert _names(index.find("Vehicle::Engine::*")) == [
+            "Vehicle::Engine::driveOut",
+            "Vehicle::Engine::torqueMax",
+        ]
+        assert index.find("drivetrain") == []
+        assert _names(index.find("drivetrain", doc=True)) == ["Vehicle"]
+        assert _names(index.find("En")) == ["Vehicle::Engine"]
+
+
+def test_find_with_character_classes(tmp_path):
+    model = tmp_path / "vehicle.sysml"
+    model.write_text(_VEHICLE)
+
+    with NameIndex(tmp_path / "names.db") as index:
+        index.index_files([model])
+
+        assert _names(index.find("[cde]rive[!O]n")) == ["Vehicle::transmission::driveIn"]
+        assert _names(index.find("[!d]n*")) == ["Vehicle::Engine"]
+
+
+def test_find_ranks_before_limiting(tmp_path):
+    names = [f"motorControllerUnit{i}" for i in range(20)] + ["motorx"]
+    elements = [{"@id": f"e{i}", "name": name} for i, name in enumerate(names)]
+
+    with NameIndex(tmp_path / "names.db") as index:
+        index.index_elements(elements, "p@c1")
+
+        assert [m.name for m in index.find("motor", limit=1)] == ["motorx"]
+
+
+def test_index_is_incremental(tmp_path):
+    models = tmp_path / "models"
+    models.mkdir()
+    first = models / "a.sysml"
+    first.write_text("package A { part alpha; }")
+    second = models / "b.sysml"
+    second.write_text("package B { part beta; }")
+
+    with NameIndex(tmp_path / "names.db") as index:
+        index.index_directory(models)
+        assert index.index_directory(models).unchanged == 2
+
+        first.write_text("package A { part alphabet; }")
+        os.utime(first, ns=(0, 0))
+        second.unlink()
+        stats = index.index_directory(models)
+        assert (stats.indexed, stats.unchanged, stats.removed) == (1, 0, 1)
+        assert _names(index.find("alpha")) == ["A::alphabet"]
+        assert index.find("beta") == []
+
+
+def test_index_elements_and_fuzzy(tmp_path):
+    elements = [
+        {"@id": "e1", "@type": "PortUsage", "name": "driveOut", "qualifiedName": "V::driveOut"},
+        {"@id": "e2", "@type": "PartUsage", "name": "wheel", "qualifiedName": "V::wheel"},
+        {"@id": "e3", "@type": "Documentation", "body": "Torque output", "owner": {"@id": "e1"}},
+        {"@id": "e4", "@type": "FeatureMembership"},
+    ]
+    with NameIndex(tmp_path / "names.db") as index:
+        assert index.index_elements(elements, "p@c1", "c1").elements == 2
+        assert index.index_elements(elements, "p@c1", "c1").unchanged == 1
+
+        (match,) = index.find("torque", doc=True, source="p@")
+        assert (match.element_id, match.source) == ("e1", "p@c1")
+        best = index.find("drvieOut", fuzzy=True)[0]
+        assert best.name == "driveOut"
+        assert 0 < best.score < 1
+        assert index.find("wheel", source="other@") == []
+
+
+def test_find_command(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "sysml.toml").write_text("")
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "vehicle.sysml").write_text(_VEHICLE)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["find", "*driveOut*"])
+    assert result.exit_code == 0
+    assert "Vehicle::Engine::driveOut" in result.output
+    assert "vehicle.sysml:4" in result.output
+    assert (tmp_path / ".sysml" / "names.db").is_file()
+
+    result = runner.invoke(main, ["find", "nothing"])
+    assert result.exit_code == 1
+    assert "No matching elements" in result.output
+
+
+def test_find_project_uses_configured_urls(tmp_path, monkeypatch, stub_server):
+    elements = [{"@id": "e1", "@type": "PortUsage", "name": "driveOut", "qualifiedName": "V::d"}]
+    routes = {"/projects/p/commits": [{"@id": "c1"}], "/projects/p/commits/c1/elements": elements}
+    url = stub_server(lambda method, path, headers, body: (200, routes[path]))
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        down = f"http://127.0.0.1:{sock.getsockname()[1]}"
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "sysml.toml").write_text(f'[server]\nurls = ["{down}", "{url}"]\n')
+
+    result = CliRunner().invoke(main, ["find", "driveOut", "--project", "p"])
+
+    assert result.exit_code == 0, result.output
+    assert "V::d" in result.output
@@ -0,0 +1,70 @@
+"""Tests for Chrome trace-event tracing."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from sysml_v2 import tracing
+from sysml_v2.api.client import SysMLClient
+from sysml_v2.cli import main
+
+
+@pytest.fixture(autouse=True)
+def isolated_trace(monkeypatch):
+    """Start each test with tracing disabled and no recorded spans."""
+    monkeypatch.setattr(tracing, "_path", None)
+    monkeypatch.setattr(tracing, "_events", [])
+
+
+def test_disabled_spans_are_free():
+    assert not tracing.enabled()
+    with tracing.span("work", n=1) as s:
+        pass
+    assert s is None
+    assert tracing._events == []
+
+
+def test_nested_spans_written_as_trace_events(tmp_path):
+    out = tmp_path / "trace.json"
+    tracing.enable(out)
+    with tracing.span("outer"):
+        with tracing.span("inner", path="a.sysml"):
+            pass
+    with pytest.raises(ValueError), tracing.span("failing"):
+        raise ValueError
+    tracing.write()
+
+    data = json.loads(out.read_text())
+    events = {e["name"]: e for e in data["traceEvents"] if e["ph"] == "X"}
+    outer, inner = events["outer"], events["inner"]
+    assert inner["args"] == {"path": "a.sysml"}
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert events["failing"]["args"] == {"error": "ValueError"}
+
+
+def test_client_requests_traced(tmp_path, stub_server):
+    url = stub_server(lambda method, path, headers, body: (200, []))
+    tracing.enable(tmp_path / "trace.json")
+    with SysMLClient(url) as client:
+        client.list_projects()
+
+    (event,) = tracing._events
+    assert event["name"] == "GET /projects"
+    assert event["cat"] == "http"
+    assert event["args"]["status"] == 200
+
+
+def test_cli_trace_option(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "models").mkdir()
+    out = tmp_path / "trace.json"
+
+    result = CliRunner().invoke(main, ["--trace", str(out), "validate"])
+
+    assert result.exit_code == 0
+    names = [e["name"] for e in json.loads(out.read_text())["traceEvents"]]
+    assert "import" in names
+    assert "discover" in names
+    assert names[-1] == "sysml validate"